@@ -0,0 +1,105 @@
+import asyncio
+import random
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.events.market import NewMarketDataReceived
+from core.models.datasource_type import DataSourceType
+from core.models.entity.bar import Bar
+from core.models.entity.ohlcv import OHLCV
+from core.models.symbol import Symbol
+from core.models.timeframe import Timeframe
+from infrastructure.config import ConfigService
+
+CONFIG_PATH = "config.default.ini"
+
+TIMEFRAMES = list(Timeframe)
+
+
+def make_config(overrides: Optional[Dict] = None) -> ConfigService:
+    config_service = ConfigService()
+    config_service.load(config_path=CONFIG_PATH)
+    config_service.update({"store": {"base_dir": tempfile.mkdtemp(prefix="bench_")}})
+
+    if overrides:
+        config_service.update(overrides)
+
+    return config_service
+
+
+def make_symbol(name: str) -> Symbol:
+    return Symbol(name, 0.0006, 0.0001, 0.001, 0.01, 3, 2, 50)
+
+
+def make_keys(n: int) -> List[Tuple[Symbol, Timeframe]]:
+    return [
+        (make_symbol(f"SYM{i // len(TIMEFRAMES)}USDT"), TIMEFRAMES[i % len(TIMEFRAMES)])
+        for i in range(n)
+    ]
+
+
+def make_bar(timestamp: int, closed: bool = True) -> Bar:
+    price = 100.0 + random.random()
+    return Bar(OHLCV(timestamp, price, price + 1.0, price - 1.0, price, 10.0), closed)
+
+
+def make_market_events(
+    keys: List[Tuple[Symbol, Timeframe]], n: int, seed: int = 7
+) -> List[NewMarketDataReceived]:
+    rng = random.Random(seed)
+
+    return [
+        NewMarketDataReceived(
+            symbol,
+            timeframe,
+            DataSourceType.BYBIT,
+            make_bar(i, closed=True),
+        )
+        for i, (symbol, timeframe) in enumerate(rng.choice(keys) for _ in range(n))
+    ]
+
+
+async def cancel_pending() -> None:
+    asyncio.get_running_loop().set_exception_handler(lambda loop, context: None)
+    tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    for task in tasks:
+        task.cancel()
+
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def timed(fn: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def percentile(samples: List[float], q: float) -> float:
+    if not samples:
+        return 0.0
+
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, int(round(q / 100.0 * (len(ordered) - 1))))
+
+    return ordered[idx]
+
+
+def print_table(title: str, header: List[str], rows: List[List]) -> None:
+    widths = [
+        max(len(str(col)), *(len(_fmt(row[i])) for row in rows))
+        for i, col in enumerate(header)
+    ]
+
+    print(f"\n{title}")
+    print("  ".join(str(col).rjust(w) for col, w in zip(header, widths)))
+
+    for row in rows:
+        print("  ".join(_fmt(value).rjust(w) for value, w in zip(row, widths)))
+
+
+def _fmt(value) -> str:
+    if isinstance(value, float):
+        return f"{value:,.2f}"
+    return str(value)
@@ -0,0 +1,151 @@
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+
+import numpy as np
+
+TOTAL_TRADES_THRESHOLD = 3
+SMALL_NUMBER_THRESHOLD = np.finfo(float).eps
+
+
+@dataclass(frozen=True)
+class FullHistoryPerformance:
+    account_size: float
+    risk_per_trade: float
+    periods_per_year: float = 252
+    mar: float = 0.0
+    pnl: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    fee: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+
+    @property
+    def equity(self) -> np.ndarray:
+        return np.array([self.account_size]) + np.cumsum(self.pnl)
+
+    @cached_property
+    def total_trades(self) -> int:
+        return len(self.pnl)
+
+    @cached_property
+    def total_pnl(self) -> float:
+        return np.sum(self.pnl)
+
+    @cached_property
+    def total_fee(self) -> float:
+        return np.sum(self.fee)
+
+    @cached_property
+    def average_pnl(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        return np.mean(self.pnl)
+
+    @cached_property
+    def profit(self) -> np.ndarray:
+        return self.pnl[self.pnl > 0]
+
+    @cached_property
+    def hit_ratio(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        return np.sum(self.pnl > 0) / self.total_trades
+
+    @cached_property
+    def cagr(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        final_value = self.equity[-1]
+
+        if final_value == 0:
+            return -1.0
+
+        compound_factor = final_value / self.account_size
+        time_factor = 1 / max(self.total_trades / self.periods_per_year, 1)
+
+        return np.power(compound_factor, time_factor) - 1
+
+    @cached_property
+    def daily_returns(self) -> np.ndarray:
+        return self.pnl / self.account_size
+
+    @cached_property
+    def ann_volatility(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        return np.std(self.daily_returns, ddof=1) * np.sqrt(self.periods_per_year)
+
+    @cached_property
+    def expected_return(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        log_prod = np.sum(np.log(1.0 + self.profit))
+
+        return (
+            np.exp(log_prod / self.total_trades) - 1.0
+            if log_prod > SMALL_NUMBER_THRESHOLD
+            else 0.0
+        )
+
+    @cached_property
+    def information_ratio(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        return (
+            np.mean(self.daily_returns) / self.ann_volatility
+            if self.ann_volatility > SMALL_NUMBER_THRESHOLD
+            else 0.0
+        )
+
+    @cached_property
+    def smart_sharpe_ratio(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        x, y = self.pnl[:-1], self.pnl[1:]
+        coef = np.abs(np.corrcoef(x, y)[0, 1])
+        num = self.total_trades
+        corr = [((num - lag) / num) * coef**lag for lag in range(1, num)]
+
+        denom = np.std(self.pnl, ddof=1) * np.sqrt(1 + 2 * np.sum(corr))
+
+        return (
+            (self.average_pnl - self.mar) / denom
+            if denom > SMALL_NUMBER_THRESHOLD
+            else 0.0
+        )
+
+    @cached_property
+    def sortino_ratio(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        downside_risk = np.sqrt(self._lpm(2))
+
+        return (
+            (self.average_pnl - self.mar) / downside_risk
+            if downside_risk > SMALL_NUMBER_THRESHOLD
+            else 0.0
+        )
+
+    @cached_property
+    def omega_ratio(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        downside_risk = self._lpm(1)
+
+        return (
+            (self.average_pnl - self.mar) / downside_risk + 1.0
+            if downside_risk > SMALL_NUMBER_THRESHOLD
+            else 0.0
+        )
+
+    def next(self, pnl: float, fee: float) -> "FullHistoryPerformance":
+        return replace(self, pnl=np.append(self.pnl, pnl), fee=np.append(self.fee, fee))
+
+    def _lpm(self, order: int) -> float:
+        return np.mean(np.maximum(0, self.mar - self.pnl) ** order)
@@ -0,0 +1,135 @@
+import argparse
+import time
+import warnings
+from functools import partial
+
+import numpy as np
+
+from core.models.entity.portfolio import Performance
+
+from ._common import print_table
+from .performance import TOLERANCE, make_pnl, streaming
+
+EDGE_GAPS = [0.0, 1e-15, 1e-12, 1e-9, 1e-6, 1e-3, 0.5, 1.0]
+
+
+def reference(coef: float, num: int) -> float:
+    corr = [((num - x) / num) * coef**x for x in range(1, num)]
+
+    return np.sqrt(1 + 2 * np.sum(corr))
+
+
+def make_cases(cases: int, max_trades: int, seed: int = 3) -> tuple:
+    rng = np.random.default_rng(seed)
+    num = np.exp(rng.uniform(np.log(3), np.log(max_trades), cases)).astype(int)
+    coef = np.where(
+        rng.random(cases) < 0.5,
+        rng.random(cases),
+        1.0 - 10.0 ** -rng.uniform(0, 15, cases),
+    )
+
+    edges = [(1.0 - gap, n) for gap in EDGE_GAPS for n in (3, 4, 17, max_trades)]
+    coef = np.concatenate([coef, [c for c, _ in edges]])
+    num = np.concatenate([num, [n for _, n in edges]])
+
+    return coef, num
+
+
+def rel_error(a, b) -> float:
+    return float(np.max(np.abs(np.asarray(a) - b) / np.maximum(1.0, np.abs(b))))
+
+
+def properties(cases: int, max_trades: int) -> list:
+    coef, num = make_cases(cases, max_trades)
+    expected = np.array([reference(c, n) for c, n in zip(coef, num, strict=True)])
+
+    scalar = np.array(
+        [Performance._autocorr_penalty(c, n) for c, n in zip(coef, num, strict=True)]
+    )
+    vector = Performance._autocorr_penalty(coef, num)
+
+    width = int(num.max())
+    lags = np.arange(1, width, dtype=np.float64)
+    geometric = np.where(lags < num[:, None], coef[:, None] ** lags, 0.0)
+    lagged = Performance._lagged_penalty(geometric, num)
+
+    return [
+        [name, len(coef), error, error <= TOLERANCE]
+        for name, error in (
+            ("closed form, scalar", rel_error(scalar, expected)),
+            ("closed form, vectorized", rel_error(vector, expected)),
+            ("lagged model, geometric lags", rel_error(lagged, expected)),
+        )
+    ]
+
+
+def per_call(fn, repeat: int) -> float:
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        fn()
+
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def update_cost(performance: Performance, pnl: np.ndarray) -> float:
+    start = time.perf_counter()
+
+    for value in pnl:
+        performance = performance.next(value, abs(value) * 0.001)
+        _ = performance.smart_sharpe_ratio
+
+    return (time.perf_counter() - start) / len(pnl) * 1e6
+
+
+def timings(sizes: list, updates: int, lags: int) -> list:
+    rows = []
+
+    for n in sizes:
+        pnl = make_pnl(n + updates)
+        coef = 0.37
+
+        rows.append(
+            [
+                n,
+                per_call(partial(reference, coef, n), max(1, 200_000 // n)),
+                per_call(partial(Performance._autocorr_penalty, coef, n), 2_000),
+                update_cost(streaming(pnl[:n]), pnl[n:]),
+                update_cost(streaming(pnl[:n], _autocorr_lags=lags), pnl[n:]),
+            ]
+        )
+
+    return rows
+
+
+def main(cases: int, updates: int, lags: int):
+    sizes = [1_000, 10_000, 100_000]
+
+    print_table(
+        f"autocorrelation penalty vs list formula, relative tolerance {TOLERANCE:g}",
+        ["property", "cases", "rel error", "ok"],
+        properties(cases, sizes[-1] // 10),
+    )
+
+    print_table(
+        f"autocorrelation penalty cost, {updates} updates",
+        [
+            "trades",
+            "list formula us",
+            "closed form us",
+            "next + smart_sharpe us",
+            f"lags={lags} us",
+        ],
+        timings(sizes, updates, lags),
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cases", type=int, default=500)
+    parser.add_argument("--updates", type=int, default=100)
+    parser.add_argument("--lags", type=int, default=5)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore", RuntimeWarning)
+    main(args.cases, args.updates, args.lags)
@@ -0,0 +1,108 @@
+import argparse
+import asyncio
+import time
+from typing import Union
+
+from core.actors import FeedActor, StrategyActor
+from core.commands.market import IngestMarketData
+from core.events.market import NewMarketDataReceived
+from core.models.datasource_type import DataSourceType
+from infrastructure.event_dispatcher.event_dispatcher import EventDispatcher
+
+from ._common import cancel_pending, make_bar, make_config, make_keys, print_table
+
+
+class Producer(FeedActor):
+    async def on_receive(self, msg: IngestMarketData):
+        pass
+
+
+class Sink(StrategyActor):
+    def __init__(self, symbol, timeframe):
+        super().__init__(symbol, timeframe)
+        self.bars = 0
+        self.commands = 0
+
+    async def on_receive(self, event: Union[NewMarketDataReceived, IngestMarketData]):
+        if isinstance(event, IngestMarketData):
+            self.commands += 1
+        else:
+            self.bars += 1
+
+
+async def run_pages(producer, sink, pages: int, page_size: int, batched: bool):
+    dispatcher = EventDispatcher()
+    symbol, timeframe, datasource = (
+        producer.symbol,
+        producer.timeframe,
+        producer.datasource,
+    )
+    pages_data = []
+
+    for page in range(pages):
+        bars = [make_bar(page * page_size + i) for i in range(page_size)]
+        pages_data.append(
+            (
+                [IngestMarketData(symbol, timeframe, datasource, bar) for bar in bars],
+                [
+                    NewMarketDataReceived(symbol, timeframe, datasource, bar)
+                    for bar in bars
+                ],
+            )
+        )
+
+    start = time.perf_counter()
+
+    for commands, events in pages_data:
+        if batched:
+            await producer.ask_many(commands)
+            await producer.tell_many(events)
+        else:
+            await asyncio.gather(*(producer.ask(command) for command in commands))
+
+            for event in events:
+                await producer.tell(event)
+
+    await dispatcher.event_worker_pool.wait()
+
+    elapsed = time.perf_counter() - start
+    n = pages * page_size
+
+    return elapsed / n * 1e6, n / elapsed
+
+
+async def main(pages: int, page_size: int):
+    config = make_config()
+    EventDispatcher(config)
+
+    ((symbol, timeframe),) = make_keys(1)
+    producer = Producer(symbol, timeframe, DataSourceType.BYBIT)
+    sink = Sink(symbol, timeframe)
+    sink.start()
+
+    rows = []
+
+    for batched in (False, True):
+        us_per_bar, bars_per_sec = await run_pages(
+            producer, sink, pages, page_size, batched
+        )
+        rows.append(["batched" if batched else "per-bar", us_per_bar, bars_per_sec])
+
+    assert sink.bars == sink.commands == 2 * pages * page_size
+
+    print_table(
+        f"{pages} pages x {page_size} bars, ask IngestMarketData + tell NewMarketDataReceived",
+        ["mode", "us/bar", "bars/s"],
+        rows,
+    )
+
+    await cancel_pending()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=380)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.pages, args.page_size))
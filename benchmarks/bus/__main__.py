@@ -0,0 +1,159 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from benchmarks._common import print_table
+
+from .scenarios import SCENARIOS
+
+RESULTS_DIR = os.path.join("benchmarks", "results")
+
+
+def git_revision() -> str:
+    try:
+        revision = subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True
+        ).strip()
+        dirty = subprocess.call(["git", "diff", "--quiet", "HEAD"]) != 0
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+    return f"{revision}-dirty" if dirty else revision
+
+
+def run_one(scenario: str, loop: str, args) -> dict:
+    cmd = [
+        sys.executable,
+        "-m",
+        "benchmarks.bus.run_one",
+        "--scenario",
+        scenario,
+        "--loop",
+        loop,
+        "--messages",
+        str(args.messages),
+        "--actors",
+        str(args.actors),
+        "--concurrency",
+        str(args.concurrency),
+        "--burst",
+        str(args.burst),
+        "--bus",
+        args.bus,
+    ]
+
+    if args.tracemalloc:
+        cmd.append("--tracemalloc")
+
+    output = subprocess.check_output(cmd, text=True)
+
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def compare(results: list, baseline_path: str) -> None:
+    with open(baseline_path) as f:
+        baseline = {(r["scenario"], r["loop"]): r for r in json.load(f)["results"]}
+
+    rows = []
+
+    for result in results:
+        base = baseline.get((result["scenario"], result["loop"]))
+
+        if base is None:
+            continue
+
+        rows.append(
+            [
+                result["scenario"],
+                result["loop"],
+                _change(result["throughput"], base["throughput"]),
+                _change(result["p99_ms"], base["p99_ms"]),
+                _change(result["peak_rss_mb"], base["peak_rss_mb"]),
+            ]
+        )
+
+    print_table(
+        f"change vs {baseline_path}",
+        ["scenario", "loop", "throughput", "p99", "peak rss"],
+        rows,
+    )
+
+
+def _change(current: float, base: float) -> str:
+    if not base:
+        return "n/a"
+    return f"{(current - base) / base * 100:+.1f}%"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bus")
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=sorted(SCENARIOS), default=sorted(SCENARIOS)
+    )
+    parser.add_argument("--loops", nargs="+", default=["asyncio", "uvloop"])
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument("--actors", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--burst", type=int, default=64)
+    parser.add_argument("--bus", default="{}", help="JSON overrides for [bus]")
+    parser.add_argument("--tracemalloc", action="store_true")
+    parser.add_argument("--output")
+    parser.add_argument("--compare", help="previous results file")
+    args = parser.parse_args()
+
+    revision = git_revision()
+    results = []
+
+    for loop in args.loops:
+        for scenario in args.scenarios:
+            result = run_one(scenario, loop, args)
+            results.append({"scenario": scenario, "loop": loop, **result})
+
+    print_table(
+        f"event bus @ {revision}",
+        ["scenario", "loop", "msg/s", "p50 ms", "p99 ms", "p999 ms", "peak rss mb"],
+        [
+            [
+                r["scenario"],
+                r["loop"],
+                r["throughput"],
+                r["p50_ms"],
+                r["p99_ms"],
+                r["p999_ms"],
+                r["peak_rss_mb"],
+            ]
+            for r in results
+        ],
+    )
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"bus-{revision}-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+
+    with open(output, "w") as f:
+        json.dump(
+            {
+                "revision": revision,
+                "timestamp": time.time(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "params": vars(args),
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+
+    print(f"\nresults written to {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import bisect
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from core.actors import StrategyActor
+from core.events.market import NewMarketDataReceived
+from core.interfaces.abstract_timeseries import AbstractTimeSeriesService
+from core.models.entity.ohlcv import OHLCV
+from core.models.symbol import Symbol
+from core.models.timeframe import Timeframe
+
+
+class MemoryTimeSeries(AbstractTimeSeriesService):
+    def __init__(self):
+        self._bars: Dict[tuple, List[OHLCV]] = defaultdict(list)
+        self._stamps: Dict[tuple, List[int]] = defaultdict(list)
+
+    async def upsert(self, symbol: Symbol, timeframe: Timeframe, bar: OHLCV):
+        key = (symbol, timeframe)
+        stamps = self._stamps[key]
+        idx = bisect.bisect_left(stamps, bar.timestamp)
+
+        if idx < len(stamps) and stamps[idx] == bar.timestamp:
+            self._bars[key][idx] = bar
+        else:
+            stamps.insert(idx, bar.timestamp)
+            self._bars[key].insert(idx, bar)
+
+    async def next_bar(
+        self, symbol: Symbol, timeframe: Timeframe, bar: OHLCV
+    ) -> Optional[OHLCV]:
+        key = (symbol, timeframe)
+        idx = bisect.bisect_right(self._stamps[key], bar.timestamp)
+        bars = self._bars[key]
+        return bars[idx] if idx < len(bars) else None
+
+    async def prev_bar(
+        self, symbol: Symbol, timeframe: Timeframe, bar: OHLCV
+    ) -> Optional[OHLCV]:
+        key = (symbol, timeframe)
+        idx = bisect.bisect_left(self._stamps[key], bar.timestamp)
+        return self._bars[key][idx - 1] if idx > 0 else None
+
+    async def back_n_bars(
+        self, symbol: Symbol, timeframe: Timeframe, bar: OHLCV, n: int
+    ) -> List[OHLCV]:
+        key = (symbol, timeframe)
+        idx = bisect.bisect_right(self._stamps[key], bar.timestamp)
+        return self._bars[key][max(0, idx - n) : idx]
+
+    async def ta(self, symbol: Symbol, timeframe: Timeframe, bar: OHLCV):
+        return None
+
+
+class LatencyProbe:
+    def __init__(self):
+        self.sent: Dict[str, float] = {}
+        self.latencies: List[float] = []
+
+    def mark(self, key: str) -> None:
+        self.sent[key] = time.perf_counter()
+
+    def observe(self, key: str) -> None:
+        sent = self.sent.pop(key, None)
+
+        if sent is not None:
+            self.latencies.append(time.perf_counter() - sent)
+
+
+class BarProbeActor(StrategyActor):
+    def __init__(self, symbol: Symbol, timeframe: Timeframe, probe: LatencyProbe):
+        super().__init__(symbol, timeframe)
+        self.probe = probe
+
+    async def on_receive(self, event: NewMarketDataReceived):
+        self.probe.observe(event.meta.key)
@@ -0,0 +1,75 @@
+import argparse
+import asyncio
+import json
+import resource
+import sys
+import time
+import tracemalloc
+
+from benchmarks._common import cancel_pending, make_config
+from infrastructure.event_dispatcher.event_dispatcher import EventDispatcher
+
+from .scenarios import SCENARIOS, summarize
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / (1 << 10)
+
+
+async def run(args) -> dict:
+    dispatcher = EventDispatcher(make_config({"bus": json.loads(args.bus)}))
+    params = {
+        "messages": args.messages,
+        "actors": args.actors,
+        "concurrency": args.concurrency,
+        "burst": args.burst,
+    }
+
+    rss_before = peak_rss_mb()
+
+    if args.tracemalloc:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    latencies = await SCENARIOS[args.scenario](dispatcher, params)
+    elapsed = time.perf_counter() - start
+
+    result = summarize(latencies, elapsed)
+    result["peak_rss_mb"] = peak_rss_mb()
+    result["rss_growth_mb"] = result["peak_rss_mb"] - rss_before
+
+    if args.tracemalloc:
+        result["traced_peak_mb"] = tracemalloc.get_traced_memory()[1] / (1 << 20)
+        tracemalloc.stop()
+
+    await cancel_pending()
+
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), required=True)
+    parser.add_argument("--loop", choices=["asyncio", "uvloop"], default="asyncio")
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument("--actors", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--burst", type=int, default=64)
+    parser.add_argument("--bus", default="{}")
+    parser.add_argument("--tracemalloc", action="store_true")
+    args = parser.parse_args()
+
+    if args.loop == "uvloop":
+        import uvloop
+
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            result = runner.run(run(args))
+    else:
+        result = asyncio.run(run(args))
+
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import asyncio
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks._common import make_bar, make_keys, percentile
+from core.commands.market import IngestMarketData
+from core.events.market import NewMarketDataReceived
+from core.models.datasource_type import DataSourceType
+from core.queries.ohlcv import BackNBars
+from infrastructure.event_dispatcher.event_dispatcher import EventDispatcher
+from market import MarketActor
+
+from .actors import BarProbeActor, LatencyProbe, MemoryTimeSeries
+
+Scenario = Callable[[EventDispatcher, Dict[str, Any]], Any]
+
+
+async def bars(dispatcher: EventDispatcher, params: Dict[str, Any]) -> List[float]:
+    keys = make_keys(params["actors"])
+    probe = LatencyProbe()
+    actors = [BarProbeActor(symbol, timeframe, probe) for symbol, timeframe in keys]
+
+    for actor in actors:
+        actor.start()
+
+    for i in range(params["messages"]):
+        symbol, timeframe = keys[i % len(keys)]
+        event = NewMarketDataReceived(
+            symbol, timeframe, DataSourceType.BYBIT, make_bar(i, closed=i % 4 == 0)
+        )
+        probe.mark(event.meta.key)
+        await dispatcher.dispatch(event)
+
+        if i % params["burst"] == params["burst"] - 1:
+            await asyncio.sleep(0)
+
+    await dispatcher.event_worker_pool.wait()
+
+    return probe.latencies
+
+
+async def commands(dispatcher: EventDispatcher, params: Dict[str, Any]) -> List[float]:
+    MarketActor(MemoryTimeSeries()).start()
+    keys = make_keys(params["actors"])
+
+    async def ingest(i: int) -> float:
+        symbol, timeframe = keys[i % len(keys)]
+        start = time.perf_counter()
+        await dispatcher.execute(
+            IngestMarketData(symbol, timeframe, DataSourceType.BYBIT, make_bar(i))
+        )
+        return time.perf_counter() - start
+
+    return await _concurrently(ingest, params["messages"], params["concurrency"])
+
+
+async def queries(dispatcher: EventDispatcher, params: Dict[str, Any]) -> List[float]:
+    ts = MemoryTimeSeries()
+    MarketActor(ts).start()
+    keys = make_keys(params["actors"])
+
+    for symbol, timeframe in keys:
+        for i in range(64):
+            await ts.upsert(symbol, timeframe, make_bar(i).ohlcv)
+
+    async def back_n_bars(i: int) -> float:
+        symbol, timeframe = keys[i % len(keys)]
+        start = time.perf_counter()
+        await dispatcher.query(
+            BackNBars(symbol, timeframe, make_bar(32 + i % 32).ohlcv, 16)
+        )
+        return time.perf_counter() - start
+
+    return await _concurrently(back_n_bars, params["messages"], params["concurrency"])
+
+
+async def _concurrently(fn, n: int, concurrency: int) -> List[float]:
+    latencies = []
+
+    for start in range(0, n, concurrency):
+        latencies.extend(
+            await asyncio.gather(
+                *(fn(i) for i in range(start, min(n, start + concurrency)))
+            )
+        )
+
+    return latencies
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "bars": bars,
+    "commands": commands,
+    "queries": queries,
+}
+
+
+def summarize(latencies: List[float], elapsed: float) -> Dict[str, float]:
+    return {
+        "messages": len(latencies),
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1e3,
+        "p99_ms": percentile(latencies, 99) * 1e3,
+        "p999_ms": percentile(latencies, 99.9) * 1e3,
+    }
@@ -0,0 +1,129 @@
+import argparse
+import asyncio
+import hashlib
+import random
+import time
+import uuid
+
+from cachetools import TTLCache
+
+from core.events.meta import EventMeta
+from infrastructure.event_dispatcher.event_dedup import EventDedup
+
+from ._common import print_table
+
+
+class LegacyEventDedup:
+    def __init__(self, ttl: int = 30, maxsize: int = 2048, timer=time.monotonic):
+        self._caches = [
+            TTLCache(maxsize=maxsize // 4, ttl=ttl, timer=timer) for _ in range(4)
+        ]
+        self._locks = [asyncio.Lock() for _ in range(4)]
+
+    def _get_shard(self, key: str):
+        shard_index = int(hashlib.sha256(key.encode()).hexdigest(), 16) % len(
+            self._caches
+        )
+        return self._caches[shard_index], self._locks[shard_index]
+
+    async def acquire(self, event) -> bool:
+        key = event.meta.key
+        shard, lock = self._get_shard(key)
+
+        async with lock:
+            if key in shard:
+                return False
+
+            shard[key] = True
+
+            return True
+
+
+class Message:
+    __slots__ = ("meta",)
+
+    def __init__(self, meta: EventMeta):
+        self.meta = meta
+
+
+class NoopDedup:
+    def __init__(self, **_kwargs):
+        pass
+
+    async def acquire(self, event) -> bool:
+        return True
+
+
+class SimulatedClock:
+    def __init__(self, rate: float):
+        self.now = 0.0
+        self.step = 1.0 / rate
+
+    def __call__(self) -> float:
+        return self.now
+
+    def tick(self) -> None:
+        self.now += self.step
+
+
+def make_messages(n: int, duplicate_ratio: float, seed: int = 5):
+    rng = random.Random(seed)
+    keys = []
+
+    for _ in range(n):
+        if keys and rng.random() < duplicate_ratio:
+            keys.append(keys[-rng.randint(1, min(len(keys), 64))])
+        else:
+            keys.append(str(uuid.UUID(int=rng.getrandbits(128))))
+
+    return [Message(EventMeta(key=key)) for key in keys]
+
+
+async def run(dedup, clock: SimulatedClock, messages) -> tuple:
+    accepted = 0
+
+    start = time.process_time()
+
+    for message in messages:
+        clock.tick()
+
+        if await dedup.acquire(message):
+            accepted += 1
+
+    elapsed = time.process_time() - start
+
+    return elapsed / len(messages) * 1e9, accepted
+
+
+async def main(n_events: int, rate: float, ttl: int, maxsize: int, duplicates: float):
+    messages = make_messages(n_events, duplicates)
+    rows = []
+
+    for name, factory in (
+        ("harness only", NoopDedup),
+        ("sha256 + TTLCache + locks", LegacyEventDedup),
+        ("dict + timing wheel", EventDedup),
+    ):
+        clock = SimulatedClock(rate)
+        ns_per_event, accepted = await run(
+            factory(ttl=ttl, maxsize=maxsize, timer=clock), clock, messages
+        )
+        rows.append([name, ns_per_event, accepted])
+
+    print_table(
+        f"{n_events} acquires at {rate:,.0f} ev/s simulated, ttl={ttl}s, maxsize={maxsize}",
+        ["dedup", "cpu ns/event", "accepted"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=500_000)
+    parser.add_argument("--rate", type=float, default=100_000)
+    parser.add_argument("--ttl", type=int, default=30)
+    parser.add_argument("--maxsize", type=int, default=2048)
+    parser.add_argument("--duplicates", type=float, default=0.01)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.events, args.rate, args.ttl, args.maxsize, args.duplicates))
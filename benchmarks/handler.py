@@ -0,0 +1,87 @@
+import argparse
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+
+from core.events._base import Event
+from core.events.meta import EventMeta
+from infrastructure.event_dispatcher.event_handler import EventHandler
+
+from ._common import print_table
+
+
+@dataclass(frozen=True)
+class Ping(Event):
+    meta: EventMeta = field(default_factory=EventMeta)
+
+
+@dataclass(frozen=True)
+class Stall(Event):
+    meta: EventMeta = field(default_factory=EventMeta)
+
+
+class LegacyEventHandler(EventHandler):
+    async def _execute_with_deadline(self, handler, event, *args, **kwargs):
+        return await asyncio.wait_for(
+            self._execute_handler(handler, event, *args, **kwargs),
+            timeout=self.timeout,
+        )
+
+
+async def noop(event):
+    pass
+
+
+async def stall(event):
+    await asyncio.sleep(1)
+
+
+async def run_calls(handler: EventHandler, n: int) -> float:
+    handler.register(Ping, noop)
+    events = [Ping() for _ in range(n)]
+
+    start = time.perf_counter()
+
+    for event in events:
+        await handler.handle_event(event)
+
+    return (time.perf_counter() - start) / n * 1e9
+
+
+async def run_timeouts(handler: EventHandler, n: int) -> tuple:
+    handler.register(Stall, stall)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(handler.handle_event(Stall()) for _ in range(n)))
+
+    return len(handler.dlq), time.perf_counter() - start
+
+
+async def main(n: int, stalls: int, timeout: float):
+    rows = []
+
+    for name, factory in (
+        ("wait_for per call", LegacyEventHandler),
+        ("shared deadline watchdog", EventHandler),
+    ):
+        ns_per_call = await run_calls(factory(timeout=timeout), n)
+        timed_out, elapsed = await run_timeouts(factory(timeout=timeout), stalls)
+        rows.append([name, ns_per_call, timed_out, elapsed])
+
+    print_table(
+        f"{n} trivial handler calls, {stalls} stalled handlers with timeout={timeout}s",
+        ["timeout mechanism", "ns/call", "timed out", "stall wall s"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--stalls", type=int, default=50)
+    parser.add_argument("--timeout", type=float, default=0.2)
+    args = parser.parse_args()
+
+    logging.disable(logging.ERROR)
+    asyncio.run(main(args.calls, args.stalls, args.timeout))
@@ -0,0 +1,106 @@
+import argparse
+import json
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+
+from core.events._base import Event
+from core.events.market import NewMarketDataReceived
+from core.events.meta import EventMeta, use_compact_meta
+from core.groups.event import EventGroup
+from core.models.datasource_type import DataSourceType
+from infrastructure.event_store.event_encoder import Encoder
+
+from ._common import make_bar, make_keys, print_table
+
+
+@dataclass
+class LegacyEventMeta:
+    key: str = field(default_factory=lambda: str(uuid.uuid4()))
+    timestamp: int = field(default_factory=lambda: datetime.now().timestamp())
+    priority: int = field(default_factory=lambda: 0)
+    version: int = field(default_factory=lambda: 1)
+    group: EventGroup = field(default_factory=lambda: EventGroup.service)
+
+
+def legacy_to_dict(self):
+    res = asdict(self)
+    res["meta"]["name"] = self.__class__.__name__
+    return res
+
+
+@contextmanager
+def compact(enabled: bool):
+    use_compact_meta(enabled)
+
+    try:
+        yield
+    finally:
+        use_compact_meta(False)
+
+
+@contextmanager
+def legacy_serialization():
+    to_dict = Event.to_dict
+    Event.to_dict = legacy_to_dict
+
+    try:
+        yield
+    finally:
+        Event.to_dict = to_dict
+
+
+def per_op(fn, n: int) -> float:
+    start = time.perf_counter()
+
+    for _ in range(n):
+        fn()
+
+    return (time.perf_counter() - start) / n * 1e9
+
+
+def main(n: int):
+    symbol, timeframe = make_keys(1)[0]
+    bar = make_bar(0)
+
+    def create():
+        return NewMarketDataReceived(symbol, timeframe, DataSourceType.BYBIT, bar)
+
+    rows = [["EventMeta", "dataclass + uuid4 + datetime", per_op(LegacyEventMeta, n)]]
+
+    with compact(False):
+        rows.append(["EventMeta", "slots + uuid4 + datetime", per_op(EventMeta, n)])
+        rows.append(["NewMarketDataReceived", "uuid4 + datetime", per_op(create, n)])
+
+    with compact(True):
+        rows.append(["EventMeta", "slots + counter + monotonic", per_op(EventMeta, n)])
+        rows.append(["NewMarketDataReceived", "counter + monotonic", per_op(create, n)])
+        keys = {create().meta.key for _ in range(n)}
+
+    event = create()
+
+    def serialize():
+        return json.dumps(event, cls=Encoder)
+
+    with legacy_serialization():
+        legacy = serialize()
+        rows.append(["json.dumps(event)", "asdict to_dict", per_op(serialize, n)])
+
+    rows.append(["json.dumps(event)", "shallow to_dict", per_op(serialize, n)])
+
+    print_table(
+        f"{n} ops per row, {len(keys)}/{n} unique compact keys, "
+        f"payload identical: {json.loads(legacy) == json.loads(serialize())}",
+        ["operation", "mode", "ns/op"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ops", type=int, default=100_000)
+    args = parser.parse_args()
+
+    main(args.ops)
@@ -0,0 +1,136 @@
+import argparse
+import json
+import os
+import time
+import warnings
+from functools import cached_property
+
+import numpy as np
+
+from core.models.entity.portfolio import Performance
+
+from ._common import print_table
+from ._legacy_performance import FullHistoryPerformance
+
+EXPECTED_PATH = os.path.join(os.path.dirname(__file__), "performance_expected.json")
+
+ACCOUNT_SIZE = 1000.0
+RISK_PER_TRADE = 0.0001
+TOLERANCE = 1e-9
+LOGGED = [
+    "total_trades",
+    "hit_ratio",
+    "information_ratio",
+    "cagr",
+    "expected_return",
+    "ann_volatility",
+    "smart_sharpe_ratio",
+    "sortino_ratio",
+    "omega_ratio",
+    "total_pnl",
+    "total_fee",
+]
+METRICS = [
+    name
+    for name, value in vars(Performance).items()
+    if isinstance(value, cached_property)
+]
+
+
+def make_pnl(n: int, seed: int = 7) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.normal(0.2, 3.0, n) + 0.3 * np.sin(np.arange(n) / 7)
+
+
+def streaming(pnl: np.ndarray, **kwargs) -> Performance:
+    performance = Performance(ACCOUNT_SIZE, RISK_PER_TRADE, **kwargs)
+
+    for value in pnl:
+        performance = performance.next(value, abs(value) * 0.001)
+
+    return performance
+
+
+def full_history(pnl: np.ndarray) -> FullHistoryPerformance:
+    return FullHistoryPerformance(
+        ACCOUNT_SIZE,
+        RISK_PER_TRADE,
+        pnl=np.array(pnl, dtype=np.float64),
+        fee=np.abs(pnl) * 0.001,
+    )
+
+
+def rel_error(a, b) -> float:
+    a, b = np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64)
+    both_nan = np.isnan(a) & np.isnan(b)
+    error = np.abs(a - b) / np.maximum(1.0, np.abs(b))
+
+    return float(np.max(np.where(both_nan, 0.0, error), initial=0.0))
+
+
+def parity(expected: dict) -> list:
+    rows = []
+
+    for n, reference in sorted(expected.items(), key=lambda item: int(item[0])):
+        current = streaming(make_pnl(int(n)))
+        errors = {
+            name: rel_error(getattr(current, name), value)
+            for name, value in reference.items()
+        }
+        worst = max(errors, key=errors.get)
+
+        rows.append([n, worst, errors[worst], errors[worst] <= TOLERANCE])
+
+    return rows
+
+
+def update_cost(factory, n: int, updates: int) -> float:
+    pnl = make_pnl(n + updates)
+    performance = factory(pnl[:n])
+
+    start = time.perf_counter()
+
+    for value in pnl[n:]:
+        performance = performance.next(value, abs(value) * 0.001)
+
+        for name in LOGGED:
+            getattr(performance, name)
+
+    return (time.perf_counter() - start) / updates * 1e6
+
+
+def main(trades: int, updates: int):
+    with open(EXPECTED_PATH) as f:
+        expected = json.load(f)
+
+    sizes = [100, 1000, trades]
+
+    print_table(
+        f"streaming vs recorded full-history metrics, relative tolerance {TOLERANCE:g}",
+        ["trades", "worst metric", "rel error", "ok"],
+        parity(expected),
+    )
+
+    rows = [
+        [name, *(update_cost(factory, n, updates) for n in sizes)]
+        for name, factory in (
+            ("np.append + recompute", full_history),
+            ("streaming accumulator", streaming),
+        )
+    ]
+
+    print_table(
+        f"cost of one closed trade (next + logged metrics), {updates} updates",
+        ["performance", *(f"us @{n}" for n in sizes)],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trades", type=int, default=10_000)
+    parser.add_argument("--updates", type=int, default=200)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore", RuntimeWarning)
+    main(args.trades, args.updates)
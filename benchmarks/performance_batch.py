@@ -0,0 +1,108 @@
+import argparse
+import time
+import warnings
+from functools import cached_property
+
+import numpy as np
+
+from core.models.entity.performance_batch import PerformanceBatch
+
+from ._common import print_table
+from .performance import TOLERANCE, make_pnl, rel_error, streaming
+
+METRICS = [
+    name
+    for name, value in vars(PerformanceBatch).items()
+    if isinstance(value, cached_property) and not name.startswith("_")
+]
+
+
+def make_population(size: int, trades: int, seed: int = 11) -> list:
+    rng = np.random.default_rng(seed)
+
+    return [
+        streaming(make_pnl(int(n), seed=seed + idx))
+        for idx, n in enumerate(rng.integers(0, trades, size))
+    ]
+
+
+def fresh(population: list) -> list:
+    return [performance.next(0.0, 0.0) for performance in population]
+
+
+def per_individual(population: list, metrics: list) -> float:
+    population = fresh(population)
+    start = time.perf_counter()
+
+    for performance in population:
+        for name in metrics:
+            getattr(performance, name)
+
+    return time.perf_counter() - start
+
+
+def batched(population: list, metrics: list) -> float:
+    population = fresh(population)
+    start = time.perf_counter()
+
+    batch = PerformanceBatch.from_performances(population)
+
+    for name in metrics:
+        getattr(batch, name)
+
+    return time.perf_counter() - start
+
+
+def parity(population: list) -> list:
+    batch = PerformanceBatch.from_performances(population)
+
+    return [
+        [
+            name,
+            error := rel_error(
+                getattr(batch, name),
+                [getattr(performance, name) for performance in population],
+            ),
+            error <= TOLERANCE,
+        ]
+        for name in METRICS
+    ]
+
+
+def main(size: int, trades: int):
+    population = make_population(size, trades)
+
+    print_table(
+        f"batch vs per-individual metrics, {size} individuals, "
+        f"relative tolerance {TOLERANCE:g}",
+        ["metric", "rel error", "ok"],
+        parity(population),
+    )
+
+    rows = [
+        [
+            label,
+            per_individual(population, metrics) * 1e3,
+            batched(population, metrics) * 1e3,
+        ]
+        for label, metrics in (
+            ("deflated_sharpe_ratio", ["deflated_sharpe_ratio"]),
+            ("full metric set", METRICS),
+        )
+    ]
+
+    print_table(
+        f"population evaluation, {size} individuals, up to {trades} trades each",
+        ["metrics", "per individual ms", "batch ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--population", type=int, default=200)
+    parser.add_argument("--trades", type=int, default=1_000)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore", RuntimeWarning)
+    main(args.population, args.trades)
@@ -0,0 +1,116 @@
+import argparse
+import time
+import warnings
+from functools import cached_property
+
+import numpy as np
+
+from core.models.entity.portfolio import RollingPerformance
+from core.models.entity.window import RollingWindow
+
+from ._common import print_table
+from .performance import TOLERANCE, make_pnl, rel_error, streaming
+
+METRICS = [
+    name
+    for name, value in vars(RollingPerformance).items()
+    if isinstance(value, cached_property)
+]
+
+
+def fill(window: RollingWindow, pnl: np.ndarray, timestamps: np.ndarray):
+    for value, timestamp in zip(pnl, timestamps):
+        window.push(value, abs(value) * 0.001, timestamp)
+
+    return window
+
+
+def make_timestamps(n: int, seed: int = 5) -> np.ndarray:
+    return np.cumsum(np.random.default_rng(seed).exponential(60.0, n))
+
+
+def parity(trades: int, sizes: list, duration: float) -> list:
+    pnl, timestamps = make_pnl(trades), make_timestamps(trades)
+    rows = []
+
+    for size in sizes:
+        for seconds in (0.0, duration):
+            window = fill(RollingWindow(size, seconds), pnl, timestamps)
+            reference = streaming(pnl[-window.count :])
+            current = RollingPerformance.from_window(window)
+
+            errors = {
+                name: rel_error(getattr(current, name), getattr(reference, name))
+                for name in METRICS
+            }
+            worst = max(errors, key=errors.get)
+
+            rows.append(
+                [
+                    size,
+                    seconds,
+                    window.count,
+                    worst,
+                    errors[worst],
+                    errors[worst] <= TOLERANCE,
+                ]
+            )
+
+    return rows
+
+
+def update_cost(size: int, updates: int) -> list:
+    pnl, timestamps = make_pnl(size + updates), make_timestamps(size + updates)
+    window = fill(RollingWindow(size), pnl[:size], timestamps[:size])
+
+    start = time.perf_counter()
+
+    for value, timestamp in zip(pnl[size:], timestamps[size:]):
+        window.push(value, abs(value) * 0.001, timestamp)
+        rolling = RollingPerformance.from_window(window)
+
+        for name in METRICS:
+            getattr(rolling, name)
+
+    incremental = (time.perf_counter() - start) / updates * 1e6
+
+    start = time.perf_counter()
+
+    for end in range(size, size + min(updates, 20)):
+        recomputed = streaming(pnl[end - size + 1 : end + 1])
+
+        for name in METRICS:
+            getattr(recomputed, name)
+
+    recompute = (time.perf_counter() - start) / min(updates, 20) * 1e6
+    memory = window.pnl.nbytes + window.fee.nbytes + window.timestamp.nbytes
+
+    return [size, incremental, recompute, memory]
+
+
+def main(trades: int, updates: int, duration: float):
+    sizes = [100, 1_000]
+
+    print_table(
+        f"rolling window vs metrics over the same trades, {trades} pushes, "
+        f"relative tolerance {TOLERANCE:g}",
+        ["trades", "seconds", "in window", "worst metric", "rel error", "ok"],
+        parity(trades, sizes, duration),
+    )
+
+    print_table(
+        f"cost of one closed trade on a full window, {updates} updates",
+        ["window", "ring buffer us", "recompute us", "bytes"],
+        [update_cost(size, updates) for size in sizes],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trades", type=int, default=100_000)
+    parser.add_argument("--updates", type=int, default=1_000)
+    parser.add_argument("--seconds", type=float, default=3_600.0)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore", RuntimeWarning)
+    main(args.trades, args.updates, args.seconds)
@@ -0,0 +1,84 @@
+import argparse
+import asyncio
+import time
+
+from core.actors import StrategyActor
+from core.events.market import NewMarketDataReceived
+from infrastructure.event_dispatcher.event_dispatcher import EventDispatcher
+
+from ._common import (
+    cancel_pending,
+    make_config,
+    make_keys,
+    make_market_events,
+    print_table,
+)
+
+
+class RoutedActor(StrategyActor):
+    def __init__(self, symbol, timeframe):
+        super().__init__(symbol, timeframe)
+        self.received = 0
+
+    async def on_receive(self, event: NewMarketDataReceived):
+        self.received += 1
+
+
+class BroadcastActor(RoutedActor):
+    @property
+    def route(self):
+        return None
+
+
+async def run(actor_cls, n_actors: int, n_events: int) -> float:
+    dispatcher = EventDispatcher()
+    keys = make_keys(n_actors)
+    actors = [actor_cls(symbol, timeframe) for symbol, timeframe in keys]
+
+    for actor in actors:
+        actor.start()
+
+    events = make_market_events(keys, n_events)
+    handle_event = dispatcher._event_handler.handle_event
+
+    start = time.perf_counter()
+
+    for event in events:
+        await handle_event(event)
+
+    elapsed = time.perf_counter() - start
+
+    for actor in actors:
+        actor.stop()
+
+    assert sum(actor.received for actor in actors) == n_events
+
+    return n_events / elapsed
+
+
+async def main(actor_counts, n_events: int):
+    EventDispatcher(make_config())
+
+    rows = []
+
+    for n_actors in actor_counts:
+        broadcast = await run(BroadcastActor, n_actors, n_events)
+        routed = await run(RoutedActor, n_actors, n_events)
+        rows.append([n_actors, broadcast, routed, routed / broadcast])
+
+    print_table(
+        f"handle_event throughput, {n_events} NewMarketDataReceived events",
+        ["actors", "broadcast ev/s", "routed ev/s", "speedup"],
+        rows,
+    )
+
+    await cancel_pending()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--actors", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--events", type=int, default=5000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.actors, args.events))
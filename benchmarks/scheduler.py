@@ -0,0 +1,114 @@
+import argparse
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+
+from core.events._base import Event
+from core.events.meta import EventMeta
+from infrastructure.event_dispatcher.event_handler import EventHandler
+from infrastructure.event_dispatcher.scheduler import SCHEDULERS, create_scheduler
+from infrastructure.event_dispatcher.worker_pool import WorkerPool
+
+from ._common import cancel_pending, percentile, print_table
+
+
+@dataclass(frozen=True)
+class Ping(Event):
+    sent: float
+    work: float
+
+
+def make_pings(n: int, num_groups: int, seed: int = 11):
+    rng = random.Random(seed)
+
+    return [
+        (rng.randint(1, num_groups), 0.0002 if rng.random() < 0.05 else 0.0)
+        for _ in range(n)
+    ]
+
+
+async def run(
+    name: str, specs, num_workers: int, num_groups: int, burst: int, pools: list
+):
+    delays = []
+    handler = EventHandler(timeout=10)
+    loop = asyncio.get_running_loop()
+
+    async def on_ping(event: Ping):
+        delays.append(loop.time() - event.sent)
+
+        if event.work:
+            deadline = time.perf_counter() + event.work
+            while time.perf_counter() < deadline:
+                pass
+
+    handler.register(Ping, on_ping)
+
+    pool = WorkerPool(
+        num_workers,
+        num_groups,
+        handler,
+        asyncio.Event(),
+        create_scheduler(name, num_groups),
+    )
+    scheduler = pool.scheduler
+    pools.append(pool)
+
+    select_time = 0.0
+    dispatch_time = 0.0
+
+    for i, (priority, work) in enumerate(specs):
+        event = Ping(EventMeta(priority=priority), loop.time(), work)
+
+        start = time.perf_counter()
+        group = scheduler.determine_priority_group(priority)
+        scheduler.choose_worker(group, pool.groups[group])
+        select_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        await pool.dispatch_to_worker(event)
+        dispatch_time += time.perf_counter() - start
+
+        if i % burst == burst - 1:
+            await asyncio.sleep(0)
+
+    await pool.wait()
+
+    n = len(specs)
+
+    return [
+        name,
+        select_time / n * 1e6,
+        dispatch_time / n * 1e6,
+        percentile(delays, 50) * 1e3,
+        percentile(delays, 99) * 1e3,
+    ]
+
+
+async def main(n_events: int, num_workers: int, num_groups: int, burst: int):
+    specs = make_pings(n_events, num_groups)
+    pools = []
+    rows = [
+        await run(name, specs, num_workers, num_groups, burst, pools)
+        for name in SCHEDULERS
+    ]
+
+    print_table(
+        f"{n_events} events, {num_groups} groups x {num_workers} workers, bursts of {burst}",
+        ["scheduler", "select us/ev", "dispatch us/ev", "p50 wait ms", "p99 wait ms"],
+        rows,
+    )
+
+    await cancel_pending()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--workers", type=int, default=5)
+    parser.add_argument("--groups", type=int, default=13)
+    parser.add_argument("--burst", type=int, default=64)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.events, args.workers, args.groups, args.burst))
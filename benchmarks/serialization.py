@@ -0,0 +1,105 @@
+import argparse
+import time
+import warnings
+from dataclasses import dataclass, fields
+from enum import Enum
+from functools import cached_property
+
+from core.events.portfolio import PortfolioPerformanceUpdated
+from core.models.timeframe import Timeframe
+from infrastructure.event_store.event_encoder import encode
+
+from ._common import make_symbol, print_table
+from .performance import make_pnl, streaming
+
+STRATEGY = "_SGNLBENCH:1_CNFRMBENCH:2_PLSBENCH:3_BSLNBENCH:4"
+
+
+def reflective_to_dict(entity) -> dict:
+    field_dict = {f.name: getattr(entity, f.name) for f in fields(entity)}
+    property_dict = {
+        k: getattr(entity, k)
+        for k in dir(entity)
+        if isinstance(getattr(entity.__class__, k, None), (property, cached_property))
+        and hasattr(entity, k)
+    }
+
+    result = {**field_dict, **property_dict}
+
+    for key, value in result.items():
+        if hasattr(value, "to_dict") and callable(value.to_dict):
+            result[key] = value.to_dict()
+        elif isinstance(value, Enum):
+            result[key] = str(value)
+
+    return result
+
+
+@dataclass(frozen=True)
+class ReflectiveUpdated(PortfolioPerformanceUpdated):
+    def to_dict(self):
+        return {
+            **super().to_dict(),
+            "performance": reflective_to_dict(self.performance),
+        }
+
+
+@dataclass(frozen=True)
+class FullUpdated(PortfolioPerformanceUpdated):
+    def to_dict(self):
+        return {**super().to_dict(), "performance": self.performance.to_dict("full")}
+
+
+@dataclass(frozen=True)
+class RawUpdated(PortfolioPerformanceUpdated):
+    def to_dict(self):
+        return {
+            **super().to_dict(),
+            "performance": {
+                f.name: getattr(self.performance, f.name)
+                for f in fields(self.performance)
+            },
+        }
+
+
+def write_cost(event_type, trades: int, updates: int) -> tuple:
+    symbol, timeframe = make_symbol("BENCHUSDT"), Timeframe.ONE_MINUTE
+    pnl = make_pnl(trades + updates)
+    performance = streaming(pnl[:trades])
+    size = 0
+
+    start = time.perf_counter()
+
+    for value in pnl[trades:]:
+        performance = performance.next(value, abs(value) * 0.001)
+        size += len(encode(event_type(symbol, timeframe, STRATEGY, performance)))
+
+    return (time.perf_counter() - start) / updates * 1e6, size // updates
+
+
+def main(updates: int):
+    rows = []
+
+    for trades in (100, 1_000, 10_000):
+        for label, event_type in (
+            ("reflective, all properties", ReflectiveUpdated),
+            ("compiled, full", FullUpdated),
+            ("compiled, core", PortfolioPerformanceUpdated),
+            ("raw dataclass fields", RawUpdated),
+        ):
+            rows.append([trades, label, *write_cost(event_type, trades, updates)])
+
+    print_table(
+        f"PortfolioPerformanceUpdated next + encode, {updates} updates",
+        ["trades", "serializer", "us", "bytes"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--updates", type=int, default=200)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore", RuntimeWarning)
+    main(args.updates)
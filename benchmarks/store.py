@@ -0,0 +1,108 @@
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from infrastructure.event_store.event_encoder import Encoder
+from infrastructure.event_store.event_store import EventStore
+
+from ._common import make_config, make_keys, make_market_events, print_table, timed
+
+
+def legacy_append(file_path: str, events: list) -> None:
+    if not os.path.exists(file_path):
+        with open(file_path, "w") as f:
+            f.write("[]")
+
+    with open(file_path, "rb+") as f:
+        f.seek(-1, os.SEEK_END)
+        f.truncate()
+
+        for event in events:
+            if f.tell() > 1:
+                f.write(",".encode("utf-8"))
+
+            f.write(json.dumps(event, cls=Encoder).encode("utf-8"))
+
+        f.write("]".encode("utf-8"))
+
+
+def run(append, batches: int, events: list, checkpoints: list) -> list:
+    samples = []
+    start = time.perf_counter()
+
+    for i in range(1, batches + 1):
+        append(events)
+
+        if i in checkpoints:
+            samples.append((time.perf_counter() - start) / i * 1e6)
+
+    return samples
+
+
+def main(batches: int, batch_size: int, fsync: str):
+    events = make_market_events(make_keys(10), batch_size)
+    checkpoints = [batches // 10, batches // 2, batches]
+    base_dir = tempfile.mkdtemp(prefix="bench_store_")
+
+    try:
+        legacy_path = os.path.join(base_dir, "legacy.json")
+        legacy = run(
+            lambda batch: legacy_append(legacy_path, batch),
+            batches,
+            events,
+            checkpoints,
+        )
+        legacy_read = timed(lambda: json.load(open(legacy_path)))
+
+        store = EventStore(
+            make_config(
+                {
+                    "store": {
+                        "base_dir": base_dir,
+                        "buf_size": batch_size,
+                        "fsync": fsync,
+                    }
+                }
+            )
+        )
+        group = str(events[0].meta.group)
+        segmented = run(store._commit, batches, events, checkpoints)
+        loop = asyncio.new_event_loop()
+        queued = run(
+            lambda batch: loop.run_until_complete(store.append_many(batch)),
+            batches,
+            events,
+            checkpoints,
+        )
+        drain = timed(store.flush)
+        store.close()
+        loop.close()
+        segmented_read = timed(lambda: sum(1 for _ in store.read(group)))
+
+        rows = [
+            ["json array rewrite", *legacy, legacy_read],
+            [f"segment log (fsync={fsync})", *segmented, segmented_read],
+            ["group-commit writer (enqueue)", *queued, drain],
+        ]
+    finally:
+        shutil.rmtree(base_dir)
+
+    print_table(
+        f"{batches} flushes of {batch_size} events",
+        ["store", *(f"us/flush @{c}" for c in checkpoints), "read/drain s"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batches", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--fsync", choices=["always", "interval", "never"])
+    args = parser.parse_args()
+
+    main(args.batches, args.batch_size, args.fsync or "interval")
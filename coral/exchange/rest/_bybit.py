@@ -294,6 +294,7 @@ class Bybit(AbstractRestExchange):
         in_sample: Lookback,
         out_sample: Lookback | None = None,
         batch_size: int = 512,
+        since: int | None = None,
     ):
         timeframe_ms = self.connector.parse_timeframe(timeframe.value) * 1000
 
@@ -307,6 +308,10 @@ class Bybit(AbstractRestExchange):
         )
         max_in_sample_time = in_sample_start_time + in_sample_lookback * timeframe_ms
 
+        if since is not None and since > in_sample_start_time:
+            in_sample_lookback = -(-(max_in_sample_time - since) // timeframe_ms)
+            in_sample_start_time = since
+
         def _fetch_loop(start_time: int, lookback: int, max_time: int | None = None):
             fetched_ohlcv = 0
             while fetched_ohlcv < lookback:
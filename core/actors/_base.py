@@ -1,7 +1,7 @@
 import asyncio
 import inspect
 import uuid
-from typing import Union, get_args, get_origin
+from typing import List, Optional, Union, get_args, get_origin
 
 from core.commands._base import Command
 from core.events._base import Event
@@ -10,6 +10,7 @@ from core.queries._base import Query
 from core.result import Result
 from core.tasks._base import Task
 from infrastructure.event_dispatcher.event_dispatcher import EventDispatcher
+from infrastructure.event_dispatcher.event_handler import Route
 
 
 class BaseActor(AbstractActor):
@@ -28,6 +29,10 @@ class BaseActor(AbstractActor):
     def running(self):
         return self._running
 
+    @property
+    def route(self) -> Optional[Route]:
+        return None
+
     def on_start(self):
         pass
 
@@ -67,6 +72,17 @@ class BaseActor(AbstractActor):
         if isinstance(msg, Task):
             return await self._mailbox.run(msg, *args, **kwrgs)
 
+    async def tell_many(self, msgs: List[Message], *args, **kwrgs):
+        await self._mailbox.dispatch_many(msgs, *args, **kwrgs)
+
+    async def ask_many(self, msgs: List[Ask], *args, **kwrgs) -> List[Result]:
+        if all(isinstance(msg, Command) for msg in msgs):
+            return await self._mailbox.execute_many(msgs, *args, **kwrgs)
+        if all(isinstance(msg, Query) for msg in msgs):
+            return await self._mailbox.query_many(msgs, *args, **kwrgs)
+
+        return await asyncio.gather(*(self.ask(msg, *args, **kwrgs) for msg in msgs))
+
     def _run_hook(self, hook):
         if asyncio.iscoroutinefunction(hook):
             loop = asyncio.get_running_loop()
@@ -80,11 +96,11 @@ class BaseActor(AbstractActor):
 
     def _register_events(self):
         for event in self._EVENTS:
-            self._mailbox.register(event, self.on_receive, self.pre_receive)
+            self._mailbox.register(event, self.on_receive, self.pre_receive, self.route)
 
     def _unregister_events(self):
         for event in self._EVENTS:
-            self._mailbox.unregister(event, self.on_receive)
+            self._mailbox.unregister(event, self.on_receive, self.route)
 
     def _discover_events(self):
         allowed_types = (Event, Query, Command, Task)
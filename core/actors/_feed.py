@@ -3,6 +3,7 @@ import logging
 from core.models.datasource_type import DataSourceType
 from core.models.symbol import Symbol
 from core.models.timeframe import Timeframe
+from infrastructure.event_dispatcher.event_handler import Route
 
 from ._base import BaseActor
 from .collector import DataCollector
@@ -45,6 +46,10 @@ class FeedActor(BaseActor):
     def collector(self) -> "DataCollector":
         return self._collector
 
+    @property
+    def route(self) -> Route:
+        return FeedPolicy.route_key, (self.symbol, self.timeframe, self.datasource)
+
     async def on_stop(self):
         await self.collector.stop()
 
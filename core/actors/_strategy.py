@@ -1,5 +1,6 @@
 from core.models.symbol import Symbol
 from core.models.timeframe import Timeframe
+from infrastructure.event_dispatcher.event_handler import Route
 
 from ._base import BaseActor
 from .policy.strategy import StrategyPolicy
@@ -24,5 +25,9 @@ class StrategyActor(BaseActor):
     def timeframe(self) -> "Timeframe":
         return self._timeframe
 
+    @property
+    def route(self) -> Route:
+        return StrategyPolicy.route_key, (self.symbol, self.timeframe)
+
     def pre_receive(self, msg) -> bool:
         return StrategyPolicy.should_process(self, msg)
@@ -1,10 +1,10 @@
-from typing import Union
+from typing import Any, Tuple, Union
 
-from core.tasks.feed import StartHistoricalFeed, StartRealtimeFeed
+from core.tasks.feed import StartHistoricalFeed, StartRealtimeFeed, StartReplayFeed
 
 from .event import EventPolicy
 
-FeedEvent = Union[StartHistoricalFeed, StartRealtimeFeed]
+FeedEvent = Union[StartHistoricalFeed, StartRealtimeFeed, StartReplayFeed]
 
 
 class FeedPolicy(EventPolicy):
@@ -15,3 +15,7 @@ class FeedPolicy(EventPolicy):
             and event.timeframe == actor.timeframe
             and event.datasource == actor.datasource
         )
+
+    @classmethod
+    def route_key(cls, event: FeedEvent) -> Tuple[Any, Any, Any]:
+        return event.symbol, event.timeframe, event.datasource
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Optional, Tuple
 
 from .event import EventPolicy
 
@@ -9,6 +9,10 @@ class StrategyPolicy(EventPolicy):
         symbol, timeframe = cls._get_event_key(event)
         return actor.symbol == symbol and actor.timeframe == timeframe
 
+    @classmethod
+    def route_key(cls, event) -> Optional[Tuple[Any, Any]]:
+        return event.partition_key
+
     @classmethod
     def _get_event_key(cls, event: Any):
         key = cls._extract_key(event)
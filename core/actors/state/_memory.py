@@ -51,6 +51,13 @@ class InMemory(Generic[K, V]):
         async with self._reader():
             return len(self._data)
 
+    def dump(self) -> Dict[K, V]:
+        return dict(self._data)
+
+    def load(self, data: Dict[K, V]) -> None:
+        self._data.clear()
+        self._data.update(data)
+
     @asynccontextmanager
     async def _reader(self):
         await self._lock.acquire_reader()
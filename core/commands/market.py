@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from typing import Hashable, Optional, Tuple
 
 from core.events.meta import EventMeta
 from core.groups.command import CommandGroup
@@ -6,6 +7,7 @@ from core.models.datasource_type import DataSourceType
 from core.models.entity.bar import Bar
 from core.models.symbol import Symbol
 from core.models.timeframe import Timeframe
+from core.queries.ohlcv import TA, BatchBars
 
 from ._base import Command
 
@@ -24,3 +26,8 @@ class MarketCommand(Command):
 @dataclass(frozen=True)
 class IngestMarketData(MarketCommand):
     bar: Bar
+
+    @property
+    def invalidates(self) -> Tuple[Tuple[type, Optional[Hashable]], ...]:
+        scope = self.symbol, self.timeframe
+        return (TA, scope), (BatchBars, scope)
@@ -1,7 +1,9 @@
 from dataclasses import dataclass, field
+from typing import Hashable, Optional, Tuple
 
 from core.events._base import EventMeta
 from core.groups.command import CommandGroup
+from core.queries.portfolio import GetPortfolioPerformance
 
 from ._base import Command
 
@@ -16,7 +18,9 @@ class PortfolioCommand(Command):
 
 @dataclass(frozen=True)
 class PortfolioReset(PortfolioCommand):
-    pass
+    @property
+    def invalidates(self) -> Tuple[Tuple[type, Optional[Hashable]], ...]:
+        return ((GetPortfolioPerformance, None),)
 
 
 @dataclass(frozen=True)
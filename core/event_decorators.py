@@ -7,6 +7,7 @@ from infrastructure.event_dispatcher.event_dispatcher import EventDispatcher
 
 from .commands._base import Command
 from .events._base import Event
+from .models.execution_class import ExecutionClass
 from .queries._base import Query
 from .result import Result
 
@@ -130,3 +131,11 @@ def query_handler(query_type: Type[Query]) -> Callable[[Callable], Callable]:
         return async_wrapped_handler
 
     return decorator
+
+
+def execution(execution_class: ExecutionClass) -> Callable[[Callable], Callable]:
+    def decorator(handler: Callable) -> Callable:
+        handler._execution_class_ = execution_class
+        return handler
+
+    return decorator
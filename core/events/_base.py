@@ -1,4 +1,5 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
+from typing import Any, Hashable, Optional, Tuple
 
 from core.events.meta import EventMeta
 
@@ -7,9 +8,38 @@ from core.events.meta import EventMeta
 class Event:
     meta: EventMeta
 
+    @property
+    def partition_key(self) -> Optional[Tuple[Any, Any]]:
+        if hasattr(self, "signal"):
+            source = self.signal
+        elif hasattr(self, "position") and hasattr(self.position, "signal"):
+            source = self.position.signal
+        else:
+            source = self
+
+        symbol = getattr(source, "symbol", None)
+        timeframe = getattr(source, "timeframe", None)
+
+        if symbol is None or timeframe is None:
+            return None
+
+        return symbol, timeframe
+
+    @property
+    def conflation_key(self) -> Optional[Hashable]:
+        return None
+
+    @property
+    def conflatable(self) -> bool:
+        return False
+
+    @property
+    def invalidates(self) -> Tuple[Tuple[type, Optional[Hashable]], ...]:
+        return ()
+
     def to_dict(self):
-        res = asdict(self)
-        res["meta"]["name"] = self.__class__.__name__
+        res = {f.name: getattr(self, f.name) for f in fields(self)}
+        res["meta"] = {**self.meta.to_dict(), "name": self.__class__.__name__}
         return res
 
 
@@ -1,10 +1,12 @@
 from dataclasses import dataclass, field
+from typing import Hashable, Optional, Tuple
 
 from core.events.meta import EventMeta
 from core.groups.event import EventGroup
 from core.models.strategy import Strategy
 from core.models.symbol import Symbol
 from core.models.timeframe import Timeframe
+from core.queries.portfolio import GetPortfolioPerformance
 
 from ._base import Event
 
@@ -22,7 +24,11 @@ class BacktestEvent(Event):
 
 @dataclass(frozen=True)
 class BacktestStarted(BacktestEvent):
-    pass
+    @property
+    def invalidates(self) -> Tuple[Tuple[type, Optional[Hashable]], ...]:
+        return (
+            (GetPortfolioPerformance, (self.symbol, self.timeframe, self.strategy)),
+        )
 
 
 @dataclass(frozen=True)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from typing import Hashable, Optional
 
 from core.events.meta import EventMeta
 from core.groups.event import EventGroup
@@ -26,6 +27,14 @@ class MarketEvent(Event):
 class NewMarketDataReceived(MarketEvent):
     bar: Bar
 
+    @property
+    def conflation_key(self) -> Optional[Hashable]:
+        return self.symbol, self.timeframe, self.datasource
+
+    @property
+    def conflatable(self) -> bool:
+        return not self.bar.closed
+
     def to_dict(self):
         parent_dict = super().to_dict()
 
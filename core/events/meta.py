@@ -1,14 +1,62 @@
+import itertools
+import os
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any, Dict, Union
 
 from core.groups.event import EventGroup
 
+NODE_BITS = 10
 
-@dataclass
+_clock_offset = time.time() - time.monotonic()
+_compact = False
+
+
+def _seed() -> None:
+    global _node, _sequence
+    _node = uuid.uuid4().int & ((1 << NODE_BITS) - 1)
+    _sequence = itertools.count(time.time_ns() // 1000)
+
+
+_seed()
+os.register_at_fork(after_in_child=_seed)
+
+
+def use_compact_meta(enabled: bool) -> None:
+    global _compact
+    _compact = enabled
+
+
+def _next_key() -> Union[str, int]:
+    if _compact:
+        return next(_sequence) << NODE_BITS | _node
+
+    return str(uuid.uuid4())
+
+
+def _now() -> float:
+    if _compact:
+        return _clock_offset + time.monotonic()
+
+    return datetime.now().timestamp()
+
+
+@dataclass(slots=True)
 class EventMeta:
-    key: str = field(default_factory=lambda: str(uuid.uuid4()))
-    timestamp: int = field(default_factory=lambda: datetime.now().timestamp())
-    priority: int = field(default_factory=lambda: 0)
-    version: int = field(default_factory=lambda: 1)
-    group: EventGroup = field(default_factory=lambda: EventGroup.service)
+    key: Union[str, int] = field(default_factory=_next_key)
+    timestamp: float = field(default_factory=_now)
+    priority: int = 0
+    version: int = 1
+    group: EventGroup = EventGroup.service
+    replayed: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "key": self.key,
+            "timestamp": self.timestamp,
+            "priority": self.priority,
+            "version": self.version,
+            "group": self.group,
+        }
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 
 from core.events.meta import EventMeta
 from core.groups.event import EventGroup
-from core.models.entity.portfolio import Performance
+from core.models.entity.portfolio import Performance, RollingPerformance
 from core.models.strategy import Strategy
 from core.models.symbol import Symbol
 from core.models.timeframe import Timeframe
@@ -25,6 +25,23 @@ class PortfolioEvent(Event):
 class PortfolioPerformanceUpdated(PortfolioEvent):
     performance: Performance
 
+    def to_dict(self):
+        parent_dict = super().to_dict()
+
+        current_dict = {
+            "symbol": str(self.symbol),
+            "timeframe": str(self.timeframe),
+            "strategy": str(self.strategy),
+            "performance": self.performance.to_dict("core"),
+        }
+
+        return {**parent_dict, **current_dict}
+
+
+@dataclass(frozen=True)
+class PortfolioRollingPerformanceUpdated(PortfolioEvent):
+    performance: RollingPerformance
+
     def to_dict(self):
         parent_dict = super().to_dict()
 
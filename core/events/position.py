@@ -1,8 +1,10 @@
 from dataclasses import dataclass, field
+from typing import Hashable, Optional, Tuple
 
 from core.events.meta import EventMeta
 from core.groups.event import EventGroup
 from core.models.entity.position import Position
+from core.queries.portfolio import GetPortfolioPerformance
 
 from ._base import Event
 
@@ -47,7 +49,15 @@ class PositionCloseRequested(PositionEvent):
 
 @dataclass(frozen=True)
 class PositionClosed(PositionEvent):
-    pass
+    @property
+    def invalidates(self) -> Tuple[Tuple[type, Optional[Hashable]], ...]:
+        signal = self.position.signal
+        return (
+            (
+                GetPortfolioPerformance,
+                (signal.symbol, signal.timeframe, signal.strategy),
+            ),
+        )
 
 
 @dataclass(frozen=True)
@@ -1,10 +1,13 @@
 from dataclasses import dataclass, field
+from typing import Hashable, Optional, Tuple
 
 from core.events.meta import EventMeta
 from core.groups.event import EventGroup
+from core.models.entity.position import Position
 from core.models.strategy import Strategy
 from core.models.symbol import Symbol
 from core.models.timeframe import Timeframe
+from core.queries.portfolio import GetPortfolioPerformance
 
 from ._base import Event
 
@@ -22,4 +25,20 @@ class TradeEvent(Event):
 
 @dataclass(frozen=True)
 class TradeStarted(TradeEvent):
-    pass
+    @property
+    def invalidates(self) -> Tuple[Tuple[type, Optional[Hashable]], ...]:
+        return (
+            (GetPortfolioPerformance, (self.symbol, self.timeframe, self.strategy)),
+        )
+
+
+@dataclass(frozen=True)
+class TradeResumed(Event):
+    symbol: Symbol
+    timeframe: Timeframe
+    opened: Tuple[Position, ...]
+    closed: Tuple[str, ...]
+    meta: EventMeta = field(
+        default_factory=lambda: EventMeta(priority=6, group=EventGroup.backtest),
+        init=False,
+    )
@@ -10,6 +10,7 @@ class QueryGroup(Enum):
     market = auto()
     ta = auto()
     factor = auto()
+    telemetry = auto()
 
     def __str__(self):
         return self.name
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import List, Union
 
 from core.commands._base import Command
 from core.commands.market import IngestMarketData
@@ -95,3 +95,11 @@ class AbstractActor(ABC):
     @abstractmethod
     def ask(self, ask: Ask):
         pass
+
+    @abstractmethod
+    def tell_many(self, msgs: List[Message]):
+        pass
+
+    @abstractmethod
+    def ask_many(self, asks: List[Ask]):
+        pass
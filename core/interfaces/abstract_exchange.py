@@ -34,6 +34,7 @@ class AbstractRestExchange(ABC):
         in_sample: Lookback,
         out_sample: Lookback,
         batch_size: int,
+        since: int | None = None,
     ):
         pass
 
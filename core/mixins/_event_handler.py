@@ -1,6 +1,8 @@
 import asyncio
 from typing import Any, Callable, Dict, Type
 
+from infrastructure.executors import ExecutorService
+
 
 class EventHandlerMixin:
     def __init__(self):
@@ -16,6 +18,6 @@ class EventHandlerMixin:
             if asyncio.iscoroutinefunction(handler):
                 return await handler(event)
             else:
-                return await asyncio.to_thread(handler, event)
+                return await ExecutorService().run(handler, event)
 
         return None
@@ -2,37 +2,83 @@ import json
 from dataclasses import dataclass, fields
 from enum import Enum
 from functools import cached_property
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
+
+FULL = "full"
+CORE = "core"
+
+
+def _convert(value: Any) -> Any:
+    if hasattr(value, "to_dict") and callable(value.to_dict):
+        return value.to_dict()
+    elif isinstance(value, Enum):
+        return str(value)
+    elif isinstance(value, list):
+        return [
+            v.to_dict() if hasattr(v, "to_dict") and callable(v.to_dict) else v
+            for v in value
+        ]
+    return value
+
+
+def _compile(names: Tuple[str, ...]) -> Callable[[Any], Dict[str, Any]]:
+    def serialize(self) -> Dict[str, Any]:
+        result = {}
+
+        for name in names:
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                continue
+
+            result[name] = _convert(value)
+
+        return result
+
+    return serialize
+
+
+def _serializers(cls) -> Dict[str, Callable[[Any], Dict[str, Any]]]:
+    field_names = tuple(f.name for f in fields(cls))
+    property_names = tuple(
+        k
+        for k in dir(cls)
+        if isinstance(getattr(cls, k, None), (property, cached_property))
+    )
+    fieldsets = {
+        CORE: (),
+        **getattr(cls, "__fieldsets__", {}),
+        FULL: property_names,
+    }
+
+    for name, properties in fieldsets.items():
+        unknown = set(properties) - set(property_names)
+
+        if unknown:
+            raise ValueError(
+                f"{cls.__name__} field set {name} has no properties {sorted(unknown)}"
+            )
+
+    return {
+        name: _compile(field_names + tuple(properties))
+        for name, properties in fieldsets.items()
+    }
 
 
 def Entity(cls):
     cls = dataclass(frozen=True)(cls)
+    cls.__serializers__ = _serializers(cls)
 
-    def to_dict(self) -> Dict[str, Any]:
-        field_dict = {f.name: getattr(self, f.name) for f in fields(self)}
-        property_dict = {
-            k: getattr(self, k)
-            for k in dir(self)
-            if isinstance(getattr(self.__class__, k, None), (property, cached_property))
-            and hasattr(self, k)
-        }
-
-        result = {**field_dict, **property_dict}
-
-        for key, value in result.items():
-            if hasattr(value, "to_dict") and callable(value.to_dict):
-                result[key] = value.to_dict()
-            elif isinstance(value, Enum):
-                result[key] = str(value)
-            elif isinstance(value, list):
-                result[key] = [
-                    v.to_dict() if hasattr(v, "to_dict") and callable(v.to_dict) else v
-                    for v in value
-                ]
-        return result
+    def to_dict(self, fieldset: str = FULL) -> Dict[str, Any]:
+        serializer = self.__serializers__.get(fieldset)
+
+        if serializer is None:
+            raise ValueError(f"Unknown field set: {fieldset}")
+
+        return serializer(self)
 
-    def to_json(self) -> str:
-        return json.dumps(self.to_dict(), default=str)
+    def to_json(self, fieldset: str = FULL) -> str:
+        return json.dumps(self.to_dict(fieldset), default=str)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Entity":
@@ -0,0 +1,352 @@
+import math
+
+import numpy as np
+
+INITIAL_CAPACITY = 64
+
+
+def add_moments(n: int, mean: float, m2: float, m3: float, m4: float, x: float):
+    count = n + 1
+    delta = x - mean
+    delta_n = delta / count
+    delta_n2 = delta_n * delta_n
+    term = delta * delta_n * n
+
+    m4 += (
+        term * delta_n2 * (count * count - 3 * count + 3)
+        + 6 * delta_n2 * m2
+        - 4 * delta_n * m3
+    )
+    m3 += term * delta_n * (count - 2) - 3 * delta_n * m2
+    m2 += term
+
+    return mean + delta_n, m2, m3, m4
+
+
+def remove_moments(n: int, mean: float, m2: float, m3: float, m4: float, x: float):
+    count = n - 1
+
+    if count == 0:
+        return 0.0, 0.0, 0.0, 0.0
+
+    mean = (n * mean - x) / count
+    delta = x - mean
+    delta_n = delta / n
+    delta_n2 = delta_n * delta_n
+    term = delta * delta_n * count
+
+    m2 -= term
+    m3 -= term * delta_n * (n - 2) - 3 * delta_n * m2
+    m4 -= term * delta_n2 * (n * n - 3 * n + 3) + 6 * delta_n2 * m2 - 4 * delta_n * m3
+
+    return mean, max(m2, 0.0), m3, max(m4, 0.0)
+
+
+def sample_skew(n: int, mean: float, m2: float, m3: float) -> float:
+    if m2 <= (np.finfo(float).eps * mean) ** 2 * n:
+        return math.nan
+
+    g1 = math.sqrt(n) * m3 / m2**1.5
+
+    if n <= 2:
+        return g1
+
+    return g1 * math.sqrt(n * (n - 1)) / (n - 2)
+
+
+def sample_kurtosis(n: int, mean: float, m2: float, m4: float) -> float:
+    if m2 <= (np.finfo(float).eps * mean) ** 2 * n:
+        return math.nan
+
+    g2 = n * m4 / m2**2 - 3.0
+
+    if n <= 3:
+        return g2
+
+    return ((n + 1) * g2 + 6.0) * (n - 1) / ((n - 2) * (n - 3))
+
+
+class _Buffer:
+    __slots__ = ("pnl", "fee", "size", "_sorted")
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        self.pnl = np.empty(capacity, dtype=np.float64)
+        self.fee = np.empty(capacity, dtype=np.float64)
+        self.size = 0
+        self._sorted = np.empty(0, dtype=np.float64)
+
+    @classmethod
+    def branch(cls, pnl: np.ndarray, fee: np.ndarray) -> "_Buffer":
+        buffer = cls(max(INITIAL_CAPACITY, 2 * len(pnl)))
+        size = len(pnl)
+
+        buffer.pnl[:size] = pnl
+        buffer.fee[:size] = fee
+        buffer.size = size
+
+        return buffer
+
+    def append(self, pnl: float, fee: float) -> None:
+        size = self.size
+
+        if size == len(self.pnl):
+            self._grow()
+
+        self.pnl[size] = pnl
+        self.fee[size] = fee
+        self.size = size + 1
+
+    def sorted(self, count: int) -> np.ndarray:
+        if count != self.size:
+            return np.sort(self.pnl[:count])
+
+        cached = self._sorted
+
+        if len(cached) < count:
+            cached = np.sort(
+                np.concatenate((cached, self.pnl[len(cached) : count])), kind="stable"
+            )
+            self._sorted = cached
+
+        return cached
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self.pnl)
+
+        for name in ("pnl", "fee"):
+            grown = np.empty(capacity, dtype=np.float64)
+            grown[: self.size] = getattr(self, name)[: self.size]
+            setattr(self, name, grown)
+
+
+class StreamingStats:
+    __slots__ = (
+        "_buffer",
+        "mar",
+        "count",
+        "mean",
+        "m2",
+        "m3",
+        "m4",
+        "total",
+        "total_fee",
+        "wins",
+        "profit",
+        "losses",
+        "loss",
+        "log_profit",
+        "win_streak",
+        "loss_streak",
+        "max_win_streak",
+        "max_loss_streak",
+        "equity",
+        "first_equity",
+        "peak",
+        "trough",
+        "max_drawdown",
+        "max_runup",
+        "drawdown_sum",
+        "drawdown_sq_sum",
+        "drawdown_below",
+        "lpm1",
+        "lpm2",
+        "lpm3",
+        "lag_count",
+        "lag_mean_x",
+        "lag_mean_y",
+        "lag_m2_x",
+        "lag_m2_y",
+        "lag_cov",
+        "lags",
+        "lag_counts",
+        "lag_means_x",
+        "lag_means_y",
+        "lag_m2s_x",
+        "lag_m2s_y",
+        "lag_covs",
+    )
+
+    def __init__(self, account_size: float, mar: float = 0.0, lags: int = 1):
+        self._buffer = None
+        self.mar = mar
+        self.count = 0
+        self.mean = self.m2 = self.m3 = self.m4 = 0.0
+        self.total = self.total_fee = 0.0
+        self.wins = self.losses = 0
+        self.profit = self.loss = self.log_profit = 0.0
+        self.win_streak = self.loss_streak = 0
+        self.max_win_streak = self.max_loss_streak = 0
+        self.equity = self.first_equity = float(account_size)
+        self.peak = self.trough = self.equity
+        self.max_drawdown = self.max_runup = 0.0
+        self.drawdown_sum = self.drawdown_sq_sum = 0.0
+        self.drawdown_below = 0
+        self.lpm1 = self.lpm2 = self.lpm3 = 0.0
+        self.lag_count = 0
+        self.lag_mean_x = self.lag_mean_y = 0.0
+        self.lag_m2_x = self.lag_m2_y = self.lag_cov = 0.0
+        self.lags = np.arange(2, max(lags, 1) + 1)
+        self.lag_counts = np.zeros(len(self.lags), dtype=np.int64)
+        self.lag_means_x = self.lag_means_y = np.zeros(len(self.lags))
+        self.lag_m2s_x = self.lag_m2s_y = self.lag_covs = np.zeros(len(self.lags))
+
+    @property
+    def pnl(self) -> np.ndarray:
+        if self._buffer is None:
+            return np.array([], dtype=np.float64)
+
+        return self._buffer.pnl[: self.count]
+
+    @property
+    def fee(self) -> np.ndarray:
+        if self._buffer is None:
+            return np.array([], dtype=np.float64)
+
+        return self._buffer.fee[: self.count]
+
+    @property
+    def sorted(self) -> np.ndarray:
+        if self._buffer is None:
+            return np.array([], dtype=np.float64)
+
+        return self._buffer.sorted(self.count)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    @property
+    def skew(self) -> float:
+        return sample_skew(self.count, self.mean, self.m2, self.m3)
+
+    @property
+    def kurtosis(self) -> float:
+        return sample_kurtosis(self.count, self.mean, self.m2, self.m4)
+
+    @property
+    def autocorrelation(self) -> float:
+        denom = self.lag_m2_x * self.lag_m2_y
+
+        if denom <= 0:
+            return math.nan
+
+        return self.lag_cov / math.sqrt(denom)
+
+    @property
+    def autocorrelations(self) -> np.ndarray:
+        denom = self.lag_m2s_x * self.lag_m2s_y
+        higher = np.divide(
+            self.lag_covs,
+            np.sqrt(denom),
+            out=np.where(self.lag_counts < 2, 0.0, np.nan),
+            where=denom > 0,
+        )
+
+        return np.concatenate(([self.autocorrelation], higher))
+
+    def push(self, pnl: float, fee: float) -> "StreamingStats":
+        stats = self._copy()
+
+        if self._buffer is None or self._buffer.size != self.count:
+            stats._buffer = (
+                _Buffer()
+                if self._buffer is None
+                else _Buffer.branch(self.pnl, self.fee)
+            )
+
+        stats._update(float(pnl), float(fee))
+
+        return stats
+
+    def _update(self, pnl: float, fee: float) -> None:
+        n = self.count
+
+        if n:
+            self._update_lag(self._buffer.pnl[n - 1], pnl)
+
+        if n > 1 and len(self.lags):
+            self._update_lags(n, pnl)
+
+        self._buffer.append(pnl, fee)
+
+        self.mean, self.m2, self.m3, self.m4 = add_moments(
+            n, self.mean, self.m2, self.m3, self.m4, pnl
+        )
+        self.count = n + 1
+
+        self.total += pnl
+        self.total_fee += fee
+
+        if pnl > 0:
+            self.wins += 1
+            self.profit += pnl
+            self.log_profit += math.log(1.0 + pnl)
+            self.win_streak += 1
+            self.loss_streak = 0
+            self.max_win_streak = max(self.max_win_streak, self.win_streak)
+        else:
+            self.loss_streak += 1
+            self.win_streak = 0
+            self.max_loss_streak = max(self.max_loss_streak, self.loss_streak)
+
+        if pnl < 0:
+            self.losses += 1
+            self.loss += pnl
+
+        self.equity += pnl
+
+        if n:
+            self.peak = max(self.peak, self.equity)
+            self.trough = min(self.trough, self.equity)
+        else:
+            self.first_equity = self.peak = self.trough = self.equity
+
+        drawdown = (self.peak - self.equity) / self.peak if self.peak > 0 else 0.0
+        runup = (self.equity - self.trough) / self.trough if self.trough > 0 else 0.0
+
+        self.max_drawdown = max(self.max_drawdown, drawdown)
+        self.max_runup = max(self.max_runup, runup)
+        self.drawdown_sum += drawdown
+        self.drawdown_sq_sum += drawdown * drawdown
+        self.drawdown_below += drawdown < 0
+
+        downside = max(0.0, self.mar - pnl)
+        self.lpm1 += downside
+        self.lpm2 += downside**2
+        self.lpm3 += downside**3
+
+    def _update_lag(self, x: float, y: float) -> None:
+        self.lag_count += 1
+
+        dx = x - self.lag_mean_x
+        self.lag_mean_x += dx / self.lag_count
+        dy = y - self.lag_mean_y
+        self.lag_mean_y += dy / self.lag_count
+
+        self.lag_cov += dx * (y - self.lag_mean_y)
+        self.lag_m2_x += dx * (x - self.lag_mean_x)
+        self.lag_m2_y += dy * (y - self.lag_mean_y)
+
+    def _update_lags(self, n: int, y: float) -> None:
+        active = self.lags <= n
+        x = self._buffer.pnl[np.where(active, n - self.lags, 0)]
+
+        self.lag_counts = self.lag_counts + active
+        count = np.maximum(self.lag_counts, 1)
+
+        dx = np.where(active, x - self.lag_means_x, 0.0)
+        self.lag_means_x = self.lag_means_x + dx / count
+        dy = np.where(active, y - self.lag_means_y, 0.0)
+        self.lag_means_y = self.lag_means_y + dy / count
+
+        self.lag_covs = self.lag_covs + dx * (y - self.lag_means_y)
+        self.lag_m2s_x = self.lag_m2s_x + dx * (x - self.lag_means_x)
+        self.lag_m2s_y = self.lag_m2s_y + dy * (y - self.lag_means_y)
+
+    def _copy(self) -> "StreamingStats":
+        stats = StreamingStats.__new__(StreamingStats)
+
+        for name in StreamingStats.__slots__:
+            setattr(stats, name, getattr(self, name))
+
+        return stats
@@ -0,0 +1,374 @@
+from functools import cached_property
+from typing import List, Sequence
+
+import numpy as np
+from scipy.stats import norm
+
+from ._base import Entity
+from .portfolio import (
+    GAMMA,
+    SMALL_NUMBER_THRESHOLD,
+    TOTAL_TRADES_THRESHOLD,
+    Performance,
+)
+
+
+def _pad(vectors: Sequence[np.ndarray], width: int) -> np.ndarray:
+    padded = np.zeros((len(vectors), width), dtype=np.float64)
+
+    for row, vector in enumerate(vectors):
+        padded[row, : len(vector)] = vector
+
+    return padded
+
+
+def _ratio(num: np.ndarray, denom: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    mask = valid & (denom > SMALL_NUMBER_THRESHOLD)
+
+    return np.divide(num, denom, out=np.zeros_like(num), where=mask)
+
+
+def _gated(values: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    return np.where(valid, values, 0.0)
+
+
+@Entity
+class PerformanceBatch:
+    _pnl: np.ndarray
+    _fee: np.ndarray
+    _count: np.ndarray
+    _account_size: np.ndarray
+    _periods_per_year: np.ndarray
+    _mar: np.ndarray
+    _confidence_level: np.ndarray
+    _autocorr_lags: np.ndarray
+
+    @classmethod
+    def from_performances(cls, performances: List[Performance]) -> "PerformanceBatch":
+        count = np.array([p.total_trades for p in performances], dtype=np.int64)
+        width = int(count.max(initial=0))
+
+        return cls(
+            _pad([p._pnl for p in performances], width),
+            _pad([p._fee for p in performances], width),
+            count,
+            np.array([p._account_size for p in performances], dtype=np.float64),
+            np.array([p._periods_per_year for p in performances], dtype=np.float64),
+            np.array([p._mar for p in performances], dtype=np.float64),
+            np.array([p._confidence_level for p in performances], dtype=np.float64),
+            np.array([p._autocorr_lags for p in performances], dtype=np.int64),
+        )
+
+    def __len__(self) -> int:
+        return len(self._count)
+
+    @cached_property
+    def _index(self) -> np.ndarray:
+        return np.arange(self._pnl.shape[1], dtype=np.int64)
+
+    @property
+    def _mask(self) -> np.ndarray:
+        return self._index < self._count[:, None]
+
+    @property
+    def _valid(self) -> np.ndarray:
+        return self._count >= TOTAL_TRADES_THRESHOLD
+
+    @cached_property
+    def _n(self) -> np.ndarray:
+        return np.maximum(self._count, TOTAL_TRADES_THRESHOLD).astype(np.float64)
+
+    @cached_property
+    def _sorted(self) -> np.ndarray:
+        return np.sort(np.where(self._mask, self._pnl, np.inf), axis=1)
+
+    @cached_property
+    def _moments(self) -> np.ndarray:
+        deviation = self._pnl - self._pnl.sum(axis=1, keepdims=True) / self._n[:, None]
+        deviation *= self._mask
+        squared = deviation * deviation
+
+        return np.stack(
+            [
+                squared.sum(axis=1),
+                (squared * deviation).sum(axis=1),
+                (squared * squared).sum(axis=1),
+            ]
+        )
+
+    @cached_property
+    def _equity(self) -> np.ndarray:
+        return self._account_size[:, None] + np.cumsum(self._pnl, axis=1)
+
+    @cached_property
+    def _downside(self) -> np.ndarray:
+        return np.maximum(0.0, self._mar[:, None] - self._pnl) * self._mask
+
+    @cached_property
+    def total_trades(self) -> np.ndarray:
+        return self._count
+
+    @cached_property
+    def total_pnl(self) -> np.ndarray:
+        return self._pnl.sum(axis=1)
+
+    @cached_property
+    def total_fee(self) -> np.ndarray:
+        return self._fee.sum(axis=1)
+
+    @cached_property
+    def average_pnl(self) -> np.ndarray:
+        return _gated(self.total_pnl / self._n, self._valid)
+
+    @cached_property
+    def excess_return(self) -> np.ndarray:
+        return self.average_pnl - self._mar
+
+    @cached_property
+    def hit_ratio(self) -> np.ndarray:
+        return _gated(np.sum(self._pnl > 0, axis=1) / self._n, self._valid)
+
+    @cached_property
+    def total_profit(self) -> np.ndarray:
+        return _gated(np.sum(np.maximum(self._pnl, 0.0), axis=1), self._valid)
+
+    @cached_property
+    def total_loss(self) -> np.ndarray:
+        return _gated(np.sum(np.minimum(self._pnl, 0.0), axis=1), self._valid)
+
+    @cached_property
+    def profit_factor(self) -> np.ndarray:
+        return _ratio(self.total_profit, np.abs(self.total_loss), self._valid)
+
+    @cached_property
+    def _std(self) -> np.ndarray:
+        return np.sqrt(self._moments[0] / (self._n - 1))
+
+    @cached_property
+    def skew(self) -> np.ndarray:
+        m2, m3, _ = self._moments
+        n = self._n
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            g1 = np.sqrt(n) * m3 / m2**1.5
+            skew = g1 * np.sqrt(n * (n - 1)) / (n - 2)
+
+        return _gated(np.where(self._degenerate, np.nan, skew), self._valid)
+
+    @cached_property
+    def kurtosis(self) -> np.ndarray:
+        m2, _, m4 = self._moments
+        n = self._n
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            g2 = n * m4 / m2**2 - 3.0
+            kurtosis = ((n + 1) * g2 + 6.0) * (n - 1) / ((n - 2) * (n - 3))
+
+        kurtosis = np.where(n <= 3, g2, kurtosis)
+
+        return _gated(np.where(self._degenerate, np.nan, kurtosis), self._valid)
+
+    @cached_property
+    def _degenerate(self) -> np.ndarray:
+        mean = self.total_pnl / self._n
+
+        return self._moments[0] <= (np.finfo(float).eps * mean) ** 2 * self._n
+
+    @cached_property
+    def sharpe_ratio(self) -> np.ndarray:
+        return _ratio(self.excess_return, self._std, self._valid)
+
+    @cached_property
+    def smart_sharpe_ratio(self) -> np.ndarray:
+        penalty = Performance._autocorr_penalty(
+            np.abs(self._autocorrelation(1)), self._n
+        )
+        lags = self._autocorr_lags
+
+        if lags.max(initial=1) > 1:
+            coefs = np.stack(
+                [
+                    np.where(lag <= lags, self._autocorrelation(lag), 0.0)
+                    for lag in range(1, lags.max() + 1)
+                ],
+                axis=1,
+            )
+            penalty = np.where(
+                lags > 1, Performance._lagged_penalty(coefs, self._n), penalty
+            )
+
+        with np.errstate(invalid="ignore"):
+            return _ratio(self.excess_return, self._std * penalty, self._valid)
+
+    @cached_property
+    def deflated_sharpe_ratio(self) -> np.ndarray:
+        n = self._n
+        sharpe_ratio = self.sharpe_ratio
+
+        sharpe_ratio_star = np.sqrt(0.5 / self._periods_per_year) * (
+            (1.0 - GAMMA) * norm.ppf(1.0 - 1.0 / n)
+            + GAMMA * norm.ppf(1.0 - 1.0 / (n * np.e))
+        )
+
+        denom = (
+            1.0
+            - self.skew * sharpe_ratio
+            + ((self.kurtosis - 1.0) / 4) * sharpe_ratio**2
+        )
+
+        with np.errstate(invalid="ignore"):
+            mask = self._valid & (denom > SMALL_NUMBER_THRESHOLD)
+
+        z = np.divide(
+            (sharpe_ratio - sharpe_ratio_star) * np.sqrt(n - 1.0),
+            np.sqrt(np.where(mask, denom, 1.0)),
+        )
+
+        return np.where(mask, norm.cdf(z), 0.0)
+
+    @cached_property
+    def omega_ratio(self) -> np.ndarray:
+        downside_risk = self._lpm(1)
+        omega = _ratio(self.excess_return, downside_risk, self._valid)
+
+        return np.where(
+            self._valid & (downside_risk > SMALL_NUMBER_THRESHOLD), omega + 1.0, 0.0
+        )
+
+    @cached_property
+    def sortino_ratio(self) -> np.ndarray:
+        return _ratio(self.excess_return, np.sqrt(self._lpm(2)), self._valid)
+
+    @cached_property
+    def kappa_three_ratio(self) -> np.ndarray:
+        return _ratio(self.excess_return, np.cbrt(self._lpm(3)), self._valid)
+
+    @cached_property
+    def max_drawdown(self) -> np.ndarray:
+        peak = np.maximum.accumulate(self._equity, axis=1)
+        drawdown = np.divide(
+            peak - self._equity, peak, out=np.zeros_like(peak), where=peak > 0
+        )
+
+        return _gated(np.max(drawdown, axis=1, initial=0.0), self._valid)
+
+    @cached_property
+    def max_runup(self) -> np.ndarray:
+        trough = np.minimum.accumulate(self._equity, axis=1)
+        runup = np.divide(
+            self._equity - trough, trough, out=np.zeros_like(trough), where=trough > 0
+        )
+
+        return _gated(np.max(runup, axis=1, initial=0.0), self._valid)
+
+    @cached_property
+    def calmar_ratio(self) -> np.ndarray:
+        return _ratio(self.excess_return, np.abs(self.max_drawdown), self._valid)
+
+    @cached_property
+    def var(self) -> np.ndarray:
+        index = ((1.0 - self._confidence_level) * self._count).astype(np.int64)
+
+        return _gated(self._take(np.minimum(index, self._count - 1)), self._valid)
+
+    @cached_property
+    def cvar(self) -> np.ndarray:
+        below = self._sorted < self.var[:, None]
+        size = below.sum(axis=1)
+        total = np.where(below, self._sorted, 0.0).sum(axis=1)
+        cvar = np.divide(total, size, out=self.var.copy(), where=size >= 2)
+
+        return _gated(cvar, self._valid)
+
+    @cached_property
+    def tail_ratio(self) -> np.ndarray:
+        cutoff = 100 * self._confidence_level
+        denom = self._percentile(100 - cutoff)
+        valid = self._valid & (np.abs(denom) > SMALL_NUMBER_THRESHOLD)
+
+        return np.abs(
+            np.divide(
+                self._percentile(cutoff), denom, out=np.zeros(len(self)), where=valid
+            )
+        )
+
+    @cached_property
+    def rachev_ratio(self) -> np.ndarray:
+        values = self._sorted
+        present = np.isfinite(values)
+
+        lower = (
+            values <= self._percentile(100 * (1.0 - self._confidence_level))[:, None]
+        )
+        upper = values >= self._percentile(100 * self._confidence_level)[:, None]
+        upper &= present
+
+        lower_size, upper_size = lower.sum(axis=1), upper.sum(axis=1)
+
+        expected_shortfall = np.abs(
+            np.divide(
+                np.where(lower, values, 0.0).sum(axis=1),
+                lower_size,
+                out=np.zeros(len(self)),
+                where=lower_size > 0,
+            )
+        )
+        expected_upside = np.divide(
+            np.where(upper, values, 0.0).sum(axis=1),
+            upper_size,
+            out=np.zeros(len(self)),
+            where=upper_size > 0,
+        )
+
+        valid = (
+            self._valid
+            & (lower_size >= 2)
+            & (upper_size >= 2)
+            & (expected_shortfall >= SMALL_NUMBER_THRESHOLD)
+            & (expected_upside >= SMALL_NUMBER_THRESHOLD)
+        )
+
+        return np.divide(
+            expected_upside,
+            expected_shortfall,
+            out=np.zeros(len(self)),
+            where=valid,
+        )
+
+    def _autocorrelation(self, lag: int) -> np.ndarray:
+        pairs = self._mask[:, lag:]
+        count = pairs.sum(axis=1)
+        size = np.maximum(count, 1)[:, None]
+        x, y = self._pnl[:, :-lag] * pairs, self._pnl[:, lag:] * pairs
+
+        dx = (x - x.sum(axis=1, keepdims=True) / size) * pairs
+        dy = (y - y.sum(axis=1, keepdims=True) / size) * pairs
+        denom = np.sum(dx * dx, axis=1) * np.sum(dy * dy, axis=1)
+
+        return np.divide(
+            np.sum(dx * dy, axis=1),
+            np.sqrt(denom),
+            out=np.where(count < 2, 0.0, np.nan),
+            where=denom > 0,
+        )
+
+    def _lpm(self, order: int) -> np.ndarray:
+        return np.sum(self._downside**order, axis=1) / self._n
+
+    def _take(self, index: np.ndarray) -> np.ndarray:
+        index = np.clip(index, 0, max(self._sorted.shape[1] - 1, 0))
+
+        if not self._sorted.shape[1]:
+            return np.zeros(len(self))
+
+        return np.take_along_axis(self._sorted, index[:, None], axis=1)[:, 0]
+
+    def _percentile(self, q: np.ndarray) -> np.ndarray:
+        position = (self._count - 1) * q / 100
+        lower = position.astype(np.int64)
+        upper = np.minimum(lower + 1, self._count - 1)
+
+        low, high = self._take(lower), self._take(upper)
+
+        with np.errstate(invalid="ignore"):
+            return _gated(low + (high - low) * (position - lower), self._valid)
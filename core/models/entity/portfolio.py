@@ -3,13 +3,17 @@ from datetime import datetime
 from functools import cached_property
 
 import numpy as np
-from scipy.stats import kurtosis, norm, skew
+from scipy.stats import norm
 
-from ._base import Entity
+from ._base import CORE, Entity
+from ._stats import StreamingStats, sample_kurtosis, sample_skew
+from .window import RollingWindow
 
 TOTAL_TRADES_THRESHOLD = 3
 SMALL_NUMBER_THRESHOLD = np.finfo(float).eps
 GAMMA = 0.57721566
+SERIES_THRESHOLD = 0.5
+SERIES_TERMS = 24
 
 
 @Entity
@@ -19,10 +23,29 @@ class Performance:
     _periods_per_year: float = 252
     _mar: float = 0.0
     _confidence_level: float = 0.95
-    _pnl: np.array = field(default_factory=lambda: np.array([], dtype=np.float64))
-    _fee: np.array = field(default_factory=lambda: np.array([], dtype=np.float64))
+    _autocorr_lags: int = 1
     updated_at: float = field(default_factory=lambda: datetime.now().timestamp())
 
+    __fieldsets__ = {
+        CORE: ("total_trades", "total_pnl", "total_fee", "hit_ratio", "max_drawdown")
+    }
+
+    def __post_init__(self):
+        if "_stats" not in self.__dict__:
+            object.__setattr__(
+                self,
+                "_stats",
+                StreamingStats(self._account_size, self._mar, self._autocorr_lags),
+            )
+
+    @property
+    def _pnl(self) -> np.ndarray:
+        return self._stats.pnl
+
+    @property
+    def _fee(self) -> np.ndarray:
+        return self._stats.fee
+
     @property
     def equity(self):
         if not self.total_trades:
@@ -32,18 +55,18 @@ class Performance:
 
     @cached_property
     def total_trades(self) -> int:
-        return len(self._pnl)
+        return self._stats.count
 
     @cached_property
     def total_pnl(self) -> float:
-        return np.sum(self._pnl)
+        return self._stats.total
 
     @cached_property
     def average_pnl(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0.0
 
-        return np.mean(self._pnl) if len(self._pnl) >= 2 else 0.0
+        return self._stats.mean
 
     @property
     def profit(self):
@@ -61,38 +84,50 @@ class Performance:
 
     @cached_property
     def total_profit(self):
-        return np.sum(self.profit)
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        return self._stats.profit
 
     @cached_property
     def total_loss(self):
-        return np.sum(self.loss)
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        return self._stats.loss
 
     @cached_property
     def total_fee(self) -> float:
-        return np.sum(self._fee)
+        return self._stats.total_fee
 
     @cached_property
     def hit_ratio(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0.0
 
-        return np.sum(self._pnl > 0) / self.total_trades
+        return self._stats.wins / self.total_trades
 
     @cached_property
     def average_profit(self) -> float:
-        return np.mean(self.profit) if len(self.profit) >= 2 else 0.0
+        if self.total_trades < TOTAL_TRADES_THRESHOLD or self._stats.wins < 2:
+            return 0.0
+
+        return self._stats.profit / self._stats.wins
 
     @cached_property
     def average_loss(self) -> float:
-        return np.mean(self.loss) if len(self.loss) >= 2 else 0.0
+        if self.total_trades < TOTAL_TRADES_THRESHOLD or self._stats.losses < 2:
+            return 0.0
+
+        return self._stats.loss / self._stats.losses
 
     @cached_property
     def max_consecutive_wins(self) -> int:
-        return self._max_streak(self._pnl, True)
+        return self._stats.max_win_streak
 
     @cached_property
     def max_consecutive_losses(self) -> int:
-        return self._max_streak(self._pnl, False)
+        return self._stats.max_loss_streak
 
     @property
     def drawdown(self):
@@ -116,42 +151,48 @@ class Performance:
 
     @cached_property
     def max_runup(self) -> float:
-        return np.max(self.runup) if len(self.runup) >= 2 else 0.0
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        return self._stats.max_runup
 
     @cached_property
     def max_drawdown(self) -> float:
-        return np.max(self.drawdown) if len(self.drawdown) >= 2 else 0.0
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        return self._stats.max_drawdown
 
     @cached_property
     def skew(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0.0
 
-        return skew(self._pnl, bias=False)
+        return self._stats.skew
 
     @cached_property
     def kurtosis(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0.0
 
-        return kurtosis(self._pnl, bias=False)
+        return self._stats.kurtosis
 
     @cached_property
     def var(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0.0
 
-        pnl_sorted = np.sort(self._pnl)
         var_index = int((1.0 - self._confidence_level) * self.total_trades)
 
-        return pnl_sorted[var_index]
+        return self._stats.sorted[var_index]
 
     @cached_property
     def cvar(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0.0
 
-        pnl = self._pnl[self._pnl < self.var]
+        pnl_sorted = self._stats.sorted
+        pnl = pnl_sorted[: np.searchsorted(pnl_sorted, self.var, side="left")]
 
         return np.mean(pnl) if len(pnl) >= 2 else self.var
 
@@ -169,14 +210,14 @@ class Performance:
             - (1.0 / 36) * (2.0 * z**3 - 5.0 * z) * (self.skew**2)
         )
 
-        return -z_cf * np.std(self._pnl, ddof=1)
+        return -z_cf * self._stats.std
 
     @cached_property
     def cagr(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0.0
 
-        final_value = self.equity[-1]
+        final_value = self._stats.equity
         initial_value = self._account_size
 
         if initial_value == 0:
@@ -199,22 +240,22 @@ class Performance:
 
     @cached_property
     def average_daily_return(self) -> float:
-        return np.mean(self.daily_returns) if len(self.daily_returns) >= 2 else 0.0
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        return self._stats.mean / self._account_size
 
     @cached_property
     def time_weighted_return(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0.0
 
-        if len(self.equity) < 2:
-            return 0.0
-
-        initial_equity = self.equity[0]
+        initial_equity = self._stats.first_equity
 
         if initial_equity == 0:
             return 0.0
 
-        return (self.equity[-1] / initial_equity) - 1
+        return (self._stats.equity / initial_equity) - 1
 
     @cached_property
     def geometric_holding_period_return(self) -> float:
@@ -231,10 +272,7 @@ class Performance:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0.0
 
-        if np.any(self.profit < -1.0):
-            return 0.0
-
-        log_prod = np.sum(np.log(1.0 + self.profit))
+        log_prod = self._stats.log_profit
 
         return (
             np.exp(log_prod / self.total_trades) - 1.0
@@ -248,9 +286,10 @@ class Performance:
 
     @cached_property
     def daily_volatility(self) -> float:
-        return (
-            np.std(self.daily_returns, ddof=1) if len(self.daily_returns) >= 2 else 0.0
-        )
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        return self._stats.std / abs(self._account_size)
 
     @cached_property
     def ann_volatility(self) -> float:
@@ -275,7 +314,7 @@ class Performance:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0.0
 
-        std_return = np.std(self._pnl, ddof=1)
+        std_return = self._stats.std
 
         return (
             self.excess_return / std_return
@@ -288,8 +327,16 @@ class Performance:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0.0
 
-        std_return = np.std(self._pnl, ddof=1)
-        penalty = self._penalty(self._pnl)
+        std_return = self._stats.std
+
+        if self._autocorr_lags > 1:
+            penalty = self._lagged_penalty(
+                self._stats.autocorrelations, self.total_trades
+            )
+        else:
+            penalty = self._autocorr_penalty(
+                abs(self._stats.autocorrelation), self.total_trades
+            )
 
         denom = std_return * penalty
 
@@ -391,7 +438,7 @@ class Performance:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0.0
 
-        denom = -np.sum(self.drawdown) / len(self.drawdown)
+        denom = -self._stats.drawdown_sum / self.total_trades
 
         return self.excess_return / denom if denom > SMALL_NUMBER_THRESHOLD else 0.0
 
@@ -400,7 +447,7 @@ class Performance:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0.0
 
-        denom = np.sqrt(np.sum(np.square(self.drawdown)))
+        denom = np.sqrt(self._stats.drawdown_sq_sum)
 
         return self.excess_return / denom if denom > SMALL_NUMBER_THRESHOLD else 0.0
 
@@ -415,22 +462,14 @@ class Performance:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0.0
 
-        return (
-            1 - np.sum(self.drawdown < 0) / self._periods_per_year
-            if len(self.drawdown) >= 2
-            else 0.0
-        )
+        return 1 - self._stats.drawdown_below / self._periods_per_year
 
     @cached_property
     def ulcer_index(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0.0
 
-        return (
-            np.sqrt(np.mean(np.square(self.drawdown)))
-            if len(self.drawdown) >= 2
-            else 0.0
-        )
+        return np.sqrt(self._stats.drawdown_sq_sum / self.total_trades)
 
     @cached_property
     def upi(self) -> float:
@@ -510,10 +549,10 @@ class Performance:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0.0
 
-        pnl_sorted = np.sort(self._pnl)[::-1]
-        lower_level = np.percentile(pnl_sorted, 100 * (1.0 - self._confidence_level))
+        pnl_sorted = self._stats.sorted
+        lower_level = self._percentile(pnl_sorted, 100 * (1.0 - self._confidence_level))
 
-        shortfall = pnl_sorted[pnl_sorted <= lower_level]
+        shortfall = pnl_sorted[: np.searchsorted(pnl_sorted, lower_level, "right")]
 
         if len(shortfall) < 2:
             return 0.0
@@ -523,8 +562,8 @@ class Performance:
         if expected_shortfall < SMALL_NUMBER_THRESHOLD:
             return 0.0
 
-        upper_level = np.percentile(pnl_sorted, 100 * self._confidence_level)
-        upside = pnl_sorted[pnl_sorted >= upper_level]
+        upper_level = self._percentile(pnl_sorted, 100 * self._confidence_level)
+        upside = pnl_sorted[np.searchsorted(pnl_sorted, upper_level, "left") :]
 
         if len(upside) < 2:
             return 0.0
@@ -542,48 +581,91 @@ class Performance:
             return 0.0
 
         cutoff = 100 * self._confidence_level
+        pnl_sorted = self._stats.sorted
 
-        denom = np.percentile(self._pnl, 100 - cutoff)
+        denom = self._percentile(pnl_sorted, 100 - cutoff)
 
         return (
-            abs(np.percentile(self._pnl, cutoff) / denom)
+            abs(self._percentile(pnl_sorted, cutoff) / denom)
             if abs(denom) > SMALL_NUMBER_THRESHOLD
             else 0.0
         )
 
+    def rolling_window(self, size: int, duration: float = 0.0) -> RollingWindow:
+        return RollingWindow.from_history(
+            self._pnl, self._fee, size, duration, self._mar
+        )
+
     def next(self, pnl: float, fee: float) -> "Performance":
-        _pnl, _fee = np.append(self._pnl, pnl), np.append(self._fee, fee)
+        performance = replace(self, updated_at=datetime.now().timestamp())
+        object.__setattr__(performance, "_stats", self._stats.push(pnl, fee))
 
-        return replace(
-            self, _pnl=_pnl, _fee=_fee, updated_at=datetime.now().timestamp()
-        )
+        return performance
 
     @staticmethod
-    def _max_streak(pnl, winning: bool) -> int:
-        pnl_positive = pnl > 0
+    def _percentile(pnl_sorted: np.ndarray, q: float) -> float:
+        position = (len(pnl_sorted) - 1) * q / 100
+        lower = int(position)
+        upper = min(lower + 1, len(pnl_sorted) - 1)
+        weight = position - lower
+
+        return pnl_sorted[lower] + (pnl_sorted[upper] - pnl_sorted[lower]) * weight
 
-        mask = pnl_positive == winning
+    @staticmethod
+    def _autocorr_penalty(coef, num):
+        coef = np.asarray(coef, dtype=np.float64)
+        num = np.asarray(num, dtype=np.float64)
+        gap = 1.0 - coef
 
-        diff = np.diff(np.concatenate(([0], mask.astype(int), [0])))
-        streak_lengths = np.where(diff == -1)[0] - np.where(diff == 1)[0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            total = coef / gap - coef * (1.0 - coef**num) / (num * gap * gap)
 
-        return streak_lengths.max() if streak_lengths.size > 0 else 0
+        near = num * np.abs(gap) < SERIES_THRESHOLD
+
+        if np.any(near):
+            total = np.where(near, Performance._autocorr_series(gap, num), total)
+
+        penalty = np.where(
+            num < TOTAL_TRADES_THRESHOLD, 1.0, np.sqrt(1.0 + 2.0 * total)
+        )
+
+        return penalty if penalty.ndim else float(penalty)
 
     @staticmethod
-    def _penalty(pnl) -> float:
-        if len(pnl) < TOTAL_TRADES_THRESHOLD:
-            return 1
+    def _autocorr_series(gap: np.ndarray, num: np.ndarray) -> np.ndarray:
+        term = (num + 1.0) / 2.0
+        total = term - 1.0
+
+        for k in range(SERIES_TERMS):
+            term = term * (num - 1.0 - k) / (k + 3.0) * -gap
+            total = total + term
 
-        x = pnl[:-1]
-        y = pnl[1:]
-        y[0] += 1e-15
-        coef = np.abs(np.corrcoef(x, y)[0, 1])
-        num = len(pnl)
-        corr = [((num - x) / num) * coef**x for x in range(1, num)]
+        return total
 
-        return np.sqrt(1 + 2 * np.sum(corr))
+    @staticmethod
+    def _lagged_penalty(coefs, num):
+        coefs = np.asarray(coefs, dtype=np.float64)
+        num = np.asarray(num, dtype=np.float64)
+        lags = np.arange(1, coefs.shape[-1] + 1, dtype=np.float64)
+        size = num[..., None]
+
+        weights = np.where(lags < size, (size - lags) / size, 0.0)
+        total = np.sum(weights * coefs, axis=-1)
+
+        penalty = np.where(
+            num < TOTAL_TRADES_THRESHOLD,
+            1.0,
+            np.sqrt(np.maximum(1.0 + 2.0 * total, 0.0)),
+        )
+
+        return penalty if penalty.ndim else float(penalty)
 
     def _lpm(self, order: int) -> float:
+        lpm = (self._stats.lpm1, self._stats.lpm2, self._stats.lpm3)
+
+        if order <= len(lpm) and self.total_trades:
+            return lpm[order - 1] / self.total_trades
+
         downside = np.maximum(0, self._mar - self._pnl)
 
         return np.mean(downside**order)
@@ -592,3 +674,170 @@ class Performance:
         upside = np.maximum(0, self._pnl - self._mar)
 
         return np.mean(upside**order)
+
+
+@Entity
+class RollingPerformance:
+    window_trades: int
+    window_seconds: float
+    total_trades: int
+    total_pnl: float
+    total_fee: float
+    _mean: float
+    _m2: float
+    _m3: float
+    _m4: float
+    _wins: int
+    _profit: float
+    _losses: int
+    _loss: float
+    _log_profit: float
+    _lpm: tuple
+    _periods_per_year: float = 252
+    _mar: float = 0.0
+
+    @classmethod
+    def from_window(
+        cls, window: RollingWindow, periods_per_year: float = 252
+    ) -> "RollingPerformance":
+        return cls(
+            window.size,
+            window.duration,
+            window.count,
+            window.total,
+            window.total_fee,
+            window.mean,
+            window.m2,
+            window.m3,
+            window.m4,
+            window.wins,
+            window.profit,
+            window.losses,
+            window.loss,
+            window.log_profit,
+            (window.lpm1, window.lpm2, window.lpm3),
+            periods_per_year,
+            window.mar,
+        )
+
+    @cached_property
+    def average_pnl(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        return self._mean
+
+    @cached_property
+    def hit_ratio(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        return self._wins / self.total_trades
+
+    @cached_property
+    def average_profit(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD or self._wins < 2:
+            return 0.0
+
+        return self._profit / self._wins
+
+    @cached_property
+    def average_loss(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD or self._losses < 2:
+            return 0.0
+
+        return self._loss / self._losses
+
+    @cached_property
+    def profit_factor(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        gross_loss = abs(self._loss)
+
+        return self._profit / gross_loss if gross_loss > SMALL_NUMBER_THRESHOLD else 0.0
+
+    @cached_property
+    def expected_return(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        return (
+            np.exp(self._log_profit / self.total_trades) - 1.0
+            if self._log_profit > SMALL_NUMBER_THRESHOLD
+            else 0.0
+        )
+
+    @cached_property
+    def excess_return(self) -> float:
+        return self.average_pnl - self._mar
+
+    @cached_property
+    def skew(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        return sample_skew(self.total_trades, self._mean, self._m2, self._m3)
+
+    @cached_property
+    def kurtosis(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        return sample_kurtosis(self.total_trades, self._mean, self._m2, self._m4)
+
+    @cached_property
+    def sharpe_ratio(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        std_return = np.sqrt(self._m2 / (self.total_trades - 1))
+
+        return (
+            self.excess_return / std_return
+            if std_return > SMALL_NUMBER_THRESHOLD
+            else 0.0
+        )
+
+    @cached_property
+    def ann_sharpe_ratio(self) -> float:
+        return self.sharpe_ratio * np.sqrt(self._periods_per_year)
+
+    @cached_property
+    def omega_ratio(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        downside_risk = self._lpm[0] / self.total_trades
+
+        return (
+            (self.excess_return / downside_risk) + 1.0
+            if downside_risk > SMALL_NUMBER_THRESHOLD
+            else 0.0
+        )
+
+    @cached_property
+    def sortino_ratio(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        downside_risk = np.sqrt(self._lpm[1] / self.total_trades)
+
+        return (
+            self.excess_return / downside_risk
+            if downside_risk > SMALL_NUMBER_THRESHOLD
+            else 0.0
+        )
+
+    @cached_property
+    def kappa_three_ratio(self) -> float:
+        if self.total_trades < TOTAL_TRADES_THRESHOLD:
+            return 0.0
+
+        downside_risk = np.cbrt(self._lpm[2] / self.total_trades)
+
+        return (
+            self.excess_return / downside_risk
+            if downside_risk > SMALL_NUMBER_THRESHOLD
+            else 0.0
+        )
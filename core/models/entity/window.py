@@ -0,0 +1,147 @@
+import math
+
+import numpy as np
+
+from ._stats import add_moments, remove_moments
+
+
+class RollingWindow:
+    __slots__ = (
+        "size",
+        "duration",
+        "mar",
+        "pnl",
+        "fee",
+        "timestamp",
+        "head",
+        "count",
+        "evicted",
+        "mean",
+        "m2",
+        "m3",
+        "m4",
+        "total",
+        "total_fee",
+        "wins",
+        "profit",
+        "losses",
+        "loss",
+        "log_profit",
+        "lpm1",
+        "lpm2",
+        "lpm3",
+    )
+
+    def __init__(self, size: int, duration: float = 0.0, mar: float = 0.0):
+        self.size = max(int(size), 1)
+        self.duration = duration
+        self.mar = mar
+        self.pnl = np.zeros(self.size, dtype=np.float64)
+        self.fee = np.zeros(self.size, dtype=np.float64)
+        self.timestamp = np.zeros(self.size, dtype=np.float64)
+        self.head = self.count = self.evicted = 0
+        self._clear()
+
+    @classmethod
+    def from_history(
+        cls,
+        pnl: np.ndarray,
+        fee: np.ndarray,
+        size: int,
+        duration: float = 0.0,
+        mar: float = 0.0,
+    ) -> "RollingWindow":
+        window = cls(size, duration, mar)
+
+        for value, cost in zip(pnl[-window.size :], fee[-window.size :]):
+            window._add(float(value), float(cost), math.nan)
+
+        return window
+
+    @property
+    def values(self) -> np.ndarray:
+        return self.pnl[self._order()]
+
+    def push(self, pnl: float, fee: float, timestamp: float) -> None:
+        if self.count == self.size:
+            self._remove()
+
+        self._add(float(pnl), float(fee), float(timestamp))
+
+        if self.duration > 0:
+            cutoff = timestamp - self.duration
+
+            while self.count > 1 and not self._oldest_timestamp() >= cutoff:
+                self._remove()
+
+        if self.evicted >= self.size:
+            self._rebuild()
+
+    def _oldest_timestamp(self) -> float:
+        return self.timestamp[(self.head - self.count) % self.size]
+
+    def _add(self, pnl: float, fee: float, timestamp: float) -> None:
+        self.pnl[self.head] = pnl
+        self.fee[self.head] = fee
+        self.timestamp[self.head] = timestamp
+        self.head = (self.head + 1) % self.size
+
+        self.mean, self.m2, self.m3, self.m4 = add_moments(
+            self.count, self.mean, self.m2, self.m3, self.m4, pnl
+        )
+        self.count += 1
+        self._accumulate(pnl, fee, 1)
+
+    def _remove(self) -> None:
+        tail = (self.head - self.count) % self.size
+        pnl, fee = float(self.pnl[tail]), float(self.fee[tail])
+
+        self.mean, self.m2, self.m3, self.m4 = remove_moments(
+            self.count, self.mean, self.m2, self.m3, self.m4, pnl
+        )
+        self.count -= 1
+        self.evicted += 1
+        self._accumulate(pnl, fee, -1)
+
+    def _accumulate(self, pnl: float, fee: float, sign: int) -> None:
+        self.total += sign * pnl
+        self.total_fee += sign * fee
+
+        if pnl > 0:
+            self.wins += sign
+            self.profit += sign * pnl
+            self.log_profit += sign * math.log(1.0 + pnl)
+        elif pnl < 0:
+            self.losses += sign
+            self.loss += sign * pnl
+
+        downside = max(0.0, self.mar - pnl)
+        self.lpm1 += sign * downside
+        self.lpm2 += sign * downside**2
+        self.lpm3 += sign * downside**3
+
+    def _order(self) -> np.ndarray:
+        tail = (self.head - self.count) % self.size
+
+        return (tail + np.arange(self.count)) % self.size
+
+    def _rebuild(self) -> None:
+        order = self._order()
+        pnl, fee = self.pnl[order].tolist(), self.fee[order].tolist()
+
+        self._clear()
+
+        for value, cost in zip(pnl, fee):
+            self.mean, self.m2, self.m3, self.m4 = add_moments(
+                self.count, self.mean, self.m2, self.m3, self.m4, value
+            )
+            self.count += 1
+            self._accumulate(value, cost, 1)
+
+    def _clear(self) -> None:
+        self.count = self.evicted = 0
+        self.mean = self.m2 = self.m3 = self.m4 = 0.0
+        self.total = self.total_fee = 0.0
+        self.wins = self.losses = 0
+        self.profit = self.loss = self.log_profit = 0.0
+        self.lpm1 = self.lpm2 = self.lpm3 = 0.0
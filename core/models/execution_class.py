@@ -0,0 +1,7 @@
+from enum import Enum, auto
+
+
+class ExecutionClass(Enum):
+    INLINE = auto()
+    IO = auto()
+    CPU = auto()
@@ -4,3 +4,4 @@ from enum import Enum, auto
 class FeedType(Enum):
     HISTORICAL = auto()
     REALTIME = auto()
+    REPLAY = auto()
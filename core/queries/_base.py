@@ -1,6 +1,6 @@
 import asyncio
 from dataclasses import dataclass, field
-from typing import Generic, TypeVar, Union
+from typing import ClassVar, Generic, Hashable, Optional, TypeVar, Union
 
 from core.events._base import Event
 from core.events.meta import EventMeta
@@ -16,6 +16,15 @@ class Query(Generic[T], Event):
         default=None, init=False
     )
     meta: EventMeta = field(default_factory=lambda: EventMeta(priority=1), init=False)
+    cache_ttl: ClassVar[float] = 0.0
+
+    @property
+    def cache_key(self) -> Optional[Hashable]:
+        return None
+
+    @property
+    def cache_scope(self) -> Optional[Hashable]:
+        return None
 
     def set_response(self, response: Result):
         object.__setattr__(self, "_response", response)
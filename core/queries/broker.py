@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import ClassVar, Hashable, List, Optional
 
 from core.events._base import EventMeta
 from core.groups.query import QueryGroup
@@ -18,6 +18,11 @@ class GetSymbols(Query[List[Symbol]]):
         default_factory=lambda: EventMeta(priority=3, group=QueryGroup.broker),
         init=False,
     )
+    cache_ttl: ClassVar[float] = 300.0
+
+    @property
+    def cache_key(self) -> Optional[Hashable]:
+        return self.datasource, self.cap
 
 
 @dataclass(frozen=True)
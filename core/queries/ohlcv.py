@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import ClassVar, Hashable, List, Optional
 
 from core.events._base import EventMeta
 from core.groups.query import QueryGroup
@@ -43,6 +43,15 @@ class BatchBars(Query[List[OHLCV]]):
         default_factory=lambda: EventMeta(priority=4, group=QueryGroup.market),
         init=False,
     )
+    cache_ttl: ClassVar[float] = 60.0
+
+    @property
+    def cache_key(self) -> Optional[Hashable]:
+        return self.symbol, self.timeframe, self.ohlcv.timestamp, self.n
+
+    @property
+    def cache_scope(self) -> Optional[Hashable]:
+        return self.symbol, self.timeframe
 
 
 @dataclass(frozen=True)
@@ -66,3 +75,12 @@ class TA(Query[TechAnalysis]):
         default_factory=lambda: EventMeta(priority=2, group=QueryGroup.ta),
         init=False,
     )
+    cache_ttl: ClassVar[float] = 60.0
+
+    @property
+    def cache_key(self) -> Optional[Hashable]:
+        return self.symbol, self.timeframe, self.ohlcv.timestamp
+
+    @property
+    def cache_scope(self) -> Optional[Hashable]:
+        return self.symbol, self.timeframe
@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import ClassVar, Hashable, List, Optional, Tuple
 
 from core.events._base import EventMeta
 from core.groups.query import QueryGroup
+from core.models.entity.performance_batch import PerformanceBatch
 from core.models.entity.portfolio import Performance
 from core.models.strategy import Strategy
 from core.models.symbol import Symbol
@@ -28,3 +29,21 @@ class GetPortfolioPerformance(Query[Performance]):
         default_factory=lambda: EventMeta(priority=2, group=QueryGroup.portfolio),
         init=False,
     )
+    cache_ttl: ClassVar[float] = 300.0
+
+    @property
+    def cache_key(self) -> Optional[Hashable]:
+        return self.symbol, self.timeframe, self.strategy
+
+    @property
+    def cache_scope(self) -> Optional[Hashable]:
+        return self.cache_key
+
+
+@dataclass(frozen=True)
+class GetPortfolioPerformanceBatch(Query[PerformanceBatch]):
+    keys: Tuple[Tuple[Symbol, Timeframe, Strategy], ...]
+    meta: EventMeta = field(
+        default_factory=lambda: EventMeta(priority=2, group=QueryGroup.portfolio),
+        init=False,
+    )
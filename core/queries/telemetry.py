@@ -0,0 +1,15 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+from core.events._base import EventMeta
+from core.groups.query import QueryGroup
+
+from ._base import Query
+
+
+@dataclass(frozen=True)
+class GetBusMetrics(Query[Dict[str, Any]]):
+    meta: EventMeta = field(
+        default_factory=lambda: EventMeta(priority=1, group=QueryGroup.telemetry),
+        init=False,
+    )
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from typing import Optional
 
 from core.events.meta import EventMeta
 from core.groups.tasks import TasksGroup
@@ -25,8 +26,17 @@ class FeedTask(Task):
 class StartHistoricalFeed(FeedTask):
     in_sample: Lookback
     out_sample: Lookback | None
+    since: Optional[int] = None
 
 
 @dataclass(frozen=True)
 class StartRealtimeFeed(FeedTask):
     pass
+
+
+@dataclass(frozen=True)
+class StartReplayFeed(FeedTask):
+    start: Optional[int] = None
+    end: Optional[int] = None
+    speed: float = 0.0
+    orders: bool = False
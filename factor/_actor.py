@@ -17,7 +17,11 @@ from core.models.symbol import Symbol
 from core.models.timeframe import Timeframe
 from core.queries.broker import GetSymbols
 from core.queries.factor import GetGeneration
-from core.queries.portfolio import GetPortfolioPerformance
+from core.queries.portfolio import (
+    GetPortfolioPerformance,
+    GetPortfolioPerformanceBatch,
+)
+from infrastructure.checkpoint import Checkpointer
 
 from .generator import PopulationGenerator
 
@@ -62,6 +66,12 @@ class FactorActor(BaseActor, EventHandlerMixin):
         self.reset_percentage = self.config.get("reset_percentage", 0.2)
         self.stability_percentage = self.config.get("stability_percentage", 0.3)
 
+    def on_start(self):
+        Checkpointer().register("factor", self.state)
+
+    def on_stop(self):
+        Checkpointer().unregister("factor", self.state)
+
     async def on_receive(self, event: FactorEvent):
         return await self.handle_event(event)
 
@@ -141,26 +151,40 @@ class FactorActor(BaseActor, EventHandlerMixin):
         )
 
     async def _evaluate_fitness(self, population: List[Individual]) -> None:
+        result = await self.ask(
+            GetPortfolioPerformanceBatch(
+                tuple((ind.symbol, ind.timeframe, ind.strategy) for ind in population)
+            )
+        )
+
+        if result.is_ok():
+            fitness = result.unwrap().deflated_sharpe_ratio
+
+            for ind, value in zip(population, fitness, strict=True):
+                ind.update_fitness(float(value))
+        else:
+            logger.warning(
+                f"Batch fitness evaluation failed: {result.unwrap_err()}. "
+                "Falling back to per-individual evaluation."
+            )
+            await self._evaluate_fitness_individually(population)
+
+        population[:] = [ind for ind in population if ind.fitness > 0]
+
+    async def _evaluate_fitness_individually(
+        self, population: List[Individual]
+    ) -> None:
         tasks = [
             self.ask(GetPortfolioPerformance(ind.symbol, ind.timeframe, ind.strategy))
             for ind in population
         ]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        for idx, result in enumerate(results):
-            ind = population[idx]
-
-            if isinstance(result, Exception):
-                continue
-
-            if result.is_err():
+        for ind, result in zip(population, results, strict=True):
+            if isinstance(result, Exception) or result.is_err():
                 continue
 
-            portfolio = result.unwrap()
-
-            ind.update_fitness(portfolio.deflated_sharpe_ratio)
-
-        population[:] = [ind for ind in population if ind.fitness > 0]
+            ind.update_fitness(result.unwrap().deflated_sharpe_ratio)
 
     def _select_elite_and_parents(
         self, population: List[Individual]
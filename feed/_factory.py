@@ -8,6 +8,7 @@ from core.models.timeframe import Timeframe
 
 from ._historical import HistoricalActor
 from ._realtime import RealtimeActor
+from ._replay import ReplayActor
 
 
 class FeedActorFactory(AbstractFeedActorFactory):
@@ -26,22 +27,24 @@ class FeedActorFactory(AbstractFeedActorFactory):
         timeframe: Timeframe,
         datasource: DataSourceType,
     ):
-        actor = (
-            HistoricalActor(
+        if feed == FeedType.REPLAY:
+            actor = ReplayActor(symbol, timeframe, datasource, self.config_service)
+        elif feed == FeedType.HISTORICAL:
+            actor = HistoricalActor(
                 symbol,
                 timeframe,
                 datasource,
                 self.datasource_factory,
                 self.config_service,
             )
-            if feed == FeedType.HISTORICAL
-            else RealtimeActor(
+        else:
+            actor = RealtimeActor(
                 symbol,
                 timeframe,
                 datasource,
                 self.datasource_factory,
                 self.config_service,
             )
-        )
+
         actor.start()
         return actor
@@ -46,6 +46,7 @@ class HistoricalActor(FeedActor):
             msg.out_sample,
             self.config.get("batch_size", 100),
             lambda data: Bar(OHLCV.from_list(data), True),
+            msg.since,
         ) as stream:
             async for batch in self.batched(stream, self.config.get("buff_size", 8)):
                 yield batch
@@ -61,22 +62,23 @@ class HistoricalActor(FeedActor):
         await self._handle_market(batch)
 
     async def _handle_market(self, batch: List[Bar]) -> None:
-        for bar in batch:
-            await self.tell(
+        await self.tell_many(
+            [
                 NewMarketDataReceived(self.symbol, self.timeframe, self.datasource, bar)
-            )
+                for bar in batch
+            ]
+        )
 
     async def _outbox(self, batch: List[Bar]) -> None:
         async with self.bp:
-            tasks = [
-                self.ask(
-                    IngestMarketData(self.symbol, self.timeframe, self.datasource, bar)
-                )
+            commands = [
+                IngestMarketData(self.symbol, self.timeframe, self.datasource, bar)
                 for bar in batch
                 if bar.closed
             ]
 
-            await asyncio.gather(*tasks)
+            if commands:
+                await self.ask_many(commands)
 
     @staticmethod
     async def batched(stream: AsyncIterator[Bar], batch_size: int):
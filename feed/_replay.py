@@ -0,0 +1,147 @@
+import asyncio
+from typing import Any, Iterable, List, Tuple
+
+from core.actors import FeedActor
+from core.actors.decorators import Consumer, Producer
+from core.commands.market import IngestMarketData
+from core.events._base import Event
+from core.events.market import NewMarketDataReceived, NewMarketOrderReceived
+from core.groups.event import EventGroup
+from core.interfaces.abstract_config import AbstractConfig
+from core.models.datasource_type import DataSourceType
+from core.models.entity.bar import Bar
+from core.models.entity.order import Order
+from core.models.symbol import Symbol
+from core.models.timeframe import Timeframe
+from core.tasks.feed import StartReplayFeed
+from infrastructure.event_store import EventStore
+from infrastructure.event_store.event_decoder import decode_bar, decode_order
+
+Tape = List[Tuple[int, Any]]
+
+
+def _replayed(events: Iterable[Event]) -> List[Event]:
+    events = list(events)
+
+    for event in events:
+        event.meta.replayed = True
+
+    return events
+
+
+class ReplayActor(FeedActor):
+    def __init__(
+        self,
+        symbol: Symbol,
+        timeframe: Timeframe,
+        datasource: DataSourceType,
+        config_service: AbstractConfig,
+    ):
+        super().__init__(symbol, timeframe, datasource)
+        self.store = EventStore(config_service)
+        self.config = config_service.get("feed")
+        self.bp = asyncio.Semaphore(10)
+
+    async def on_receive(self, msg: StartReplayFeed):
+        await self.collector.start(msg)
+        await self.collector.wait_for_completion()
+
+    @Producer
+    async def _tape_producer(self, msg: StartReplayFeed):
+        tape = await asyncio.to_thread(self._load_tape, msg)
+        batch_size = 1 if msg.speed > 0 else self.config.get("buff_size", 8)
+        batch, clock = [], None
+
+        for timestamp, item in tape:
+            if batch and (
+                len(batch) >= batch_size or type(batch[-1]) is not type(item)
+            ):
+                yield batch
+                batch = []
+
+            if msg.speed > 0 and clock is not None and timestamp > clock:
+                await asyncio.sleep((timestamp - clock) / 1000 / msg.speed)
+
+            clock = timestamp
+            batch.append(item)
+
+        if batch:
+            yield batch
+
+    @Consumer
+    async def _consumer(self, data: List[Any]):
+        match data:
+            case [Bar(), *_]:
+                await self._outbox(data)
+                await self.tell_many(
+                    _replayed(
+                        NewMarketDataReceived(
+                            self.symbol, self.timeframe, self.datasource, bar
+                        )
+                        for bar in data
+                    )
+                )
+
+            case [Order(), *_]:
+                await self.tell_many(
+                    _replayed(
+                        NewMarketOrderReceived(
+                            self.symbol, self.timeframe, self.datasource, order
+                        )
+                        for order in data
+                    )
+                )
+
+    async def _outbox(self, batch: List[Bar]) -> None:
+        async with self.bp:
+            commands = [
+                IngestMarketData(self.symbol, self.timeframe, self.datasource, bar)
+                for bar in batch
+                if bar.closed
+            ]
+
+            if commands:
+                await self.ask_many(commands)
+
+    def _load_tape(self, msg: StartReplayFeed) -> Tape:
+        types = [NewMarketDataReceived]
+
+        if msg.orders:
+            types.append(NewMarketOrderReceived)
+
+        timeframe, datasource = str(self.timeframe), str(self.datasource)
+        tape = {}
+
+        for record in self.store.query(str(EventGroup.market), types, [self.symbol]):
+            if record["timeframe"] != timeframe or record["datasource"] != datasource:
+                continue
+
+            if "bar" in record:
+                item = decode_bar(record["bar"])
+                timestamp = item.ohlcv.timestamp
+                key = (
+                    timestamp,
+                    item.closed,
+                    item.ohlcv.open,
+                    item.ohlcv.high,
+                    item.ohlcv.low,
+                    item.ohlcv.close,
+                    item.ohlcv.volume,
+                )
+            else:
+                item = decode_order(record["order"])
+                timestamp = int(item.timestamp * 1000)
+                key = (item.id, item.status)
+
+            if msg.start is not None and timestamp < msg.start:
+                continue
+
+            if msg.end is not None and timestamp > msg.end:
+                continue
+
+            tape.setdefault(key, (timestamp, item))
+
+        return sorted(
+            tape.values(),
+            key=lambda entry: (entry[0], isinstance(entry[1], Bar) and entry[1].closed),
+        )
@@ -16,6 +16,7 @@ class AsyncHistoricalData:
         out_sample: Lookback,
         batch_size: int,
         parse_fn=None,
+        since: int | None = None,
     ):
         self.exchange = exchange
         self.symbol = symbol
@@ -23,6 +24,7 @@ class AsyncHistoricalData:
         self.in_sample = in_sample
         self.out_sample = out_sample
         self.batch_size = batch_size
+        self.since = since
         self.iterator = None
         self.sentinel = object()
         self.parse_fn = parse_fn or self._default_parse
@@ -34,6 +36,7 @@ class AsyncHistoricalData:
             self.in_sample,
             self.out_sample,
             self.batch_size,
+            self.since,
         )
         return self
 
@@ -0,0 +1,161 @@
+import asyncio
+import logging
+import os
+import pickle
+import struct
+import time
+import zlib
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from core.interfaces.abstract_config import AbstractConfig
+from infrastructure.event_store.event_store import SingletonMeta
+from infrastructure.telemetry.metrics import MetricsRegistry
+
+if TYPE_CHECKING:
+    from core.actors.state import InMemory
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"QCKP"
+_HEADER = struct.Struct("<4sBd")
+_VERSION = 1
+
+
+class Checkpointer(metaclass=SingletonMeta):
+    def __init__(
+        self,
+        config_service: AbstractConfig = None,
+        metrics: MetricsRegistry = None,
+    ):
+        config = (config_service.get("checkpoint") if config_service else None) or {}
+        store = (config_service.get("store") if config_service else None) or {}
+
+        self.path = os.path.join(
+            store.get("base_dir") or ".", config.get("file", "checkpoint.bin")
+        )
+        self.interval = config.get("interval", 0)
+        self.metrics = metrics or MetricsRegistry()
+        self.created_at: Optional[float] = None
+
+        self._states: Dict[str, "InMemory"] = {}
+        self._pending: Dict[str, Dict[Any, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._save_time = self.metrics.histogram("checkpoint_save")
+        self._size = self.metrics.gauge("checkpoint_bytes")
+
+        if config.get("restore", 0):
+            self.restore()
+
+    @property
+    def restored(self) -> bool:
+        return self.created_at is not None
+
+    def register(self, name: str, state: "InMemory") -> bool:
+        if self._states.setdefault(name, state) is not state:
+            return False
+
+        data = self._pending.pop(name, None)
+
+        if data is not None:
+            state.load(data)
+
+        return True
+
+    def unregister(self, name: str, state: "InMemory") -> None:
+        if self._states.get(name) is state:
+            del self._states[name]
+
+    def restore(self) -> bool:
+        try:
+            with open(self.path, "rb") as f:
+                magic, version, created_at = _HEADER.unpack(f.read(_HEADER.size))
+                body = f.read()
+
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f"Unsupported checkpoint format: {magic!r} v{version}")
+
+            snapshot = pickle.loads(zlib.decompress(body))
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.error(f"Failed to restore checkpoint {self.path}: {e}")
+            return False
+
+        for name, blob in snapshot.items():
+            try:
+                data = pickle.loads(blob)
+            except Exception as e:
+                logger.warning(f"Skipping state {name} in checkpoint: {e}")
+                continue
+
+            state = self._states.get(name)
+
+            if state is None:
+                self._pending[name] = data
+            else:
+                state.load(data)
+
+        self.created_at = created_at
+
+        logger.info(f"Restored {len(snapshot)} states from {self.path}")
+
+        return True
+
+    async def save(self) -> None:
+        start = time.perf_counter()
+        created_at = time.time()
+        snapshot = {}
+
+        for name, state in self._states.items():
+            try:
+                snapshot[name] = pickle.dumps(state.dump(), pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                logger.warning(f"Skipping state {name} in checkpoint: {e}")
+
+        if self._pending:
+            logger.warning(
+                f"Dropping {len(self._pending)} unclaimed checkpoint states: "
+                f"{', '.join(sorted(self._pending))}"
+            )
+            self._pending = {}
+
+        size = await asyncio.to_thread(self._write, snapshot, created_at)
+
+        self._size.set(size)
+        self._save_time.record(time.perf_counter() - start)
+
+    def start(self) -> None:
+        if self.interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        if self.interval > 0:
+            await self.save()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+
+            try:
+                await self.save()
+            except Exception as e:
+                logger.error(f"Failed to write checkpoint {self.path}: {e}")
+
+    def _write(self, snapshot: Dict[str, bytes], created_at: float) -> int:
+        body = zlib.compress(pickle.dumps(snapshot, pickle.HIGHEST_PROTOCOL))
+
+        tmp = f"{self.path}.tmp"
+
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, created_at))
+            f.write(body)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp, self.path)
+
+        return _HEADER.size + len(body)
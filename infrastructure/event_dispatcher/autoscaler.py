@@ -0,0 +1,58 @@
+import time
+from typing import Callable, List, Optional
+
+from .event_worker import EventWorker
+
+
+class WorkerAutoscaler:
+    def __init__(
+        self,
+        min_workers: int,
+        max_workers: int,
+        target_latency: float = 0.05,
+        idle_timeout: float = 30.0,
+        interval: float = 1.0,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.min_workers = max(1, min_workers)
+        self.max_workers = max(self.min_workers, max_workers)
+        self.target_latency = target_latency
+        self.idle_timeout = idle_timeout
+        self.interval = interval
+        self._timer = timer
+
+    def decide(self, group_workers: List[EventWorker]) -> int:
+        n = len(group_workers)
+
+        if n < self.min_workers:
+            return 1
+
+        backlog = sum(worker.qsize for worker in group_workers)
+
+        if backlog > n:
+            service_time = max(worker.service_time for worker in group_workers)
+
+            if n < self.max_workers and (
+                service_time == 0.0 or backlog * service_time / n > self.target_latency
+            ):
+                return 1
+
+            return 0
+
+        if n > self.min_workers and self.retiree(group_workers) is not None:
+            return -1
+
+        return 0
+
+    def retiree(self, group_workers: List[EventWorker]) -> Optional[EventWorker]:
+        now = self._timer()
+        idle = [
+            worker
+            for worker in group_workers
+            if worker.idle and now - worker.last_active > self.idle_timeout
+        ]
+
+        if not idle:
+            return None
+
+        return min(idle, key=lambda worker: worker.last_active)
@@ -0,0 +1,77 @@
+import asyncio
+import itertools
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Set, Tuple
+
+
+class DeadlineWatchdog:
+    def __init__(
+        self,
+        timeout: float,
+        resolution: float = 0.1,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.timeout = timeout
+        self._resolution = min(resolution, timeout)
+        self._timer = timer
+        self._tokens = itertools.count()
+        self._deadlines: Dict[int, Tuple[asyncio.Task, float]] = {}
+        self._order: Deque[int] = deque()
+        self._expired: Set[int] = set()
+        self._sweeper: Optional[asyncio.TimerHandle] = None
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def arm(self, task: asyncio.Task) -> int:
+        token = next(self._tokens)
+        self._deadlines[token] = (task, self._timer() + self.timeout)
+        self._order.append(token)
+
+        if len(self._order) > 2 * len(self._deadlines) + 64:
+            self._order = deque(self._deadlines)
+
+        if self._sweeper is None:
+            self._sweeper = asyncio.get_running_loop().call_later(
+                self._resolution, self._sweep
+            )
+
+        return token
+
+    def disarm(self, token: int) -> bool:
+        if self._deadlines.pop(token, None) is not None:
+            return False
+
+        if token in self._expired:
+            self._expired.remove(token)
+            return True
+
+        return False
+
+    def _sweep(self) -> None:
+        now = self._timer()
+
+        while self._order:
+            token = self._order[0]
+            entry = self._deadlines.get(token)
+
+            if entry is not None:
+                task, deadline = entry
+
+                if deadline > now:
+                    break
+
+                del self._deadlines[token]
+                self._expired.add(token)
+                task.cancel()
+
+            self._order.popleft()
+
+        if self._deadlines:
+            self._sweeper = asyncio.get_running_loop().call_later(
+                self._resolution, self._sweep
+            )
+        else:
+            self._order.clear()
+            self._sweeper = None
@@ -0,0 +1,57 @@
+from typing import Dict, Hashable, Tuple
+
+from core.events._base import Event
+from infrastructure.telemetry.metrics import MetricsRegistry
+
+
+class EventConflator:
+    def __init__(self, metrics: MetricsRegistry = None, name: str = "default"):
+        self._metrics = metrics or MetricsRegistry()
+        self._name = name
+        self._open: Dict[Tuple[type, Hashable], Event] = {}
+        self._latest: Dict[Hashable, Event] = {}
+
+    def __len__(self) -> int:
+        return len(self._latest)
+
+    def offer(self, event: Event) -> bool:
+        key = event.conflation_key
+
+        if key is None:
+            return True
+
+        key = type(event), key
+        head = self._open.get(key)
+
+        if not event.conflatable:
+            if head is not None:
+                del self._open[key]
+            return True
+
+        if head is not None:
+            self._latest[head.meta.key] = event
+            self._metrics.counter(
+                "conflated", pool=self._name, event=type(event).__name__
+            ).inc()
+            return False
+
+        self._open[key] = event
+        self._latest[event.meta.key] = event
+
+        return True
+
+    def take(self, event: Event) -> Event:
+        if not self._latest:
+            return event
+
+        latest = self._latest.pop(event.meta.key, None)
+
+        if latest is None:
+            return event
+
+        key = type(event), event.conflation_key
+
+        if self._open.get(key) is event:
+            del self._open[key]
+
+        return latest
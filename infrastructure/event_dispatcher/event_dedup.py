@@ -1,37 +1,89 @@
-import asyncio
-import hashlib
-
-from cachetools import TTLCache
+import math
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Hashable, List
 
 from core.events._base import Event
 
 
 class EventDedup:
-    def __init__(self, ttl: int = 30, maxsize: int = 2048):
-        self._caches = [TTLCache(maxsize=maxsize // 4, ttl=ttl) for _ in range(4)]
-        self._locks = [asyncio.Lock() for _ in range(4)]
+    def __init__(
+        self,
+        ttl: int = 30,
+        maxsize: int = 2048,
+        resolution: float = 1.0,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self._maxsize = maxsize
+        self._resolution = resolution
+        self._timer = timer
+        self._ttl_ticks = max(1, math.ceil(ttl / resolution)) + 1
+        self._slots = self._ttl_ticks + 1
+        self._wheel: List[Dict[Hashable, None]] = [{} for _ in range(self._slots)]
+        self._entries: Dict[Hashable, int] = {}
+        self._order: Deque[Hashable] = deque()
+        self._tick = self._now()
 
-    def _get_shard(self, key: str):
-        shard_index = int(hashlib.sha256(key.encode()).hexdigest(), 16) % len(
-            self._caches
-        )
-        return self._caches[shard_index], self._locks[shard_index]
+    def __len__(self) -> int:
+        return len(self._entries)
 
     async def acquire(self, event: Event) -> bool:
-        key = event.meta.key
-        shard, lock = self._get_shard(key)
+        return self._acquire(event.meta.key, self._advance())
+
+    async def acquire_many(self, events: List[Event]) -> List[Event]:
+        tick = self._advance()
+        return [event for event in events if self._acquire(event.meta.key, tick)]
 
-        async with lock:
-            if key in shard:
-                return False
+    async def release(self, event: Event) -> None:
+        self._remove(event.meta.key)
 
-            shard[key] = True
+    def _acquire(self, key: Hashable, tick: int) -> bool:
+        if key in self._entries:
+            return False
 
-            return True
+        while len(self._entries) >= self._maxsize:
+            self._remove(self._order.popleft())
 
-    async def release(self, event: Event) -> None:
-        key = event.meta.key
-        shard, lock = self._get_shard(key)
+        if len(self._order) > 2 * self._maxsize:
+            self._order = deque(self._entries)
+
+        expiry = tick + self._ttl_ticks
+        self._entries[key] = expiry
+        self._order.append(key)
+        self._wheel[expiry % self._slots][key] = None
+
+        return True
+
+    def _remove(self, key: Hashable) -> None:
+        expiry = self._entries.pop(key, None)
+
+        if expiry is not None:
+            self._wheel[expiry % self._slots].pop(key, None)
+
+    def _advance(self) -> int:
+        now = self._now()
+
+        if now == self._tick:
+            return now
+
+        if now - self._tick >= self._slots:
+            self._entries.clear()
+            self._order.clear()
+
+            for bucket in self._wheel:
+                bucket.clear()
+        else:
+            for tick in range(self._tick + 1, now + 1):
+                bucket = self._wheel[tick % self._slots]
+
+                for key in bucket:
+                    del self._entries[key]
+
+                bucket.clear()
+
+        self._tick = now
+
+        return now
 
-        async with lock:
-            shard.pop(key, None)
+    def _now(self) -> int:
+        return int(self._timer() / self._resolution)
@@ -1,15 +1,25 @@
 import asyncio
-from typing import Callable, Optional, Type, Union
+import os
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 
 from core.commands._base import Command
 from core.events._base import Event, EventEnded
+from core.events.meta import use_compact_meta
 from core.interfaces.abstract_config import AbstractConfig
 from core.queries._base import Query
+from core.queries.telemetry import GetBusMetrics
 from core.result import Result
 from core.tasks._base import Task
+from infrastructure.checkpoint import Checkpointer
 from infrastructure.event_store import EventStore
+from infrastructure.executors import ExecutorService
+from infrastructure.telemetry import MetricsRegistry, MetricsReporter
 
-from .event_handler import EventHandler
+from .autoscaler import WorkerAutoscaler
+from .event_handler import EventHandler, Route
+from .query_cache import QueryCache
+from .scheduler import create_scheduler
 from .worker_pool import WorkerPool
 
 
@@ -26,15 +36,30 @@ class EventDispatcher(metaclass=SingletonMeta):
     def __init__(self, config_service: AbstractConfig):
         self.config = config_service.get("bus")
 
-        self._event_handler = EventHandler(self.config.get("timeout", 10))
+        use_compact_meta(bool(self.config.get("compact_meta", 0)))
+
+        self.metrics = MetricsRegistry()
+        self.executors = ExecutorService(config_service, self.metrics)
+        self._event_handler = EventHandler(
+            self.config.get("timeout", 10), self.metrics, self.executors
+        )
         self._cancel_event = asyncio.Event()
-        self._store = EventStore(config_service)
+        self._query_cache = self._create_query_cache()
+        self._store = EventStore(config_service, self.metrics)
+        self.checkpointer = Checkpointer(config_service, self.metrics)
 
         self._command_worker_pool = None
         self._query_worker_pool = None
         self._event_worker_pool = None
         self._task_worker_pool = None
 
+        self._route_keys = Counter()
+
+        self._event_handler.register(GetBusMetrics, self._get_bus_metrics)
+        self._reporter = self._create_reporter(config_service)
+        self._reporter.start()
+        self.checkpointer.start()
+
     @property
     def command_worker_pool(self):
         return self._get_worker_pool("_command_worker_pool")
@@ -45,7 +70,11 @@ class EventDispatcher(metaclass=SingletonMeta):
 
     @property
     def event_worker_pool(self):
-        return self._get_worker_pool("_event_worker_pool")
+        return self._get_worker_pool(
+            "_event_worker_pool",
+            bool(self.config.get("partitioned", 0)),
+            bool(self.config.get("conflate", 0)),
+        )
 
     @property
     def task_worker_pool(self):
@@ -56,19 +85,52 @@ class EventDispatcher(metaclass=SingletonMeta):
         event_class: Type[Event],
         handler: Callable,
         filter_func: Optional[Callable[[Event], bool]] = None,
+        route: Optional[Route] = None,
     ) -> None:
-        self._event_handler.register(event_class, handler, filter_func)
+        self._event_handler.register(event_class, handler, filter_func, route)
 
-    def unregister(self, event_class: Type[Event], handler: Callable) -> None:
-        self._event_handler.unregister(event_class, handler)
+        if route is not None:
+            self._update_route_keys(route[1], 1)
+
+    def unregister(
+        self,
+        event_class: Type[Event],
+        handler: Callable,
+        route: Optional[Route] = None,
+    ) -> None:
+        self._event_handler.unregister(event_class, handler, route)
+
+        if route is not None:
+            self._update_route_keys(route[1], -1)
 
     async def execute(self, command: Command, *args, **kwargs) -> Result:
-        await self._dispatch_to_poll(command, self.command_worker_pool, *args, **kwargs)
+        if not await self.command_worker_pool.dispatch_direct(command, *args, **kwargs):
+            await self._dispatch_to_poll(
+                command, self.command_worker_pool, *args, **kwargs
+            )
         return await command.wait_for_execution()
 
     async def query(self, query: Query, *args, **kwargs) -> Result:
-        await self._dispatch_to_poll(query, self.query_worker_pool, *args, **kwargs)
-        return await query.wait_for_response()
+        cache = self._query_cache if query.cache_key is not None else None
+
+        if cache is not None:
+            cached = cache.get(query)
+
+            if cached is not None:
+                query.set_response(cached)
+                return cached
+
+            generation = cache.generation(query)
+
+        if not await self.query_worker_pool.dispatch_direct(query, *args, **kwargs):
+            await self._dispatch_to_poll(query, self.query_worker_pool, *args, **kwargs)
+
+        result = await query.wait_for_response()
+
+        if cache is not None:
+            cache.put(query, result, generation)
+
+        return result
 
     async def run(self, task: Task, *args, **kwargs) -> None:
         await self._dispatch_to_poll(task, self.task_worker_pool, *args, **kwargs)
@@ -76,7 +138,34 @@ class EventDispatcher(metaclass=SingletonMeta):
 
     async def dispatch(self, event: Event, *args, **kwargs) -> None:
         await self._dispatch_to_poll(event, self.event_worker_pool, *args, **kwargs)
-        self._store.append(event)
+
+        if not event.meta.replayed:
+            await self._store.append(event)
+
+    async def execute_many(
+        self, commands: List[Command], *args, **kwargs
+    ) -> List[Result]:
+        await self._dispatch_many_to_pool(
+            commands, self.command_worker_pool, *args, **kwargs
+        )
+        return await asyncio.gather(
+            *(command.wait_for_execution() for command in commands)
+        )
+
+    async def query_many(self, queries: List[Query], *args, **kwargs) -> List[Result]:
+        await self._dispatch_many_to_pool(
+            queries, self.query_worker_pool, *args, **kwargs
+        )
+        return await asyncio.gather(*(query.wait_for_response() for query in queries))
+
+    async def dispatch_many(self, events: List[Event], *args, **kwargs) -> None:
+        await self._dispatch_many_to_pool(
+            events, self.event_worker_pool, *args, **kwargs
+        )
+        stored = [event for event in events if not event.meta.replayed]
+
+        if stored:
+            await self._store.append_many(stored)
 
     async def wait(self) -> None:
         await asyncio.gather(
@@ -97,7 +186,10 @@ class EventDispatcher(metaclass=SingletonMeta):
                 self._dispatch_to_poll(EventEnded(), self.task_worker_pool),
             ]
         )
+        self._reporter.stop()
+        await self.checkpointer.stop()
         self._store.close()
+        self.executors.shutdown()
 
     async def _dispatch_to_poll(
         self,
@@ -113,16 +205,104 @@ class EventDispatcher(metaclass=SingletonMeta):
         else:
             raise ValueError(f"Invalid event type: {type(event)}")
 
-    def _create_worker_pool(self) -> WorkerPool:
-        return WorkerPool(
+    async def _dispatch_many_to_pool(
+        self,
+        events: List[Union[Event, Command, Query]],
+        worker_pool: WorkerPool,
+        *args,
+        **kwargs,
+    ) -> None:
+        for event in events:
+            if not isinstance(event, (Command, Query, Event)) or isinstance(
+                event, (EventEnded, Task)
+            ):
+                raise ValueError(f"Invalid event type: {type(event)}")
+
+        await worker_pool.dispatch_many(events, *args, **kwargs)
+
+    def _update_route_keys(self, key, delta: int) -> None:
+        self._route_keys[key] += delta
+
+        if self._route_keys[key] <= 0:
+            del self._route_keys[key]
+        elif self._route_keys[key] != delta:
+            return
+
+        if self._event_worker_pool is not None:
+            self._event_worker_pool.rebalance(self._route_keys)
+
+    async def _get_bus_metrics(self, _query: GetBusMetrics) -> Dict[str, Any]:
+        return self.metrics.snapshot()
+
+    def _create_reporter(self, config_service: AbstractConfig) -> MetricsReporter:
+        config = config_service.get("telemetry") or {}
+        path = None
+
+        if config.get("sink", "log") == "file":
+            path = os.path.join(
+                config_service.get("store")["base_dir"],
+                config.get("file", "bus_metrics.jsonl"),
+            )
+
+        return MetricsReporter(
+            self.metrics, config.get("interval", 0), path, config.get("top_n", 5)
+        )
+
+    def _create_query_cache(self) -> Optional[QueryCache]:
+        maxsize = self.config.get("query_cache", 0)
+
+        if not maxsize:
+            return None
+
+        cache = QueryCache(maxsize, self.metrics)
+        self._event_handler.on_handled = cache.invalidate
+
+        return cache
+
+    def _create_autoscaler(self) -> Optional[WorkerAutoscaler]:
+        if not self.config.get("autoscale", 0):
+            return None
+
+        return WorkerAutoscaler(
+            self.config.get("min_workers", 1),
+            self.config["num_workers"],
+            self.config.get("scale_latency", 0.05),
+            self.config.get("idle_timeout", 30),
+            self.config.get("scale_interval", 1),
+        )
+
+    def _create_worker_pool(
+        self, name: str, partitioned: bool = False, conflate: bool = False
+    ) -> WorkerPool:
+        pool = WorkerPool(
             self.config["num_workers"],
             self.config["piority_groups"],
             self._event_handler,
             self._cancel_event,
+            create_scheduler(
+                self.config.get("scheduler", "adaptive"),
+                self.config["piority_groups"],
+            ),
+            partitioned,
+            self.metrics,
+            name,
+            conflate,
+            self._create_autoscaler(),
+            self.config.get("direct_limit", 0) if name in ("command", "query") else 0,
         )
 
-    def _get_worker_pool(self, pool_attr: str) -> WorkerPool:
+        if partitioned:
+            pool.rebalance(self._route_keys)
+
+        return pool
+
+    def _get_worker_pool(
+        self, pool_attr: str, partitioned: bool = False, conflate: bool = False
+    ) -> WorkerPool:
         if getattr(self, pool_attr) is None:
-            setattr(self, pool_attr, self._create_worker_pool())
+            name = pool_attr.strip("_").removesuffix("_worker_pool")
+            setattr(
+                self, pool_attr, self._create_worker_pool(name, partitioned, conflate)
+            )
 
         return getattr(self, pool_attr)
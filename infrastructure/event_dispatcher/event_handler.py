@@ -1,26 +1,56 @@
 import asyncio
 import logging
+import time
 from collections import defaultdict, deque
 from functools import partial
-from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from core.commands._base import Command, Status
 from core.events._base import Event
 from core.queries._base import Query
 from core.result import Result
 from core.tasks._base import Task
+from infrastructure.executors import ExecutorService
+from infrastructure.telemetry.metrics import MetricsRegistry
+
+from .deadline_watchdog import DeadlineWatchdog
 
 HandlerType = Union[partial, Callable[..., Any]]
+FilterType = Optional[Callable[[Event], bool]]
+KeyFunc = Callable[[Event], Optional[Hashable]]
+Route = Tuple[KeyFunc, Hashable]
+RouteTable = Dict[KeyFunc, Dict[Hashable, List[Tuple[HandlerType, FilterType]]]]
 
 
 logger = logging.getLogger(__name__)
 
 
 class EventHandler:
-    def __init__(self, timeout: int = 15):
+    def __init__(
+        self,
+        timeout: int = 15,
+        metrics: MetricsRegistry = None,
+        executors: ExecutorService = None,
+    ):
         self._event_handlers: Dict[Type[Event], List[HandlerType]] = defaultdict(list)
+        self._routed_handlers: Dict[Type[Event], RouteTable] = defaultdict(dict)
         self._dlq: Deque[Tuple[Event, Exception]] = deque(maxlen=100)
         self.timeout = timeout
+        self.metrics = metrics or MetricsRegistry()
+        self.executors = executors or ExecutorService()
+        self._watchdog = DeadlineWatchdog(timeout)
+        self.on_handled: Optional[Callable[[Event], None]] = None
 
     @property
     def dlq(self):
@@ -30,48 +60,151 @@ class EventHandler:
         self,
         event_class: Type[Event],
         handler: HandlerType,
-        filter_func: Optional[Callable[[Event], bool]] = None,
+        filter_func: FilterType = None,
+        route: Optional[Route] = None,
     ) -> None:
-        self._event_handlers[event_class].append((handler, filter_func))
+        if route is None:
+            self._event_handlers[event_class].append((handler, filter_func))
+            return
+
+        key_func, key = route
+        table = self._routed_handlers[event_class].setdefault(key_func, {})
+        table.setdefault(key, []).append((handler, filter_func))
 
-    def unregister(self, event_class: Type[Event], handler: HandlerType) -> None:
+    def unregister(
+        self,
+        event_class: Type[Event],
+        handler: HandlerType,
+        route: Optional[Route] = None,
+    ) -> None:
         self._event_handlers[event_class] = [
             (h, filter_fn)
             for h, filter_fn in self._event_handlers.get(event_class, [])
             if h != handler
         ]
 
-    async def handle_event(self, event: Event, *args, **kwargs) -> None:
-        handlers = self._event_handlers.get(type(event), [])
+        routes = self._routed_handlers.get(event_class, {})
+
+        for key_func, table in list(routes.items()):
+            if route is not None and key_func != route[0]:
+                continue
 
-        for handler, filter_fn in handlers:
+            keys = [route[1]] if route is not None else list(table.keys())
+
+            for key in keys:
+                remaining = [
+                    (h, filter_fn)
+                    for h, filter_fn in table.get(key, [])
+                    if h != handler
+                ]
+
+                if remaining:
+                    table[key] = remaining
+                else:
+                    table.pop(key, None)
+
+            if not table:
+                del routes[key_func]
+
+    def handler_count(self, event: Event) -> int:
+        return len(self._get_handlers(event))
+
+    async def handle_event(self, event: Event, *args, **kwargs) -> None:
+        for handler, filter_fn in self._get_handlers(event):
             if not filter_fn or filter_fn(event):
                 await self._call_handler(handler, event, *args, **kwargs)
 
+        if self.on_handled is not None:
+            self.on_handled(event)
+
+    def _get_handlers(self, event: Event) -> List[Tuple[HandlerType, FilterType]]:
+        event_class = type(event)
+        handlers = self._event_handlers.get(event_class, [])
+        routes = self._routed_handlers.get(event_class)
+
+        if not routes:
+            return handlers
+
+        routed = [
+            handler
+            for key_func, table in routes.items()
+            for handler in table.get(key_func(event), ())
+        ]
+
+        return handlers + routed if handlers else routed
+
     async def _call_handler(
         self, handler: HandlerType, event: Event, *args, **kwargs
     ) -> None:
+        start_time = time.monotonic()
+
         try:
             if isinstance(event, Task):
                 response = asyncio.create_task(
                     self._execute_handler(handler, event, *args, **kwargs)
                 )
             else:
-                response = await asyncio.wait_for(
-                    self._execute_handler(handler, event, *args, **kwargs),
-                    timeout=self.timeout,
+                response = await self._execute_with_deadline(
+                    handler, event, *args, **kwargs
                 )
+                self._record_exec(handler, event, start_time)
 
             self._handle_event_response(event, response)
         except Exception as e:
+            if isinstance(e, asyncio.TimeoutError):
+                self._record_exec(handler, event, start_time)
+                self.metrics.counter(
+                    "handler_timeouts",
+                    event=type(event).__name__,
+                    handler=self._handler_name(handler),
+                ).inc()
+
             self._handle_event_error(handler, event, e)
 
+    def _record_exec(self, handler: HandlerType, event: Event, start_time: float):
+        self.metrics.histogram(
+            "handler_exec",
+            event=type(event).__name__,
+            handler=self._handler_name(handler),
+        ).record(time.monotonic() - start_time)
+
+    @staticmethod
+    def _handler_name(handler: HandlerType) -> str:
+        if isinstance(handler, partial):
+            handler = handler.func
+
+        owner = getattr(handler, "__self__", None)
+
+        if owner is not None:
+            return f"{type(owner).__name__}.{handler.__name__}"
+
+        return getattr(handler, "__qualname__", repr(handler))
+
+    async def _execute_with_deadline(
+        self, handler: HandlerType, event: Event, *args, **kwargs
+    ) -> Any:
+        task = asyncio.current_task()
+        token = self._watchdog.arm(task)
+
+        try:
+            response = await self._execute_handler(handler, event, *args, **kwargs)
+        except asyncio.CancelledError:
+            if self._watchdog.disarm(token) and task.uncancel() == 0:
+                raise asyncio.TimeoutError() from None
+            raise
+
+        if self._watchdog.disarm(token):
+            task.uncancel()
+            raise asyncio.TimeoutError()
+
+        return response
+
     async def _execute_handler(
         self, handler: HandlerType, event: Event, *args, **kwargs
     ) -> None:
         if asyncio.iscoroutinefunction(handler):
             return await handler(event, *args, **kwargs)
-        return await asyncio.to_thread(handler, event, *args, **kwargs)
+        return await self.executors.run(handler, event, *args, **kwargs)
 
     def _handle_event_response(self, event: Event, response: Any) -> None:
         if isinstance(event, Query):
@@ -92,6 +225,9 @@ class EventHandler:
             event.set_task(asyncio.create_task(asyncio.sleep(0.00001)))
 
         self._dlq.append((event, error))
+        self.metrics.counter(
+            "dlq", event=type(event).__name__, handler=self._handler_name(handler)
+        ).inc()
 
         logger.error(
             f"Exception encountered in event {event}:{handler} {error}. Event added to dead letter queue."
@@ -1,11 +1,14 @@
 import asyncio
+import time
 from collections import deque
-from typing import Any, AsyncIterable, Dict, Tuple
+from typing import Any, AsyncIterable, Dict, List, Tuple, Union
 
 import numpy as np
 
 from core.events._base import Event
+from infrastructure.telemetry.metrics import MetricsRegistry
 
+from .event_conflator import EventConflator
 from .event_handler import EventHandler
 
 
@@ -15,39 +18,89 @@ class EventWorker:
         event_handler: EventHandler,
         cancel_event: asyncio.Event,
         task_duration_limit: int = 100,
+        metrics: MetricsRegistry = None,
+        conflator: EventConflator = None,
     ):
         self._event_handler = event_handler
+        self._conflator = conflator
+        self._metrics = metrics or MetricsRegistry()
         self._cancel_event = cancel_event
         self._queue = asyncio.Queue()
         self._task_durations = deque(maxlen=task_duration_limit)
+        self._busy = False
+        self.last_active = time.monotonic()
+
+    @property
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def idle(self) -> bool:
+        return not self._busy and self._queue.empty()
+
+    @property
+    def service_time(self) -> float:
+        return np.mean(self._task_durations) if len(self._task_durations) > 2 else 0.0
 
     @property
     def score(self):
-        return self._queue.qsize(), (
-            np.mean(self._task_durations) if len(self._task_durations) > 2 else 0.0
-        )
+        return self._queue.qsize(), self.service_time
+
+    def retire(self) -> None:
+        self._queue.put_nowait(None)
 
     async def run(self):
-        async for event, args, kwargs in self._get_event_stream():
+        async for event, args, kwargs, enqueued_at in self._get_event_stream():
             start_time = asyncio.get_event_loop().time()
+            self._busy = True
 
-            await self._event_handler.handle_event(event, *args, **kwargs)
+            if isinstance(event, list):
+                for item in event:
+                    await self._handle(item, enqueued_at, *args, **kwargs)
+            else:
+                await self._handle(event, enqueued_at, *args, **kwargs)
+
+            self._busy = False
+            self.last_active = time.monotonic()
 
             end_time = asyncio.get_event_loop().time()
             self._task_durations.append(end_time - start_time)
 
+    async def _handle(self, event: Event, enqueued_at: float, *args, **kwargs):
+        if self._conflator is not None:
+            event = self._conflator.take(event)
+
+        self._record_wait(event, enqueued_at)
+        await self._event_handler.handle_event(event, *args, **kwargs)
+
     async def _get_event_stream(
         self,
-    ) -> AsyncIterable[Tuple[Event, Tuple[Any], Dict[str, Any]]]:
+    ) -> AsyncIterable[
+        Tuple[Union[Event, List[Event]], Tuple[Any], Dict[str, Any], float]
+    ]:
         while not self._cancel_event.is_set():
-            event, args, kwargs = await self._queue.get()
+            item = await self._queue.get()
+
+            if item is None:
+                self._queue.task_done()
+                return
 
-            yield event, args, kwargs
+            event, args, kwargs, enqueued_at = item
+
+            yield event, args, kwargs, enqueued_at
 
             self._queue.task_done()
 
     async def dispatch(self, event: Event, *args, **kwargs) -> None:
-        await self._queue.put((event, args, kwargs))
+        await self._queue.put((event, args, kwargs, time.monotonic()))
+
+    async def dispatch_many(self, events: List[Event], *args, **kwargs) -> None:
+        await self._queue.put((events, args, kwargs, time.monotonic()))
+
+    def _record_wait(self, event: Event, enqueued_at: float) -> None:
+        self._metrics.histogram("queue_wait", event=type(event).__name__).record(
+            time.monotonic() - enqueued_at
+        )
 
     async def wait(self) -> None:
         await self._queue.join()
@@ -0,0 +1,83 @@
+import bisect
+import math
+from collections import Counter
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+
+def _mix(value: int) -> int:
+    value &= 0xFFFFFFFFFFFFFFFF
+    value ^= value >> 33
+    value = (value * 0xFF51AFD7ED558CCD) & 0xFFFFFFFFFFFFFFFF
+    value ^= value >> 33
+    value = (value * 0xC4CEB9FE1A85EC53) & 0xFFFFFFFFFFFFFFFF
+    value ^= value >> 33
+    return value
+
+
+class PartitionRing:
+    def __init__(
+        self, num_partitions: int, vnodes: int = 64, load_factor: float = 1.25
+    ):
+        self._num_partitions = num_partitions
+        self._load_factor = load_factor
+
+        ring: List[Tuple[int, int]] = sorted(
+            (_mix(hash((partition, vnode))), partition)
+            for partition in range(num_partitions)
+            for vnode in range(vnodes)
+        )
+
+        self._points = [point for point, _ in ring]
+        self._owners = [owner for _, owner in ring]
+        self._assignments: Dict[Hashable, int] = {}
+        self._loads: Counter = Counter()
+        self._capacity = math.inf
+        self._pending_keys = None
+
+    @property
+    def num_partitions(self) -> int:
+        return self._num_partitions
+
+    def get(self, key: Hashable) -> int:
+        if self._pending_keys is not None:
+            self._apply(self._pending_keys)
+            self._pending_keys = None
+
+        partition = self._assignments.get(key)
+
+        if partition is None:
+            partition = self._place(key)
+
+        return partition
+
+    def rebalance(self, keys: Iterable[Hashable]) -> None:
+        self._pending_keys = list(keys)
+
+    def _apply(self, keys: List[Hashable]) -> None:
+        keys = sorted(set(keys), key=lambda key: _mix(hash(key)))
+
+        self._assignments = {}
+        self._loads = Counter()
+        self._capacity = max(
+            1, math.ceil(self._load_factor * len(keys) / self._num_partitions)
+        )
+
+        for key in keys:
+            self._place(key)
+
+    def _place(self, key: Hashable) -> int:
+        idx = bisect.bisect(self._points, _mix(hash(key)))
+        size = len(self._owners)
+        partition = self._owners[idx % size]
+
+        for step in range(size):
+            candidate = self._owners[(idx + step) % size]
+
+            if self._loads[candidate] < self._capacity:
+                partition = candidate
+                break
+
+        self._assignments[key] = partition
+        self._loads[partition] += 1
+
+        return partition
@@ -0,0 +1,106 @@
+import time
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Set, Tuple
+
+from core.events._base import Event
+from core.queries._base import Query
+from core.result import Result
+from infrastructure.telemetry.metrics import MetricsRegistry
+
+CacheKey = Tuple[type, Hashable]
+Generation = Tuple[int, int]
+
+
+class QueryCache:
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        metrics: MetricsRegistry = None,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self._maxsize = maxsize
+        self._metrics = metrics or MetricsRegistry()
+        self._metrics.add_collector(self._collect)
+        self._timer = timer
+        self._entries: OrderedDict[CacheKey, Tuple[float, Result, CacheKey]] = (
+            OrderedDict()
+        )
+        self._scopes: Dict[CacheKey, Set[CacheKey]] = {}
+        self._generations: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, query: Query) -> Optional[Result]:
+        key = type(query), query.cache_key
+        entry = self._entries.get(key)
+        name = type(query).__name__
+
+        if entry is None or entry[0] <= self._timer():
+            if entry is not None:
+                self._remove(key)
+
+            self._metrics.counter("cache_misses", query=name).inc()
+            return None
+
+        self._entries.move_to_end(key)
+        self._metrics.counter("cache_hits", query=name).inc()
+
+        return entry[1]
+
+    def generation(self, query: Query) -> Generation:
+        query_class = type(query)
+
+        return (
+            self._generations[(query_class, None)],
+            self._generations[(query_class, query.cache_scope)],
+        )
+
+    def put(self, query: Query, result: Result, generation: Generation) -> None:
+        if result.is_err() or self.generation(query) != generation:
+            return
+
+        query_class = type(query)
+        key = query_class, query.cache_key
+        scope = query_class, query.cache_scope
+
+        if key in self._entries:
+            self._remove(key)
+
+        while len(self._entries) >= self._maxsize:
+            evicted, _ = next(iter(self._entries.items()))
+            self._remove(evicted)
+            self._metrics.counter("cache_evictions", query=evicted[0].__name__).inc()
+
+        self._entries[key] = (self._timer() + query.cache_ttl, result, scope)
+        self._scopes.setdefault(scope, set()).add(key)
+
+    def invalidate(self, event: Event) -> None:
+        for query_class, scope in event.invalidates:
+            self._generations[(query_class, scope)] += 1
+
+            if scope is None:
+                keys = [key for key in self._entries if key[0] is query_class]
+            else:
+                keys = list(self._scopes.get((query_class, scope), ()))
+
+            for key in keys:
+                self._remove(key)
+
+            if keys:
+                self._metrics.counter(
+                    "cache_invalidations", query=query_class.__name__
+                ).inc(len(keys))
+
+    def _remove(self, key: CacheKey) -> None:
+        _, _, scope = self._entries.pop(key)
+        keys = self._scopes.get(scope)
+
+        if keys is not None:
+            keys.discard(key)
+
+            if not keys:
+                del self._scopes[scope]
+
+    def _collect(self, metrics: MetricsRegistry) -> None:
+        metrics.gauge("cache_size").set(len(self._entries))
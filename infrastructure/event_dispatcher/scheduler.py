@@ -0,0 +1,152 @@
+import random
+from abc import ABC, abstractmethod
+from typing import Dict, List, Type
+
+import numpy as np
+
+from .event_worker import EventWorker
+from .load_balancer import LoadBalancer
+
+
+class AbstractScheduler(ABC):
+    def __init__(self, num_priority_groups: int):
+        self._num_priority_groups = num_priority_groups
+
+    @abstractmethod
+    def determine_priority_group(self, priority: int) -> int:
+        pass
+
+    @abstractmethod
+    def choose_worker(
+        self, priority_group: int, group_workers: List[EventWorker]
+    ) -> EventWorker:
+        pass
+
+    @abstractmethod
+    def register_event(self, priority_group: int) -> None:
+        pass
+
+    def _clip_priority(self, priority: int) -> int:
+        return min(max(priority - 1, 0), self._num_priority_groups - 1)
+
+
+class AdaptiveScheduler(AbstractScheduler):
+    def __init__(self, num_priority_groups: int, alpha: float = 0.7, beta: float = 0.3):
+        super().__init__(num_priority_groups)
+        self.load_balancer = LoadBalancer(num_priority_groups)
+        self.alpha = alpha
+        self.beta = beta
+
+    def determine_priority_group(self, priority: int) -> int:
+        return self.load_balancer.determine_priority_group(priority)
+
+    def register_event(self, priority_group: int) -> None:
+        self.load_balancer.register_event(priority_group)
+
+    def choose_worker(
+        self, priority_group: int, group_workers: List[EventWorker]
+    ) -> EventWorker:
+        scores = np.array([worker.score for worker in group_workers])
+        queue_sizes, median_times = scores[:, 0], scores[:, 1]
+
+        norm_queue_sizes = (queue_sizes - queue_sizes.min() + 1) / (
+            queue_sizes.max() - queue_sizes.min() + 1
+        )
+        norm_median_times = (median_times - median_times.min() + 1) / (
+            median_times.max() - median_times.min() + 1
+        )
+
+        combined_scores = self.alpha * norm_queue_sizes + self.beta * norm_median_times
+
+        weights = 1 / (combined_scores + np.finfo(float).eps)
+        total_weight = sum(weights)
+
+        choice_point = np.random.uniform(0, total_weight)
+        cum_weights = np.cumsum(weights)
+        worker_index = np.searchsorted(cum_weights, choice_point)
+
+        return group_workers[worker_index]
+
+
+class PowerOfTwoScheduler(AbstractScheduler):
+    def __init__(self, num_priority_groups: int):
+        super().__init__(num_priority_groups)
+        self._random = random.Random()
+
+    def determine_priority_group(self, priority: int) -> int:
+        return self._clip_priority(priority)
+
+    def choose_worker(
+        self, priority_group: int, group_workers: List[EventWorker]
+    ) -> EventWorker:
+        n = len(group_workers)
+
+        if n == 1:
+            return group_workers[0]
+
+        first = int(self._random.random() * n)
+        second = int(self._random.random() * (n - 1))
+
+        if second >= first:
+            second += 1
+
+        a, b = group_workers[first], group_workers[second]
+
+        return a if a.qsize <= b.qsize else b
+
+    def register_event(self, priority_group: int) -> None:
+        pass
+
+
+class WeightedFairScheduler(AbstractScheduler):
+    def __init__(
+        self, num_priority_groups: int, band: int = 1, stride_scale: int = 1 << 16
+    ):
+        super().__init__(num_priority_groups)
+        self._band = band
+        self._strides = [
+            stride_scale * (group + 1) for group in range(num_priority_groups)
+        ]
+        self._passes = list(self._strides)
+        self._virtual_time = 0
+        self._cursors = [0] * num_priority_groups
+
+    def determine_priority_group(self, priority: int) -> int:
+        home = self._clip_priority(priority)
+        last = min(home + self._band, self._num_priority_groups - 1)
+        passes = self._passes
+        group = home
+
+        for candidate in range(home + 1, last + 1):
+            if passes[candidate] < passes[group]:
+                group = candidate
+
+        self._virtual_time = max(self._virtual_time, passes[group])
+        passes[group] = self._virtual_time + self._strides[group]
+
+        return group
+
+    def choose_worker(
+        self, priority_group: int, group_workers: List[EventWorker]
+    ) -> EventWorker:
+        cursor = self._cursors[priority_group]
+        self._cursors[priority_group] = cursor + 1
+
+        return group_workers[cursor % len(group_workers)]
+
+    def register_event(self, priority_group: int) -> None:
+        pass
+
+
+SCHEDULERS: Dict[str, Type[AbstractScheduler]] = {
+    "adaptive": AdaptiveScheduler,
+    "p2c": PowerOfTwoScheduler,
+    "wfq": WeightedFairScheduler,
+}
+
+
+def create_scheduler(name: str, num_priority_groups: int) -> AbstractScheduler:
+    if name not in SCHEDULERS:
+        raise ValueError(f"Unknown scheduler: {name}")
+
+    return SCHEDULERS[name](num_priority_groups)
@@ -1,14 +1,16 @@
 import asyncio
-from typing import List
-
-import numpy as np
+from typing import Dict, Hashable, Iterable, List
 
 from core.events._base import Event
+from infrastructure.telemetry.metrics import MetricsRegistry
 
+from .autoscaler import WorkerAutoscaler
+from .event_conflator import EventConflator
 from .event_dedup import EventDedup
 from .event_handler import EventHandler
 from .event_worker import EventWorker
-from .load_balancer import LoadBalancer
+from .partition import PartitionRing
+from .scheduler import AbstractScheduler, AdaptiveScheduler
 
 
 class WorkerPool:
@@ -18,69 +20,209 @@ class WorkerPool:
         num_piority_groups: int,
         event_handler: EventHandler,
         cancel_event: asyncio.Event,
-        alpha: float = 0.7,
-        beta: float = 0.3,
+        scheduler: AbstractScheduler = None,
+        partitioned: bool = False,
+        metrics: MetricsRegistry = None,
+        name: str = "default",
+        conflate: bool = False,
+        autoscaler: WorkerAutoscaler = None,
+        direct_limit: int = 0,
     ):
+        self.name = name
+        self.metrics = metrics or MetricsRegistry()
+        self.metrics.add_collector(self._collect)
+        self._dispatched = self.metrics.counter("dispatched", pool=name)
+        self._duplicates = self.metrics.counter("duplicates", pool=name)
+        self._started = self.metrics.counter("workers_started", pool=name)
+        self._retired = self.metrics.counter("workers_retired", pool=name)
+        self._direct = self.metrics.counter("direct", pool=name)
+        self._direct_slots = asyncio.Semaphore(direct_limit) if direct_limit else None
         self.workers = []
-        self.load_balancer = LoadBalancer(num_piority_groups)
+        self.groups: List[List[EventWorker]] = []
+        self.scheduler = scheduler or AdaptiveScheduler(num_piority_groups)
         self.dedup = EventDedup()
         self.event_handler = event_handler
         self.cancel_event = cancel_event
+        self.conflator = EventConflator(self.metrics, name) if conflate else None
         self._num_priority_groups = num_piority_groups
-        self._initialize_workers(num_workers)
-        self.alpha = alpha
-        self.beta = beta
+        self.autoscaler = None if partitioned else autoscaler
+        self._runners: Dict[EventWorker, asyncio.Future] = {}
+        self._initialize_workers(
+            self.autoscaler.min_workers if self.autoscaler else num_workers
+        )
+        self.partitions = PartitionRing(len(self.workers)) if partitioned else None
+        self._partition_owners: Dict[Hashable, EventWorker] = {}
+        self._scaler = (
+            asyncio.ensure_future(self._autoscale()) if self.autoscaler else None
+        )
+
+    def rebalance(self, keys: Iterable[Hashable]) -> None:
+        if self.partitions is not None:
+            self.partitions.rebalance(keys)
 
     async def dispatch_to_worker(self, event: Event, *args, **kwargs) -> None:
-        priority_group = self.load_balancer.determine_priority_group(
-            event.meta.priority
-        )
+        if self.partitions is not None:
+            key = event.partition_key
 
-        if await self.dedup.acquire(event):
-            group_workers = self._distribute_workers(priority_group)
+            if key is not None:
+                if await self._acquire(event):
+                    await self._partition_worker(key).dispatch(event, *args, **kwargs)
+                return
+
+        priority_group = self.scheduler.determine_priority_group(event.meta.priority)
 
-            worker = self._choose_worker(group_workers)
+        if await self._acquire(event):
+            worker = self.scheduler.choose_worker(
+                priority_group, self.groups[priority_group]
+            )
 
             await worker.dispatch(event, *args, **kwargs)
 
-        self.load_balancer.register_event(priority_group)
+        self.scheduler.register_event(priority_group)
 
-    async def wait(self) -> None:
-        await asyncio.gather(*(worker.wait() for worker in self.workers))
+    async def dispatch_direct(self, event: Event, *args, **kwargs) -> bool:
+        if (
+            self._direct_slots is None
+            or self._direct_slots.locked()
+            or self.event_handler.handler_count(event) != 1
+            or self._backlogged()
+        ):
+            return False
 
-    def _initialize_workers(self, num_workers):
-        self.workers = [
-            EventWorker(self.event_handler, self.cancel_event)
-            for _ in range(num_workers * self._num_priority_groups)
-        ]
+        if await self._acquire(event):
+            async with self._direct_slots:
+                self._direct.inc()
+                await self.event_handler.handle_event(event, *args, **kwargs)
+
+        return True
+
+    async def dispatch_many(self, events: List[Event], *args, **kwargs) -> None:
+        accepted = await self.dedup.acquire_many(events)
+        self._dispatched.inc(len(accepted))
+        self._duplicates.inc(len(events) - len(accepted))
+        events = accepted
+
+        if self.conflator is not None:
+            events = [event for event in events if self.conflator.offer(event)]
+
+        if not events:
+            return
+
+        batches: Dict[EventWorker, List[Event]] = {}
+        unkeyed = events
+
+        if self.partitions is not None:
+            unkeyed = []
+
+            for event in events:
+                key = event.partition_key
+
+                if key is None:
+                    unkeyed.append(event)
+                else:
+                    batches.setdefault(self._partition_worker(key), []).append(event)
 
-        asyncio.gather(*(worker.run() for worker in self.workers))
+        by_priority: Dict[int, List[Event]] = {}
 
-    def _distribute_workers(self, priority_group: int) -> List[EventWorker]:
-        workers_per_group = len(self.workers) // self._num_priority_groups
-        group_start = priority_group * workers_per_group
-        group_end = group_start + workers_per_group
+        for event in unkeyed:
+            by_priority.setdefault(event.meta.priority, []).append(event)
 
-        return self.workers[group_start:group_end]
+        for priority, group_events in by_priority.items():
+            priority_group = self.scheduler.determine_priority_group(priority)
+            worker = self.scheduler.choose_worker(
+                priority_group, self.groups[priority_group]
+            )
+            batches.setdefault(worker, []).extend(group_events)
+            self.scheduler.register_event(priority_group)
 
-    def _choose_worker(self, group_workers: List[EventWorker]) -> EventWorker:
-        scores = np.array([worker.score for worker in group_workers])
-        queue_sizes, median_times = scores[:, 0], scores[:, 1]
+        for worker, batch in batches.items():
+            await worker.dispatch_many(batch, *args, **kwargs)
 
-        norm_queue_sizes = (queue_sizes - queue_sizes.min() + 1) / (
-            queue_sizes.max() - queue_sizes.min() + 1
+    def _backlogged(self) -> bool:
+        return any(worker.qsize for worker in self.workers)
+
+    async def _acquire(self, event: Event) -> bool:
+        if await self.dedup.acquire(event):
+            self._dispatched.inc()
+            return self.conflator is None or self.conflator.offer(event)
+
+        self._duplicates.inc()
+        return False
+
+    def _collect(self, metrics: MetricsRegistry) -> None:
+        metrics.gauge("queue_depth", pool=self.name).set(
+            sum(worker.qsize for worker in self.workers)
         )
-        norm_median_times = (median_times - median_times.min() + 1) / (
-            median_times.max() - median_times.min() + 1
+        metrics.gauge("active_workers", pool=self.name).set(
+            sum(not worker.idle for worker in self.workers)
         )
 
-        combined_scores = self.alpha * norm_queue_sizes + self.beta * norm_median_times
+        for group, group_workers in enumerate(self.groups):
+            metrics.gauge("workers", pool=self.name, group=str(group)).set(
+                len(group_workers)
+            )
+
+        if self.conflator is not None:
+            metrics.gauge("conflation_pending", pool=self.name).set(len(self.conflator))
 
-        weights = 1 / (combined_scores + np.finfo(float).eps)
-        total_weight = sum(weights)
+    def _partition_worker(self, key: Hashable) -> EventWorker:
+        worker = self.workers[self.partitions.get(key)]
+        owner = self._partition_owners.get(key)
 
-        choice_point = np.random.uniform(0, total_weight)
-        cum_weights = np.cumsum(weights)
-        worker_index = np.searchsorted(cum_weights, choice_point)
+        if owner is worker:
+            return worker
 
-        return group_workers[worker_index]
+        if owner is not None and not owner.idle:
+            return owner
+
+        self._partition_owners[key] = worker
+
+        return worker
+
+    async def wait(self) -> None:
+        await asyncio.gather(*(worker.wait() for worker in self.workers))
+
+    async def _autoscale(self) -> None:
+        while not self.cancel_event.is_set():
+            await asyncio.sleep(self.autoscaler.interval)
+
+            for group_workers in self.groups:
+                decision = self.autoscaler.decide(group_workers)
+
+                if decision > 0:
+                    group_workers.append(self._start_worker())
+                elif decision < 0:
+                    self._retire_worker(
+                        group_workers, self.autoscaler.retiree(group_workers)
+                    )
+
+    def _start_worker(self) -> EventWorker:
+        worker = EventWorker(
+            self.event_handler,
+            self.cancel_event,
+            metrics=self.metrics,
+            conflator=self.conflator,
+        )
+
+        self.workers.append(worker)
+        self._runners[worker] = asyncio.ensure_future(worker.run())
+        self._runners[worker].add_done_callback(
+            lambda _: self._runners.pop(worker, None)
+        )
+        self._started.inc()
+
+        return worker
+
+    def _retire_worker(
+        self, group_workers: List[EventWorker], worker: EventWorker
+    ) -> None:
+        group_workers.remove(worker)
+        self.workers.remove(worker)
+        worker.retire()
+        self._retired.inc()
+
+    def _initialize_workers(self, num_workers):
+        self.groups = [
+            [self._start_worker() for _ in range(num_workers)]
+            for _ in range(self._num_priority_groups)
+        ]
@@ -0,0 +1,231 @@
+import argparse
+import logging
+import os
+import shutil
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import orjson
+import pandas as pd
+
+from .segment_log import list_segments, read_segment, segment_path
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+logger = logging.getLogger(__name__)
+
+COLUMNAR_DIR = "columnar"
+
+
+def _flatten(record: Dict[str, Any], prefix: str = "", row: Dict = None) -> Dict:
+    row = {} if row is None else row
+
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+
+        if isinstance(value, dict):
+            _flatten(value, f"{name}.", row)
+        elif isinstance(value, list):
+            row[name] = orjson.dumps(value).decode()
+        else:
+            row[name] = value
+
+    return row
+
+
+def _column(values: List[Any]) -> np.ndarray:
+    present = [value for value in values if value is not None]
+
+    if not present:
+        return np.full(len(values), np.nan)
+
+    if all(isinstance(value, bool) for value in present):
+        if len(present) == len(values):
+            return np.array(values, dtype=np.bool_)
+    elif all(
+        isinstance(value, (int, float)) and not isinstance(value, bool)
+        for value in present
+    ):
+        if len(present) == len(values) and all(isinstance(v, int) for v in present):
+            return np.array(values, dtype=np.int64)
+
+        return np.array(
+            [np.nan if value is None else value for value in values], dtype=np.float64
+        )
+
+    return np.array(["" if value is None else str(value) for value in values])
+
+
+def _columns(rows: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    names = {}
+
+    for row in rows:
+        names.update(dict.fromkeys(row))
+
+    return {name: _column([row.get(name) for row in rows]) for name in names}
+
+
+def _write(path: str, columns: Dict[str, np.ndarray], fmt: str) -> None:
+    if fmt == "parquet":
+        pq.write_table(pa.table(columns), f"{path}.parquet")
+        return
+
+    os.makedirs(path)
+
+    for name, values in columns.items():
+        np.save(os.path.join(path, f"{name}.npy"), values)
+
+
+def _resolve(fmt: str) -> str:
+    if fmt == "auto":
+        return "npy" if pq is None else "parquet"
+
+    if fmt == "parquet" and pq is None:
+        raise ImportError("pyarrow is required for parquet compaction")
+
+    if fmt not in ("parquet", "npy"):
+        raise ValueError(f"Unknown columnar format: {fmt}")
+
+    return fmt
+
+
+def compact_segment(source: str, target: str, fmt: str) -> int:
+    rows = defaultdict(list)
+
+    for payload in read_segment(source):
+        record = orjson.loads(payload)
+        name = (record.get("meta") or {}).get("name", "Event")
+        rows[name].append(_flatten(record))
+
+    staging = f"{target}.tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+
+    for name, records in rows.items():
+        _write(os.path.join(staging, name), _columns(records), fmt)
+
+    os.replace(staging, target)
+
+    return sum(len(records) for records in rows.values())
+
+
+def compact(
+    base_dir: str, groups: Optional[Iterable[str]] = None, fmt: str = "auto"
+) -> Dict[str, int]:
+    fmt = _resolve(fmt)
+    output = os.path.join(base_dir, COLUMNAR_DIR)
+    compacted = defaultdict(int)
+
+    if groups is None:
+        groups = sorted(
+            name
+            for name in os.listdir(base_dir)
+            if name != COLUMNAR_DIR and os.path.isdir(os.path.join(base_dir, name))
+        )
+
+    for group in groups:
+        directory = os.path.join(base_dir, group)
+
+        if not os.path.isdir(directory):
+            continue
+
+        for base in list_segments(directory)[:-1]:
+            target = os.path.join(output, group, f"{base:020d}")
+
+            if os.path.exists(target):
+                continue
+
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            count = compact_segment(segment_path(directory, base), target, fmt)
+            compacted[group] += count
+
+            logger.info(f"Compacted {count} events from {group}/{base:020d}")
+
+    return dict(compacted)
+
+
+def _read_segment(path: str, columns: Optional[List[str]]) -> Dict[str, np.ndarray]:
+    if os.path.exists(f"{path}.parquet"):
+        table = pq.read_table(f"{path}.parquet", columns=columns, memory_map=True)
+        return {name: table[name].to_numpy() for name in table.column_names}
+
+    if not os.path.isdir(path):
+        return {}
+
+    return {
+        file[: -len(".npy")]: np.load(os.path.join(path, file), mmap_mode="r")
+        for file in sorted(os.listdir(path))
+        if columns is None or file[: -len(".npy")] in columns
+    }
+
+
+def _concat(arrays: List[np.ndarray]) -> np.ndarray:
+    if len(arrays) == 1:
+        return arrays[0]
+
+    if len({array.dtype.kind for array in arrays}) > 1 and any(
+        array.dtype.kind == "U" for array in arrays
+    ):
+        arrays = [array.astype(str) for array in arrays]
+
+    return np.concatenate(arrays)
+
+
+def load_columns(
+    base_dir: str, group: str, event_type: Any, columns: List[str] = None
+) -> Dict[str, np.ndarray]:
+    name = event_type if isinstance(event_type, str) else event_type.__name__
+    directory = os.path.join(base_dir, COLUMNAR_DIR, group)
+
+    if not os.path.isdir(directory):
+        return {}
+
+    segments = [
+        segment
+        for segment in (
+            _read_segment(os.path.join(directory, entry, name), columns)
+            for entry in sorted(os.listdir(directory))
+            if not entry.endswith(".tmp")
+        )
+        if segment
+    ]
+    names = {}
+
+    for segment in segments:
+        names.update(dict.fromkeys(segment))
+
+    return {
+        column: _concat(
+            [
+                segment.get(column, np.full(len(next(iter(segment.values()))), np.nan))
+                for segment in segments
+            ]
+        )
+        for column in names
+    }
+
+
+def load_frame(base_dir: str, group: str, event_type: Any, columns: List[str] = None):
+    return pd.DataFrame(load_columns(base_dir, group, event_type, columns), copy=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="python -m infrastructure.event_store.columnar"
+    )
+    parser.add_argument("base_dir")
+    parser.add_argument("groups", nargs="*")
+    parser.add_argument("--format", choices=["auto", "parquet", "npy"])
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    for group, count in compact(
+        args.base_dir, args.groups or None, args.format or "auto"
+    ).items():
+        print(f"{group}: {count}")
@@ -0,0 +1,81 @@
+from typing import Any, Dict, Optional
+
+from core.models.entity.bar import Bar
+from core.models.entity.ohlcv import OHLCV
+from core.models.entity.order import Order
+from core.models.entity.position import Position
+from core.models.entity.signal import Signal
+from core.models.order_type import OrderStatus, OrderType
+from core.models.side import SignalSide
+from core.models.strategy import Strategy
+from core.models.symbol import Symbol
+from core.models.timeframe import Timeframe
+
+
+def _enum(cls, value: Any):
+    name = str(value).rsplit(".", 1)[-1]
+
+    return cls[name] if name in cls.__members__ else cls(value)
+
+
+def decode_ohlcv(data: Dict[str, Any]) -> OHLCV:
+    return OHLCV(
+        int(data["timestamp"]),
+        data["open"],
+        data["high"],
+        data["low"],
+        data["close"],
+        data["volume"],
+    )
+
+
+def decode_bar(data: Dict[str, Any]) -> Bar:
+    return Bar(decode_ohlcv(data["ohlcv"]), data["closed"])
+
+
+def decode_order(data: Dict[str, Any]) -> Order:
+    return Order(
+        _enum(OrderStatus, data["status"]),
+        data["price"],
+        data["size"],
+        _enum(OrderType, data["type"]),
+        data["id"],
+        data["timestamp"],
+        data["fee"],
+    )
+
+
+def decode_signal(
+    data: Optional[Dict[str, Any]],
+    symbol: Symbol,
+    timeframe: Timeframe,
+    strategy: Strategy,
+) -> Optional[Signal]:
+    if not data:
+        return None
+
+    return Signal(
+        symbol,
+        timeframe,
+        strategy,
+        _enum(SignalSide, data["side"]),
+        decode_ohlcv(data["ohlcv"]),
+        data["entry"],
+        data["exit"],
+    )
+
+
+def decode_position(
+    data: Dict[str, Any],
+    symbol: Symbol,
+    timeframe: Timeframe,
+    strategy: Strategy,
+) -> Position:
+    return Position(
+        data["initial_size"],
+        tuple(decode_order(order) for order in data["orders"]),
+        data["last_modified"],
+        data["id"],
+        decode_signal(data["signal"], symbol, timeframe, strategy),
+        decode_signal(data.get("close_signal"), symbol, timeframe, strategy),
+    )
@@ -1,10 +1,12 @@
 import asyncio
 import json
 from abc import ABC
+from dataclasses import asdict, is_dataclass
 from enum import Enum
 from typing import Any
 
 import numpy as np
+import orjson
 
 from core.events._base import Event
 from core.models.indicator import Indicator
@@ -14,17 +16,31 @@ class Encoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, Enum):
             return obj.value
-        if isinstance(obj, ABC):
-            return obj.__class__.__name__
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
         if isinstance(obj, Event):
             return obj.to_dict()
         if isinstance(obj, Indicator):
             return obj.to_dict()
+        if is_dataclass(obj) and not isinstance(obj, type):
+            return asdict(obj)
+        if isinstance(obj, ABC):
+            return obj.__class__.__name__
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
         if isinstance(obj, type(Any)):
             return "Any"
         if isinstance(obj, asyncio.Future):
             return None
 
         return str(obj)
+
+
+_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_SERIALIZE_NUMPY
+    | orjson.OPT_NON_STR_KEYS
+)
+_default = Encoder().default
+
+
+def encode(obj: Any) -> bytes:
+    return orjson.dumps(obj, default=_default, option=_OPTIONS)
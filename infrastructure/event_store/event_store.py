@@ -1,11 +1,66 @@
-import json
+import asyncio
 import os
-from typing import Optional
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import orjson
 
 from core.events._base import Event
 from core.interfaces.abstract_config import AbstractConfig
+from infrastructure.telemetry.metrics import MetricsRegistry
+
+from .event_encoder import encode
+from .segment_index import Attrs, normalize
+from .segment_log import SegmentLog
+from .store_writer import StoreWriter
+
+
+def _symbol(source: Any) -> Optional[str]:
+    if isinstance(source, dict):
+        symbol = source.get("symbol")
+        return symbol.get("name") if isinstance(symbol, dict) else symbol
+
+    symbol = getattr(source, "symbol", None)
+    return None if symbol is None else str(symbol)
+
+
+def _event_attrs(event: Event) -> Attrs:
+    if hasattr(event, "signal"):
+        source = event.signal
+    elif hasattr(event, "position") and hasattr(event.position, "signal"):
+        source = event.position.signal
+    else:
+        source = event
+
+    return event.meta.timestamp, event.__class__.__name__, _symbol(source)
+
+
+def _record_attrs(record: Dict[str, Any]) -> Attrs:
+    meta = record.get("meta") or {}
+    position = record.get("position")
+
+    if isinstance(record.get("signal"), dict):
+        source = record["signal"]
+    elif isinstance(position, dict) and isinstance(position.get("signal"), dict):
+        source = position["signal"]
+    else:
+        source = record
+
+    return meta.get("timestamp"), meta.get("name"), _symbol(source)
 
-from .event_encoder import Encoder
+
+def _payload_attrs(payload: bytes) -> Attrs:
+    return _record_attrs(orjson.loads(payload))
+
+
+def _on_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+
+    return True
 
 
 class SingletonMeta(type):
@@ -18,7 +73,7 @@ class SingletonMeta(type):
 
 
 class EventStore(metaclass=SingletonMeta):
-    def __init__(self, config_service: AbstractConfig):
+    def __init__(self, config_service: AbstractConfig, metrics: MetricsRegistry = None):
         config = config_service.get("store")
 
         self.base_dir = config["base_dir"]
@@ -26,66 +81,124 @@ class EventStore(metaclass=SingletonMeta):
         if not os.path.exists(self.base_dir):
             os.makedirs(self.base_dir)
 
-        self.buffer_size = config["buf_size"]
-        self.buffer = {}
-
-    def append(self, event: Event):
-        group = str(event.meta.group)
-
-        if group not in self.buffer:
-            self.buffer[group] = []
-
-        self.buffer[group].append(event)
-
-        if len(self.buffer[group]) >= self.buffer_size:
-            self._flush_buffer(group)
+        self.config = config
+        self.metrics = metrics or MetricsRegistry()
+        self.overflow = config.get("overflow", "block")
+        self._dropped = self.metrics.counter("store_dropped")
+        self._logs: Dict[str, SegmentLog] = {}
+        self._logs_lock = threading.Lock()
+        self._writer = StoreWriter(
+            self._commit,
+            config.get("queue_size", 65536),
+            config["buf_size"],
+            config.get("commit_latency", 0.05),
+            self.metrics,
+        )
+        self._writer.start()
+
+    async def append(self, event: Event):
+        await self.append_many([event])
+
+    async def append_many(self, events: List[Event]):
+        if not self._writer.is_alive():
+            self._commit(events)
+            return
+
+        while not self._writer.offer(events):
+            if self.overflow == "drop":
+                self._dropped.inc(len(events))
+                return
+
+            await asyncio.sleep(self._writer.latency)
+
+    def flush(self, timeout: float = None) -> bool:
+        if _on_loop():
+            raise RuntimeError(
+                "EventStore reads wait for the writer; "
+                "call them through asyncio.to_thread"
+            )
+
+        return self._writer.flush(timeout)
 
     def get(self, group: str) -> list:
-        file_path = self._get_file_path(group)
+        self.flush()
+        return list(self.read(group))
 
-        if os.path.exists(file_path):
-            with open(file_path, "r") as f:
-                events_from_file = json.load(f)
-        else:
-            events_from_file = []
+    def read(self, group: str) -> Iterator[Dict[str, Any]]:
+        if group not in self._logs and not os.path.isdir(self._get_dir(group)):
+            return
 
-        events_from_buffer = self.buffer.get(group, [])
+        for payload in self._get_log(group).read():
+            yield orjson.loads(payload)
 
-        return events_from_file + events_from_buffer
+    def query(
+        self,
+        group: str,
+        types: Optional[Iterable] = None,
+        symbols: Optional[Iterable] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        self.flush()
 
-    def close(self) -> None:
-        for group in self.buffer:
-            self._flush_buffer(group)
+        if group not in self._logs and not os.path.isdir(self._get_dir(group)):
+            return
 
-    def _get_file_path(self, group: str, date: Optional[str] = None) -> str:
-        if date:
-            filename = f"{group}_{date}_snapshot.json"
-        else:
-            filename = f"{group}.json"
+        names, symbols = normalize(types), normalize(symbols)
 
-        return os.path.join(self.base_dir, filename)
+        for payload in self._get_log(group).query(start, end, names, symbols):
+            record = orjson.loads(payload)
+            timestamp, name, symbol = _record_attrs(record)
 
-    def _flush_buffer(self, group: str) -> None:
-        if group in self.buffer and len(self.buffer[group]) > 0:
-            self._append_to_file(group, self.buffer[group])
-            self.buffer[group] = []
+            if names is not None and name not in names:
+                continue
 
-    def _append_to_file(self, group: str, events: list) -> None:
-        file_path = self._get_file_path(group)
+            if symbols is not None and symbol not in symbols:
+                continue
 
-        if not os.path.exists(file_path):
-            with open(file_path, "w") as f:
-                f.write("[]")
+            if start is not None and (timestamp is None or timestamp < start):
+                continue
 
-        with open(file_path, "rb+") as f:
-            f.seek(-1, os.SEEK_END)
-            f.truncate()
+            if end is not None and (timestamp is None or timestamp > end):
+                continue
 
-            for event in events:
-                if f.tell() > 1:
-                    f.write(",".encode("utf-8"))
+            yield record
 
-                event_data = json.dumps(event, cls=Encoder)
-                f.write(event_data.encode("utf-8"))
-
-            f.write("]".encode("utf-8"))
+    def close(self) -> None:
+        self._writer.close()
+
+        with self._logs_lock:
+            for log in self._logs.values():
+                log.close()
+
+            self._logs = {}
+
+    def _get_dir(self, group: str) -> str:
+        return os.path.join(self.base_dir, group)
+
+    def _get_log(self, group: str) -> SegmentLog:
+        with self._logs_lock:
+            if group not in self._logs:
+                self._logs[group] = SegmentLog(
+                    self._get_dir(group),
+                    int(self.config.get("segment_mb", 64) * (1 << 20)),
+                    self.config.get("segment_seconds", 0),
+                    self.config.get("fsync", "interval"),
+                    self.config.get("fsync_interval", 1),
+                    self.config.get("retention_segments", 0),
+                    index_interval=self.config.get("index_interval", 256),
+                    indexer=_payload_attrs,
+                )
+
+            return self._logs[group]
+
+    def _commit(self, events: List[Event]) -> None:
+        groups = defaultdict(lambda: ([], []))
+
+        for event in events:
+            payloads, attrs = groups[str(event.meta.group)]
+            payloads.append(encode(event))
+            attrs.append(_event_attrs(event))
+
+        for group, (payloads, attrs) in groups.items():
+            self._get_log(group).append(payloads, attrs)
@@ -0,0 +1,62 @@
+import argparse
+import logging
+import os
+from typing import Dict
+
+import orjson
+
+from .segment_log import SegmentLog
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1024
+
+
+def migrate(base_dir: str, keep: bool = False) -> Dict[str, int]:
+    migrated = {}
+
+    for name in sorted(os.listdir(base_dir)):
+        if not name.endswith(".json") or name.endswith("_snapshot.json"):
+            continue
+
+        group = name[: -len(".json")]
+        path = os.path.join(base_dir, name)
+
+        log = SegmentLog(os.path.join(base_dir, group), fsync="never")
+
+        if log.next_offset:
+            log.close()
+            logger.warning(f"Skipping {name}: {group}/ already has events")
+            continue
+
+        with open(path, "rb") as f:
+            records = orjson.loads(f.read() or b"[]")
+
+        for i in range(0, len(records), BATCH_SIZE):
+            log.append([orjson.dumps(record) for record in records[i : i + BATCH_SIZE]])
+
+        log.close()
+
+        if keep:
+            os.rename(path, f"{path}.migrated")
+        else:
+            os.remove(path)
+
+        migrated[group] = len(records)
+        logger.info(f"Migrated {len(records)} events from {name} to {group}/")
+
+    return migrated
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="python -m infrastructure.event_store.migrate"
+    )
+    parser.add_argument("base_dir")
+    parser.add_argument("--keep", action="store_true", help="rename instead of delete")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    for group, count in migrate(args.base_dir, args.keep).items():
+        print(f"{group}: {count}")
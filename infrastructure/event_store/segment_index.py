@@ -0,0 +1,148 @@
+import os
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Set, Tuple
+
+import orjson
+
+Attrs = Tuple[Optional[float], Optional[str], Optional[str]]
+
+
+@dataclass(slots=True)
+class IndexBlock:
+    position: int
+    count: int = 0
+    start: float = float("inf")
+    end: float = float("-inf")
+    names: Set[str] = field(default_factory=set)
+    symbols: Set[str] = field(default_factory=set)
+
+    def add(self, attrs: Attrs) -> None:
+        timestamp, name, symbol = attrs
+
+        if timestamp is not None:
+            self.start = min(self.start, timestamp)
+            self.end = max(self.end, timestamp)
+
+        self.names.add(name)
+        self.symbols.add(symbol)
+        self.count += 1
+
+    def matches(
+        self,
+        start: Optional[float],
+        end: Optional[float],
+        names: Optional[Set[str]],
+        symbols: Optional[Set[str]],
+    ) -> bool:
+        if start is not None and self.end < start:
+            return False
+
+        if end is not None and self.start > end:
+            return False
+
+        if names is not None and self.names.isdisjoint(names):
+            return False
+
+        return symbols is None or not self.symbols.isdisjoint(symbols)
+
+
+class SegmentIndex:
+    def __init__(self, interval: int = 256, blocks: List[IndexBlock] = None):
+        self.interval = interval
+        self.blocks = blocks or []
+        self.summary = IndexBlock(0)
+        self.size = 0
+
+        for block in self.blocks:
+            self._merge(block)
+
+    def add(self, position: int, size: int, attrs: Attrs) -> None:
+        if not self.blocks or self.blocks[-1].count >= self.interval:
+            self.blocks.append(IndexBlock(position))
+
+        self.blocks[-1].add(attrs)
+        self.summary.add(attrs)
+        self.size = position + size
+
+    def select(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        names: Optional[Set[str]] = None,
+        symbols: Optional[Set[str]] = None,
+    ) -> List[Tuple[int, int]]:
+        if not self.summary.matches(start, end, names, symbols):
+            return []
+
+        return [
+            (block.position, block.count)
+            for block in list(self.blocks)
+            if block.matches(start, end, names, symbols)
+        ]
+
+    def save(self, path: str) -> None:
+        data = {
+            "interval": self.interval,
+            "size": self.size,
+            "blocks": [
+                [
+                    block.position,
+                    block.count,
+                    block.start,
+                    block.end,
+                    sorted(block.names, key=str),
+                    sorted(block.symbols, key=str),
+                ]
+                for block in self.blocks
+            ],
+        }
+
+        with open(f"{path}.tmp", "wb") as f:
+            f.write(orjson.dumps(data))
+
+        os.replace(f"{path}.tmp", path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["SegmentIndex"]:
+        try:
+            with open(path, "rb") as f:
+                data = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+        index = cls(
+            data["interval"],
+            [
+                IndexBlock(
+                    position,
+                    count,
+                    float("inf") if start is None else start,
+                    float("-inf") if end is None else end,
+                    set(names),
+                    set(symbols),
+                )
+                for position, count, start, end, names, symbols in data["blocks"]
+            ],
+        )
+        index.size = data["size"]
+
+        return index
+
+    def _merge(self, block: IndexBlock) -> None:
+        self.summary.count += block.count
+        self.summary.start = min(self.summary.start, block.start)
+        self.summary.end = max(self.summary.end, block.end)
+        self.summary.names |= block.names
+        self.summary.symbols |= block.symbols
+
+
+def normalize(values: Optional[Iterable]) -> Optional[Set[str]]:
+    if values is None:
+        return None
+
+    if not isinstance(values, (list, tuple, set, frozenset)):
+        values = [values]
+
+    return {
+        value.__name__ if isinstance(value, type) else str(value) for value in values
+    }
@@ -0,0 +1,297 @@
+import itertools
+import os
+import struct
+import time
+import zlib
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Set
+
+from .segment_index import Attrs, SegmentIndex
+
+_HEADER = struct.Struct("<II")
+_SUFFIX = ".log"
+_INDEX_SUFFIX = ".idx"
+
+
+def read_segment(path: str) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        for payload, _ in SegmentLog._scan(f):
+            yield payload
+
+
+def list_segments(directory: str) -> List[int]:
+    return sorted(
+        int(name[: -len(_SUFFIX)])
+        for name in os.listdir(directory)
+        if name.endswith(_SUFFIX) and name[: -len(_SUFFIX)].isdigit()
+    )
+
+
+def segment_path(directory: str, base: int) -> str:
+    return os.path.join(directory, f"{base:020d}{_SUFFIX}")
+
+
+class SegmentLog:
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = 64 << 20,
+        segment_seconds: float = 0,
+        fsync: str = "interval",
+        fsync_interval: float = 1.0,
+        retention_segments: int = 0,
+        timer: Callable[[], float] = time.monotonic,
+        index_interval: int = 256,
+        indexer: Optional[Callable[[bytes], Attrs]] = None,
+    ):
+        if fsync not in ("always", "interval", "never"):
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+
+        self.directory = directory
+        self._segment_bytes = segment_bytes
+        self._segment_seconds = segment_seconds
+        self._fsync = fsync
+        self._fsync_interval = fsync_interval
+        self._retention_segments = retention_segments
+        self._timer = timer
+        self._index_interval = index_interval
+        self._indexer = indexer
+
+        os.makedirs(directory, exist_ok=True)
+
+        self._segments = self._list_segments()
+        self._indexes: Dict[int, Optional[SegmentIndex]] = {}
+        self._file: Optional[BinaryIO] = None
+        self._size = 0
+        self._next_offset = 0
+        self._opened_at = timer()
+        self._synced_at = timer()
+
+        self._open_tail()
+
+        for base in self._segments[:-1]:
+            self._indexes[base] = self._load_index(base, seal=True)
+
+    @property
+    def next_offset(self) -> int:
+        return self._next_offset
+
+    @property
+    def segments(self) -> List[str]:
+        return [self._segment_path(base) for base in self._segments]
+
+    def append(self, payloads: List[bytes], attrs: List[Attrs] = None) -> None:
+        if not payloads:
+            return
+
+        if self._should_roll():
+            self._roll()
+
+        buffer = bytearray()
+
+        for payload in payloads:
+            buffer += _HEADER.pack(len(payload), zlib.crc32(payload))
+            buffer += payload
+
+        self._file.write(buffer)
+        self._file.flush()
+
+        self._index(payloads, attrs)
+
+        self._size += len(buffer)
+        self._next_offset += len(payloads)
+
+        self._sync(self._fsync == "always")
+
+    def read(self) -> Iterator[bytes]:
+        for base in list(self._segments):
+            path = self._segment_path(base)
+
+            if os.path.exists(path):
+                yield from read_segment(path)
+
+    def query(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        names: Optional[Set[str]] = None,
+        symbols: Optional[Set[str]] = None,
+    ) -> Iterator[bytes]:
+        for base in list(self._segments):
+            path = self._segment_path(base)
+            index = self._indexes.get(base)
+
+            if not os.path.exists(path):
+                continue
+
+            if index is None:
+                yield from read_segment(path)
+                continue
+
+            blocks = index.select(start, end, names, symbols)
+
+            if not blocks:
+                continue
+
+            with open(path, "rb") as f:
+                for position, count in blocks:
+                    f.seek(position)
+
+                    for payload, _ in itertools.islice(self._scan(f), count):
+                        yield payload
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+
+        self._sync(self._fsync != "never")
+        self._file.close()
+        self._file = None
+        self._save_index(self._segments[-1])
+
+    def _should_roll(self) -> bool:
+        if self._size == 0:
+            return False
+
+        if self._size >= self._segment_bytes:
+            return True
+
+        return (
+            self._segment_seconds > 0
+            and self._timer() - self._opened_at >= self._segment_seconds
+        )
+
+    def _roll(self) -> None:
+        self.close()
+
+        self._segments.append(self._next_offset)
+        self._indexes[self._next_offset] = SegmentIndex(self._index_interval)
+        self._file = open(self._segment_path(self._next_offset), "ab")
+        self._size = 0
+        self._opened_at = self._timer()
+
+        if self._retention_segments:
+            while len(self._segments) > self._retention_segments:
+                base = self._segments.pop(0)
+                self._indexes.pop(base, None)
+                os.remove(self._segment_path(base))
+
+                if os.path.exists(self._index_path(base)):
+                    os.remove(self._index_path(base))
+
+    def _sync(self, force: bool) -> None:
+        now = self._timer()
+
+        if force or (
+            self._fsync == "interval" and now - self._synced_at >= self._fsync_interval
+        ):
+            os.fsync(self._file.fileno())
+            self._synced_at = now
+
+    def _open_tail(self) -> None:
+        if not self._segments:
+            self._segments.append(0)
+
+        base = self._segments[-1]
+        path = self._segment_path(base)
+        records, end = 0, 0
+
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                for _, record_end in self._scan(f):
+                    records += 1
+                    end = record_end
+
+            if end != os.path.getsize(path):
+                with open(path, "rb+") as f:
+                    f.truncate(end)
+
+        self._file = open(path, "ab")
+        self._size = end
+        self._next_offset = base + records
+        self._indexes[base] = self._load_index(base, seal=False)
+
+    def _index(self, payloads: List[bytes], attrs: Optional[List[Attrs]]) -> None:
+        base = self._segments[-1]
+        index = self._indexes.get(base)
+
+        if index is None:
+            return
+
+        if attrs is None:
+            if self._indexer is None:
+                self._indexes[base] = None
+                return
+
+            attrs = [self._indexer(payload) for payload in payloads]
+
+        position = self._size
+
+        for payload, record in zip(payloads, attrs):
+            size = _HEADER.size + len(payload)
+            index.add(position, size, record)
+            position += size
+
+    def _load_index(self, base: int, seal: bool) -> Optional[SegmentIndex]:
+        path = self._segment_path(base)
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        index = SegmentIndex.load(self._index_path(base))
+
+        if index is not None and index.size == size:
+            return index
+
+        if size == 0:
+            return SegmentIndex(self._index_interval)
+
+        if self._indexer is None:
+            return None
+
+        index = SegmentIndex(self._index_interval)
+
+        with open(path, "rb") as f:
+            position = 0
+
+            for payload, end in self._scan(f):
+                index.add(position, end - position, self._indexer(payload))
+                position = end
+
+        if seal:
+            index.save(self._index_path(base))
+
+        return index
+
+    def _save_index(self, base: int) -> None:
+        index = self._indexes.get(base)
+
+        if index is not None:
+            index.save(self._index_path(base))
+        elif os.path.exists(self._index_path(base)):
+            os.remove(self._index_path(base))
+
+    def _list_segments(self) -> List[int]:
+        return list_segments(self.directory)
+
+    def _segment_path(self, base: int) -> str:
+        return segment_path(self.directory, base)
+
+    def _index_path(self, base: int) -> str:
+        return os.path.join(self.directory, f"{base:020d}{_INDEX_SUFFIX}")
+
+    @staticmethod
+    def _scan(f: BinaryIO) -> Iterator[tuple]:
+        position = f.tell()
+
+        while True:
+            header = f.read(_HEADER.size)
+
+            if len(header) < _HEADER.size:
+                return
+
+            length, crc = _HEADER.unpack(header)
+            payload = f.read(length)
+
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                return
+
+            position += _HEADER.size + length
+
+            yield payload, position
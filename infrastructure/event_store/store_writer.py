@@ -0,0 +1,111 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, List, Tuple
+
+from core.events._base import Event
+from infrastructure.telemetry.metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class StoreWriter(threading.Thread):
+    def __init__(
+        self,
+        commit: Callable[[List[Event]], None],
+        capacity: int = 65536,
+        batch_size: int = 512,
+        latency: float = 0.05,
+        metrics: MetricsRegistry = None,
+    ):
+        super().__init__(name="event-store-writer", daemon=True)
+        self.latency = latency
+        self._commit = commit
+        self._capacity = capacity
+        self._batch_size = batch_size
+        self._metrics = metrics or MetricsRegistry()
+        self._metrics.add_collector(self._collect)
+        self._committed = self._metrics.counter("store_committed")
+        self._commit_lag = self._metrics.histogram("store_commit_lag")
+        self._pending: Deque[Tuple[float, Event]] = deque()
+        self._inflight = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def offer(self, events: List[Event]) -> bool:
+        with self._cond:
+            if len(self._pending) + len(events) > self._capacity:
+                return False
+
+            idle = not self._pending
+            now = time.monotonic()
+            self._pending.extend((now, event) for event in events)
+
+            if idle or len(self._pending) >= self._batch_size:
+                self._cond.notify_all()
+
+        return True
+
+    def flush(self, timeout: float = None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._pending and not self._inflight, timeout
+            )
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+        if self.is_alive():
+            self.join()
+
+    def run(self) -> None:
+        while True:
+            batch = self._next_batch()
+
+            if batch is None:
+                return
+
+            try:
+                self._commit([event for _, event in batch])
+                self._committed.inc(len(batch))
+                self._commit_lag.record(time.monotonic() - batch[0][0])
+            except Exception as e:
+                logger.error(f"Failed to commit {len(batch)} events: {e}")
+            finally:
+                with self._cond:
+                    self._inflight = 0
+                    self._cond.notify_all()
+
+    def _next_batch(self):
+        with self._cond:
+            self._cond.wait_for(lambda: self._pending or self._closed)
+
+            if not self._pending:
+                return None
+
+            deadline = self._pending[0][0] + self.latency
+
+            while len(self._pending) < self._batch_size and not self._closed:
+                remaining = deadline - time.monotonic()
+
+                if remaining <= 0:
+                    break
+
+                self._cond.wait(remaining)
+
+            size = min(len(self._pending), self._batch_size)
+            batch = [self._pending.popleft() for _ in range(size)]
+            self._inflight = size
+
+            return batch
+
+    def _collect(self, metrics: MetricsRegistry) -> None:
+        with self._cond:
+            depth = len(self._pending)
+            lag = time.monotonic() - self._pending[0][0] if depth else 0.0
+
+        metrics.gauge("store_queue").set(depth)
+        metrics.gauge("store_lag").set(lag)
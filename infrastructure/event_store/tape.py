@@ -0,0 +1,41 @@
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from core.events.market import NewMarketDataReceived
+from core.groups.event import EventGroup
+
+if TYPE_CHECKING:
+    from core.models.datasource_type import DataSourceType
+    from core.models.symbol import Symbol
+    from core.models.timeframe import Timeframe
+
+    from .event_store import EventStore
+
+
+def bar_bounds(
+    store: "EventStore",
+    symbol: "Symbol",
+    timeframe: "Timeframe",
+    datasource: "DataSourceType",
+    start: Optional[int] = None,
+) -> Optional[Tuple[int, int]]:
+    timeframe, datasource = str(timeframe), str(datasource)
+    first = last = None
+
+    for record in store.query(
+        str(EventGroup.market), [NewMarketDataReceived], [symbol]
+    ):
+        if record["timeframe"] != timeframe or record["datasource"] != datasource:
+            continue
+
+        if not record["bar"]["closed"]:
+            continue
+
+        timestamp = int(record["bar"]["ohlcv"]["timestamp"])
+
+        if start is not None and timestamp < start:
+            continue
+
+        first = timestamp if first is None else min(first, timestamp)
+        last = timestamp if last is None else max(last, timestamp)
+
+    return None if first is None else (first, last)
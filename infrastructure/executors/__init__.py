@@ -0,0 +1,3 @@
+from .executor_service import ExecutorService
+
+__all__ = [ExecutorService]
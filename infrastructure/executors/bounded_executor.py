@@ -0,0 +1,60 @@
+import asyncio
+import time
+from concurrent.futures import Executor
+from typing import Any, Callable
+
+from infrastructure.telemetry.metrics import MetricsRegistry
+
+
+class BoundedExecutor:
+    def __init__(
+        self,
+        executor: Executor,
+        max_workers: int,
+        metrics: MetricsRegistry = None,
+        name: str = "default",
+    ):
+        self._executor = executor
+        self._slots = asyncio.Semaphore(max_workers)
+        self._metrics = metrics or MetricsRegistry()
+        self._metrics.add_collector(self._collect)
+        self._exec = self._metrics.histogram("executor_exec", executor=name)
+        self._name = name
+        self._queued = 0
+        self._running = 0
+
+    async def run(self, fn: Callable[[], Any]) -> Any:
+        self._queued += 1
+
+        try:
+            await self._slots.acquire()
+        finally:
+            self._queued -= 1
+
+        self._running += 1
+        start_time = time.monotonic()
+        loop = asyncio.get_running_loop()
+
+        try:
+            future = self._executor.submit(fn)
+        except BaseException:
+            self._release(start_time)
+            raise
+
+        future.add_done_callback(
+            lambda _: loop.call_soon_threadsafe(self._release, start_time)
+        )
+
+        return await asyncio.wrap_future(future)
+
+    def _release(self, start_time: float) -> None:
+        self._running -= 1
+        self._slots.release()
+        self._exec.record(time.monotonic() - start_time)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _collect(self, metrics: MetricsRegistry) -> None:
+        metrics.gauge("executor_queue", executor=self._name).set(self._queued)
+        metrics.gauge("executor_running", executor=self._name).set(self._running)
@@ -0,0 +1,63 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict
+
+from core.interfaces.abstract_config import AbstractConfig
+from core.models.execution_class import ExecutionClass
+from infrastructure.event_store.event_store import SingletonMeta
+from infrastructure.telemetry.metrics import MetricsRegistry
+
+from .bounded_executor import BoundedExecutor
+
+
+class ExecutorService(metaclass=SingletonMeta):
+    def __init__(
+        self,
+        config_service: AbstractConfig = None,
+        metrics: MetricsRegistry = None,
+    ):
+        config = (config_service.get("executors") if config_service else None) or {}
+
+        self.metrics = metrics or MetricsRegistry()
+        self.default = ExecutionClass[config.get("default", "io").upper()]
+
+        io_workers = config.get("io_workers", 0) or min(32, (os.cpu_count() or 1) + 4)
+        cpu_workers = config.get("cpu_workers", 0) or os.cpu_count() or 1
+        cpu_pool = (
+            ProcessPoolExecutor(cpu_workers)
+            if config.get("cpu_pool", "thread") == "process"
+            else ThreadPoolExecutor(cpu_workers, thread_name_prefix="cpu")
+        )
+
+        self._executors: Dict[ExecutionClass, BoundedExecutor] = {
+            ExecutionClass.IO: BoundedExecutor(
+                ThreadPoolExecutor(io_workers, thread_name_prefix="io"),
+                io_workers,
+                self.metrics,
+                "io",
+            ),
+            ExecutionClass.CPU: BoundedExecutor(
+                cpu_pool, cpu_workers, self.metrics, "cpu"
+            ),
+        }
+
+    def classify(self, handler: Callable) -> ExecutionClass:
+        if isinstance(handler, partial):
+            handler = handler.func
+
+        return getattr(handler, "_execution_class_", self.default)
+
+    async def run(self, handler: Callable, *args, **kwargs) -> Any:
+        execution_class = self.classify(handler)
+
+        if execution_class is ExecutionClass.INLINE:
+            return handler(*args, **kwargs)
+
+        return await self._executors[execution_class].run(
+            partial(handler, *args, **kwargs)
+        )
+
+    def shutdown(self) -> None:
+        for executor in self._executors.values():
+            executor.shutdown()
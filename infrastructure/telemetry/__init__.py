@@ -0,0 +1,4 @@
+from .metrics import MetricsRegistry
+from .reporter import MetricsReporter
+
+__all__ = [MetricsRegistry, MetricsReporter]
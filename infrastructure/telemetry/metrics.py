@@ -0,0 +1,174 @@
+import math
+from typing import Any, Callable, Dict, List, Tuple
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Counter:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        self.value += amount
+
+    def snapshot(self) -> int:
+        return self.value
+
+
+class Gauge:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def snapshot(self) -> float:
+        return self.value
+
+
+class Histogram:
+    __slots__ = (
+        "_sub_bits",
+        "_sub_count",
+        "_half",
+        "_max_value",
+        "counts",
+        "count",
+        "total",
+        "min",
+        "max",
+    )
+
+    def __init__(self, sub_bucket_bits: int = 5, highest_us: int = 1 << 36):
+        self._sub_bits = sub_bucket_bits
+        self._sub_count = 1 << sub_bucket_bits
+        self._half = self._sub_count >> 1
+        self._max_value = highest_us
+        self.counts: List[int] = [0] * (self._index(highest_us) + 1)
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def record(self, seconds: float) -> None:
+        value = min(max(int(seconds * 1e6), 0), self._max_value)
+
+        self.counts[self._index(value)] += 1
+        self.total += value
+
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        self.count += 1
+
+    def percentile(self, q: float) -> float:
+        if self.count == 0:
+            return 0.0
+
+        rank = max(1, math.ceil(q / 100.0 * self.count))
+        seen = 0
+
+        for idx, count in enumerate(self.counts):
+            seen += count
+
+            if seen >= rank:
+                return min(self._upper(idx), self.max) / 1e6
+
+        return self.max / 1e6
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count / 1e6 if self.count else 0.0,
+            "min": self.min / 1e6,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p999": self.percentile(99.9),
+            "max": self.max / 1e6,
+        }
+
+    def _index(self, value: int) -> int:
+        if value < self._sub_count:
+            return value
+
+        shift = value.bit_length() - self._sub_bits
+
+        return (
+            self._sub_count + (shift - 1) * self._half + (value >> shift) - self._half
+        )
+
+    def _upper(self, idx: int) -> int:
+        if idx < self._sub_count:
+            return idx
+
+        shift, offset = divmod(idx - self._sub_count, self._half)
+        shift += 1
+
+        return ((offset + self._half + 1) << shift) - 1
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._counters: Dict[Tuple[str, Labels], Counter] = {}
+        self._gauges: Dict[Tuple[str, Labels], Gauge] = {}
+        self._histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self._collectors: List[Callable[["MetricsRegistry"], None]] = []
+
+    def counter(self, name: str, **labels: str) -> Counter:
+        return self._get(self._counters, Counter, name, labels)
+
+    def gauge(self, name: str, **labels: str) -> Gauge:
+        return self._get(self._gauges, Gauge, name, labels)
+
+    def histogram(self, name: str, **labels: str) -> Histogram:
+        return self._get(self._histograms, Histogram, name, labels)
+
+    def add_collector(self, collector: Callable[["MetricsRegistry"], None]) -> None:
+        self._collectors.append(collector)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        for collector in self._collectors:
+            collector(self)
+
+        return {
+            "counters": self._format(self._counters),
+            "gauges": self._format(self._gauges),
+            "histograms": self._format(self._histograms),
+        }
+
+    @staticmethod
+    def _get(bucket: Dict, factory: Callable, name: str, labels: Dict[str, str]):
+        key = (name, tuple(labels.items()))
+        metric = bucket.get(key)
+
+        if metric is None:
+            metric = bucket[key] = factory()
+
+        return metric
+
+    @staticmethod
+    def _format(bucket: Dict) -> Dict[str, Any]:
+        return {
+            MetricsRegistry._key(name, labels): metric.snapshot()
+            for (name, labels), metric in sorted(bucket.items(), key=lambda x: x[0])
+        }
+
+    @staticmethod
+    def _key(name: str, labels: Labels) -> str:
+        if not labels:
+            return name
+
+        return f"{name}{{{','.join(f'{k}={v}' for k, v in labels)}}}"
@@ -0,0 +1,79 @@
+import asyncio
+import json
+import logging
+import time
+from typing import Optional
+
+from .metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsReporter:
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        interval: float,
+        path: Optional[str] = None,
+        top_n: int = 5,
+    ):
+        self.registry = registry
+        self.interval = interval
+        self.path = path
+        self.top_n = top_n
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        self.report()
+
+    def report(self) -> None:
+        snapshot = self.registry.snapshot()
+
+        if self.path:
+            self._write(snapshot)
+        else:
+            self._log(snapshot)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self.report()
+
+    def _write(self, snapshot) -> None:
+        with open(self.path, "a") as f:
+            f.write(json.dumps({"timestamp": time.time(), **snapshot}) + "\n")
+
+    def _log(self, snapshot) -> None:
+        histograms = snapshot["histograms"]
+
+        for name in ("handler_exec", "queue_wait"):
+            series = sorted(
+                (
+                    (key, value)
+                    for key, value in histograms.items()
+                    if key.startswith(name)
+                ),
+                key=lambda item: item[1]["p99"],
+                reverse=True,
+            )[: self.top_n]
+
+            for key, value in series:
+                logger.info(
+                    f"{key}: count={value['count']}, p50={value['p50'] * 1e3:.3f}ms, "
+                    f"p99={value['p99'] * 1e3:.3f}ms, max={value['max'] * 1e3:.3f}ms"
+                )
+
+        for key, value in snapshot["counters"].items():
+            if key.startswith(("handler_timeouts", "dlq")):
+                logger.info(f"{key}: {value}")
+
+        for key, value in snapshot["gauges"].items():
+            logger.info(f"{key}: {value}")
@@ -5,8 +5,10 @@ import numpy as np
 from coral import DataSourceFactory
 from core.actors import BaseActor
 from core.commands.broker import UpdateSymbolSettings
+from core.event_decorators import execution
 from core.interfaces.abstract_config import AbstractConfig
 from core.mixins import EventHandlerMixin
+from core.models.execution_class import ExecutionClass
 from core.models.protocol_type import ProtocolType
 from core.queries.broker import GetSimilarSymbols, GetSymbols
 
@@ -35,6 +37,7 @@ class OceanActor(BaseActor, EventHandlerMixin):
         self.register_handler(GetSimilarSymbols, self._get_similar_symbols)
         self.register_handler(UpdateSymbolSettings, self._update_symbol_settings)
 
+    @execution(ExecutionClass.IO)
     def _get_symbols(self, event: GetSymbols):
         exchange = self.datasource.create(event.datasource, ProtocolType.REST)
         symbols = exchange.fetch_future_symbols()
@@ -51,6 +54,7 @@ class OceanActor(BaseActor, EventHandlerMixin):
 
         return [symbol for symbol in symbols if symbol.name in similar_symbols]
 
+    @execution(ExecutionClass.IO)
     def _get_similar_symbols(self, event: GetSimilarSymbols):
         exchange = self.datasource.create(event.datasource, ProtocolType.REST)
         symbols = exchange.fetch_future_symbols()
@@ -64,6 +68,7 @@ class OceanActor(BaseActor, EventHandlerMixin):
 
         return [symbol for symbol in symbols if symbol.name in similar_symbols]
 
+    @execution(ExecutionClass.IO)
     def _update_symbol_settings(self, event: UpdateSymbolSettings):
         exchange = self.datasource.create(event.datasource, ProtocolType.REST)
         exchange.update_symbol_settings(
@@ -1,22 +1,31 @@
 import logging
-from typing import Optional, Tuple, Union
+from typing import Dict, Optional, Tuple, Union
 
 from core.actors import BaseActor
 from core.actors.state import InMemory
 from core.commands.account import UpdateAccountSize
 from core.commands.portfolio import PortfolioReset
 from core.events.backtest import BacktestStarted
-from core.events.portfolio import PortfolioPerformanceUpdated
+from core.events.portfolio import (
+    PortfolioPerformanceUpdated,
+    PortfolioRollingPerformanceUpdated,
+)
 from core.events.position import PositionClosed
 from core.events.trade import TradeStarted
 from core.interfaces.abstract_config import AbstractConfig
 from core.mixins import EventHandlerMixin
-from core.models.entity.portfolio import Performance
+from core.models.entity.performance_batch import PerformanceBatch
+from core.models.entity.portfolio import Performance, RollingPerformance
+from core.models.entity.window import RollingWindow
 from core.models.strategy import Strategy
 from core.models.symbol import Symbol
 from core.models.timeframe import Timeframe
 from core.queries.account import GetBalance
-from core.queries.portfolio import GetPortfolioPerformance
+from core.queries.portfolio import (
+    GetPortfolioPerformance,
+    GetPortfolioPerformanceBatch,
+)
+from infrastructure.checkpoint import Checkpointer
 
 PortfolioEvent = Union[
     BacktestStarted,
@@ -25,6 +34,7 @@ PortfolioEvent = Union[
     PortfolioReset,
     PositionClosed,
     GetPortfolioPerformance,
+    GetPortfolioPerformanceBatch,
 ]
 
 logger = logging.getLogger(__name__)
@@ -39,26 +49,46 @@ class PortfolioActor(BaseActor, EventHandlerMixin):
 
         self.config = config_service.get("portfolio")
         self.state = InMemory[PerfKey, Performance]()
+        self.rolling = InMemory[PerfKey, RollingPerformance]()
+        self.windows: Dict[PerfKey, RollingWindow] = {}
 
         self.state.on_set.connect(self._notify_update)
         self.state.on_set.connect(self._log_update)
+        self.rolling.on_set.connect(self._notify_rolling_update)
+
+    def on_start(self):
+        Checkpointer().register("portfolio", self.state)
+
+    def on_stop(self):
+        Checkpointer().unregister("portfolio", self.state)
 
     async def on_receive(self, event: PortfolioEvent):
         return await self.handle_event(event)
 
     def _register_event_handlers(self):
         self.register_handler(BacktestStarted, self._init_state)
-        self.register_handler(TradeStarted, self._init_state)
+        self.register_handler(TradeStarted, self._start_trade)
         self.register_handler(PortfolioReset, self._reset_state)
         self.register_handler(PositionClosed, self._update_state)
         self.register_handler(GetPortfolioPerformance, self._get_performance)
+        self.register_handler(GetPortfolioPerformanceBatch, self._get_performance_batch)
 
     async def _init_state(self, event: Union[BacktestStarted, TradeStarted]):
         key = self._perf_key(event.symbol, event.timeframe, event.strategy)
         performance = await self._init_performance()
 
+        self.windows.pop(key, None)
+        await self.rolling.delete(key)
         await self.state.set(key, performance)
 
+    async def _start_trade(self, event: TradeStarted):
+        key = self._perf_key(event.symbol, event.timeframe, event.strategy)
+
+        if Checkpointer().restored and await self.state.exists(key):
+            return
+
+        await self._init_state(event)
+
     async def _get_performance(
         self, event: GetPortfolioPerformance
     ) -> Optional[Performance]:
@@ -71,7 +101,26 @@ class PortfolioActor(BaseActor, EventHandlerMixin):
 
         return performance
 
+    async def _get_performance_batch(
+        self, event: GetPortfolioPerformanceBatch
+    ) -> PerformanceBatch:
+        performances = []
+
+        for symbol, timeframe, strategy in event.keys:
+            key = self._perf_key(symbol, timeframe, strategy)
+            performance = await self.state.get(key)
+
+            if not performance:
+                performance = await self._init_performance()
+                await self.state.set(key, performance)
+
+            performances.append(performance)
+
+        return PerformanceBatch.from_performances(performances)
+
     async def _reset_state(self, _event: PortfolioReset):
+        self.windows.clear()
+        await self.rolling.reset()
         await self.state.reset()
 
     async def _update_state(self, event: PositionClosed):
@@ -87,7 +136,11 @@ class PortfolioActor(BaseActor, EventHandlerMixin):
 
         if performance and position.is_valid:
             next_performance = performance.next(position.pnl, position.fee)
+            window = self._window(key, performance)
+            window.push(position.pnl, position.fee, position.close_timestamp / 1000)
+
             await self.state.set(key, next_performance)
+            await self.rolling.set(key, RollingPerformance.from_window(window))
         else:
             logger.warning(f"Invalid position: {position}")
 
@@ -100,8 +153,20 @@ class PortfolioActor(BaseActor, EventHandlerMixin):
             else result.unwrap()
         )
         risk_per_trade = self.config.get("risk_per_trade", 0.0001)
+        autocorr_lags = self.config.get("autocorr_lags", 1)
+
+        return Performance(account_size, risk_per_trade, _autocorr_lags=autocorr_lags)
 
-        return Performance(account_size, risk_per_trade)
+    def _window(self, key: PerfKey, performance: Performance) -> RollingWindow:
+        window = self.windows.get(key)
+
+        if window is None:
+            window = self.windows[key] = performance.rolling_window(
+                self.config.get("rolling_trades", 100),
+                self.config.get("rolling_seconds", 0),
+            )
+
+        return window
 
     async def _notify_update(
         self, key: PerfKey, old_value: Performance, new_value: Performance
@@ -112,6 +177,18 @@ class PortfolioActor(BaseActor, EventHandlerMixin):
             PortfolioPerformanceUpdated(symbol, timeframe, strategy, new_value)
         )
 
+    async def _notify_rolling_update(
+        self,
+        key: PerfKey,
+        old_value: RollingPerformance,
+        new_value: RollingPerformance,
+    ):
+        symbol, timeframe, strategy = key
+
+        await self.tell(
+            PortfolioRollingPerformanceUpdated(symbol, timeframe, strategy, new_value)
+        )
+
     def _log_update(self, key: PerfKey, old_value: Performance, new_value: Performance):
         symbol, timeframe, strategy = key
 
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 import time
-from typing import Union
+from typing import Dict, Union
 
 from core.actors import StrategyActor
 from core.actors.state import InMemory
@@ -23,6 +23,7 @@ from core.events.signal import (
     GoLongSignalReceived,
     GoShortSignalReceived,
 )
+from core.events.trade import TradeResumed
 from core.models.entity.position import Position
 from core.models.entity.signal import Signal
 from core.models.side import PositionSide
@@ -30,14 +31,16 @@ from core.models.symbol import Symbol
 from core.models.timeframe import Timeframe
 from core.queries.portfolio import GetPortfolioPerformance
 
-from ._sm import TRANSITIONS, PositionStateMachine, SMKey
+from ._sm import TRANSITIONS, PositionState, PositionStateMachine, SMKey
 
 SignalEvent = Union[GoLongSignalReceived, GoShortSignalReceived]
 BrokerPositionEvent = Union[BrokerPositionOpened, BrokerPositionClosed]
 ExitSignal = Union[RiskLongThresholdBreached, RiskShortThresholdBreached]
 BacktestSignal = BacktestEnded
 
-PositionEvent = Union[SignalEvent, ExitSignal, BrokerPositionEvent, BacktestSignal]
+PositionEvent = Union[
+    SignalEvent, ExitSignal, BrokerPositionEvent, BacktestSignal, TradeResumed
+]
 
 logger = logging.getLogger(__name__)
 
@@ -54,8 +57,14 @@ class PositionActor(StrategyActor):
         self.sm = PositionStateMachine(self, TRANSITIONS)
         self._state = InMemory[PositionSide, Position]()
 
+    @property
+    def checkpoint_states(self) -> Dict[str, InMemory]:
+        return {"position": self._state, "position_sm": self.sm.state}
+
     async def on_receive(self, event: PositionEvent):
-        if hasattr(event, "position"):
+        if isinstance(event, TradeResumed):
+            await self.handle_trade_resumed(event)
+        elif hasattr(event, "position"):
             await self.sm.process_event(event, event.position.side)
         else:
             await asyncio.gather(
@@ -154,6 +163,25 @@ class PositionActor(StrategyActor):
 
         return False
 
+    async def handle_trade_resumed(self, event: TradeResumed) -> None:
+        for side in PositionSide:
+            key = self._get_key(side)
+            position = await self._state.get(key)
+
+            if position and position.id in event.closed:
+                logger.info(f"Position closed after checkpoint: {position.id}")
+                await self._state.delete(key)
+                await self.sm.state.delete(key)
+
+        for position in event.opened:
+            key = self._get_key(position.side)
+
+            logger.info(f"Position opened after checkpoint: {position.id}")
+
+            await self._state.set(key, position)
+            await self.sm.state.set(key, PositionState.OPENED)
+            await self.tell(PositionOpened(position))
+
     async def handle_backtest(self, _event: BacktestSignal) -> bool:
         await asyncio.gather(
             self._process_backtest_close(PositionSide.LONG),
@@ -89,6 +89,10 @@ class PositionStateMachine:
         self._transitions = transitions
         self._state = InMemory[SMKey, PositionState]()
 
+    @property
+    def state(self) -> InMemory[SMKey, PositionState]:
+        return self._state
+
     async def process_event(self, event: PositionEvent, side: PositionSide):
         key = self._get_key(side)
 
@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import Tuple, Union
+from typing import Dict, Tuple, Union
 
 import numpy as np
 
@@ -21,6 +21,7 @@ from core.events.signal import (
     GoLongSignalReceived,
     GoShortSignalReceived,
 )
+from core.events.trade import TradeResumed
 from core.interfaces.abstract_config import AbstractConfig
 from core.mixins import EventHandlerMixin
 from core.models.entity.portfolio import Performance
@@ -45,6 +46,7 @@ RiskEvent = Union[
     NewMarketDataReceived,
     PositionOpened,
     PositionClosed,
+    TradeResumed,
 ]
 
 MAX_ATTEMPTS = 8
@@ -91,6 +93,10 @@ class RiskActor(StrategyActor, EventHandlerMixin):
         self.anomaly_threshold = DEFAULT_ANOMALY_THRESHOLD
         self.consc_anomaly_counter = 1
 
+    @property
+    def checkpoint_states(self) -> Dict[str, InMemory]:
+        return {"risk": self._state}
+
     async def on_receive(self, event: RiskEvent):
         return await self.handle_event(event)
 
@@ -98,6 +104,7 @@ class RiskActor(StrategyActor, EventHandlerMixin):
         self.register_handler(NewMarketDataReceived, self._handle_risk)
         self.register_handler(PositionOpened, self._handle_opened_position)
         self.register_handler(PositionClosed, self._handle_closed_position)
+        self.register_handler(TradeResumed, self._handle_trade_resumed)
 
     async def _handle_opened_position(self, event: PositionOpened):
         position = event.position
@@ -178,6 +185,13 @@ class RiskActor(StrategyActor, EventHandlerMixin):
     async def _handle_closed_position(self, event: PositionClosed):
         await self._state.delete(event.position.side)
 
+    async def _handle_trade_resumed(self, event: TradeResumed):
+        for side in PositionSide:
+            state = await self._state.get(side)
+
+            if state and state[1].id in event.closed:
+                await self._state.delete(side)
+
     async def _handle_risk(self, _event: NewMarketDataReceived):
         sides = list(PositionSide)
         tasks = [self._process_side(side) for side in sides]
@@ -5,11 +5,12 @@ import numpy as np
 
 from coral import DataSourceFactory
 from core.commands.position import ClosePosition, OpenPosition
-from core.event_decorators import command_handler, query_handler
+from core.event_decorators import command_handler, execution, query_handler
 from core.interfaces.abstract_config import AbstractConfig
 from core.interfaces.abstract_event_manager import AbstractEventManager
 from core.models.datasource_type import DataSourceType
 from core.models.entity.order import Order
+from core.models.execution_class import ExecutionClass
 from core.models.order_type import OrderStatus
 from core.models.protocol_type import ProtocolType
 from core.models.side import PositionSide
@@ -34,10 +35,12 @@ class SmartRouter(AbstractEventManager):
         self.config = config_service.get("position")
 
     @query_handler(GetBalance)
+    @execution(ExecutionClass.IO)
     def get_account_balance(self, query: GetBalance):
         return self.exchange.fetch_account_balance(query.currency)
 
     @query_handler(GetOpenPosition)
+    @execution(ExecutionClass.IO)
     def get_open_position(self, query: GetOpenPosition):
         position = query.position
 
@@ -58,6 +61,7 @@ class SmartRouter(AbstractEventManager):
             )
 
     @query_handler(GetClosePosition)
+    @execution(ExecutionClass.IO)
     def get_close_position(self, query: GetClosePosition):
         position = query.position
         symbol = position.signal.symbol
@@ -82,6 +86,7 @@ class SmartRouter(AbstractEventManager):
         )
 
     @query_handler(HasPosition)
+    @execution(ExecutionClass.IO)
     def has_position(self, query: HasPosition):
         position = query.position
         symbol = position.signal.symbol
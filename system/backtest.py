@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from enum import Enum, auto
-from typing import Tuple
+from typing import Optional, Tuple
 
 from core.commands.factor import EnvolveGeneration, InitGeneration
 from core.commands.portfolio import PortfolioReset
@@ -10,14 +10,17 @@ from core.events.system import DeployStrategy
 from core.interfaces.abstract_system import AbstractSystem
 from core.models.cap import CapType
 from core.models.feed import FeedType
-from core.models.lookback import Lookback
+from core.models.lookback import TIMEFRAMES_TO_LOOKBACK, Lookback
 from core.models.order_type import OrderType
 from core.models.strategy import Strategy
 from core.models.symbol import Symbol
 from core.models.timeframe import Timeframe
 from core.queries.factor import GetGeneration
-from core.tasks.feed import StartHistoricalFeed
+from core.tasks.feed import StartHistoricalFeed, StartReplayFeed
+from infrastructure.checkpoint import Checkpointer
 from infrastructure.estimator import Estimator
+from infrastructure.event_store import EventStore
+from infrastructure.event_store.tape import bar_bounds
 
 from .context import SystemContext
 
@@ -52,11 +55,13 @@ class BacktestSystem(AbstractSystem):
         self.event_queue = asyncio.Queue()
         self.active_strategy = set()
         self.default_cap = CapType.A
+        self.tape_ends = {}
 
     async def start(self):
         transitions = {
             SystemState.INIT: {
                 Event.REGENERATE: SystemState.GENERATE,
+                Event.RANKING_COMPLETE: SystemState.TRADING,
                 Event.SYSTEM_STOP: SystemState.STOPPED,
             },
             SystemState.GENERATE: {
@@ -84,7 +89,11 @@ class BacktestSystem(AbstractSystem):
             },
         }
 
-        await self.event_queue.put(Event.REGENERATE)
+        if Checkpointer().restored:
+            logger.info("Resume trading from checkpoint")
+            await self.event_queue.put(Event.RANKING_COMPLETE)
+        else:
+            await self.event_queue.put(Event.REGENERATE)
 
         while True:
             event = await self.event_queue.get()
@@ -221,6 +230,9 @@ class BacktestSystem(AbstractSystem):
 
         await self.dispatch(BacktestStarted(symbol, timeframe, strategy))
 
+        config = self.context.config_service.get("backtest")
+        replay = config.get("feed", "historical") == "replay"
+
         actors = [
             self.context.signal_factory.create_actor(symbol, timeframe, strategy),
             self.context.position_factory.create_actor(symbol, timeframe),
@@ -229,7 +241,7 @@ class BacktestSystem(AbstractSystem):
                 OrderType.PAPER, symbol, timeframe
             ),
             self.context.feed_factory.create_actor(
-                FeedType.HISTORICAL,
+                FeedType.REPLAY if replay else FeedType.HISTORICAL,
                 symbol,
                 timeframe,
                 self.context.datasource,
@@ -237,7 +249,7 @@ class BacktestSystem(AbstractSystem):
         ]
 
         max_gen = self.context.config_service.get("factor").get("max_generations", 5)
-        window_size = self.context.config_service.get("backtest").get("window_size", 1)
+        window_size = config.get("window_size", 1)
 
         verify_sample = 2
         in_sample = window_size
@@ -250,14 +262,82 @@ class BacktestSystem(AbstractSystem):
             f"Backtest: gen={generation + 1}, strategy={symbol}_{timeframe}{strategy}, in_lookback={in_lookback}, out_lookback={out_lookback}"
         )
 
-        await self.run(
-            StartHistoricalFeed(
-                symbol, timeframe, self.context.datasource, in_lookback, out_lookback
+        if replay:
+            start, end = await self._replay_window(
+                symbol,
+                timeframe,
+                Lookback.from_raw(verify_sample),
+                None if verify else (in_lookback, out_lookback),
+            )
+
+            logger.info(f"Replay window: start={start}, end={end}")
+
+            await self.run(
+                StartReplayFeed(
+                    symbol,
+                    timeframe,
+                    self.context.datasource,
+                    start,
+                    end,
+                    config.get("replay_speed", 0),
+                )
+            )
+        else:
+            await self.run(
+                StartHistoricalFeed(
+                    symbol,
+                    timeframe,
+                    self.context.datasource,
+                    in_lookback,
+                    out_lookback,
+                )
             )
-        )
 
         await self.dispatch(BacktestEnded(symbol, timeframe, strategy))
         await self.wait()
 
         for actor in actors:
             actor.stop()
+
+    async def _replay_window(
+        self,
+        symbol: Symbol,
+        timeframe: Timeframe,
+        verify_lookback: Lookback,
+        train_lookback: Optional[Tuple[Lookback, Lookback]],
+    ) -> Tuple[Optional[int], Optional[int]]:
+        config = self.context.config_service.get("backtest")
+        start = config.get("replay_start", 0) or None
+        end = config.get("replay_end", 0) or await self._tape_end(symbol, timeframe)
+
+        if end is None:
+            return start, end
+
+        step = timeframe.to_milliseconds()
+        verify_ms = TIMEFRAMES_TO_LOOKBACK[(verify_lookback, timeframe)] * step
+
+        if train_lookback is None:
+            window_start = end - verify_ms
+        else:
+            window_start = end - step * sum(
+                TIMEFRAMES_TO_LOOKBACK[(lookback, timeframe)]
+                for lookback in train_lookback
+            )
+            end -= verify_ms
+
+        return max(window_start, start or 0), end
+
+    async def _tape_end(self, symbol: Symbol, timeframe: Timeframe) -> Optional[int]:
+        key = (symbol, timeframe)
+
+        if key not in self.tape_ends:
+            bounds = await asyncio.to_thread(
+                bar_bounds,
+                EventStore(self.context.config_service),
+                symbol,
+                timeframe,
+                self.context.datasource,
+            )
+            self.tape_ends[key] = bounds[1] if bounds else None
+
+        return self.tape_ends[key]
@@ -1,12 +1,22 @@
 import asyncio
 import logging
+import time
 from collections import defaultdict
 from enum import Enum, auto
 
+import orjson
+
 from core.commands.broker import UpdateSymbolSettings
 from core.event_decorators import event_handler
+from core.events.position import (
+    BrokerPositionClosed,
+    BrokerPositionOpened,
+    PositionClosed,
+    PositionInitialized,
+)
 from core.events.system import DeployStrategy
-from core.events.trade import TradeStarted
+from core.events.trade import TradeResumed, TradeStarted
+from core.groups.event import EventGroup
 from core.interfaces.abstract_config import AbstractConfig
 from core.interfaces.abstract_executor_actor_factory import AbstractExecutorActorFactory
 from core.interfaces.abstract_feed_actor_factory import AbstractFeedActorFactory
@@ -16,13 +26,25 @@ from core.interfaces.abstract_signal_actor_factory import AbstractSignalActorFac
 from core.interfaces.abstract_system import AbstractSystem
 from core.models.broker import MarginMode, PositionMode
 from core.models.datasource_type import DataSourceType
+from core.models.entity.order import Order
 from core.models.feed import FeedType
 from core.models.lookback import Lookback
-from core.models.order_type import OrderType
-from core.tasks.feed import StartHistoricalFeed, StartRealtimeFeed
+from core.models.order_type import OrderStatus, OrderType
+from core.queries.position import GetOpenPosition
+from core.tasks.feed import StartHistoricalFeed, StartRealtimeFeed, StartReplayFeed
+from infrastructure.checkpoint import Checkpointer
+from infrastructure.event_store import EventStore
+from infrastructure.event_store.event_decoder import decode_position
+from infrastructure.event_store.event_encoder import encode
+from infrastructure.event_store.tape import bar_bounds
 
 logger = logging.getLogger(__name__)
 
+PREFETCH_MS = 30 * 24 * 60 * 60 * 1000
+OPEN_EVENTS = [PositionInitialized, BrokerPositionOpened]
+CLOSE_EVENTS = [PositionClosed, BrokerPositionClosed]
+TAIL_EVENTS = [*OPEN_EVENTS, *CLOSE_EVENTS]
+
 
 class SystemState(Enum):
     IDLE = auto()
@@ -60,6 +82,8 @@ class TradingSystem(AbstractSystem):
         self.executor_factory = executor_factory
         self.feed_factory = feed_factory
         self.datasource = datasource
+        self.store = EventStore(config_service)
+        self.resumed = set()
 
     @event_handler(DeployStrategy)
     async def _deploy_strategy(self, event: DeployStrategy):
@@ -123,17 +147,7 @@ class TradingSystem(AbstractSystem):
 
                 logger.info(f"Prefetch data: {symbol}_{timeframe}{strategy}")
 
-                feed_actor = self.feed_factory.create_actor(
-                    FeedType.HISTORICAL, symbol, timeframe, self.datasource
-                )
-
-                await self.run(
-                    StartHistoricalFeed(
-                        symbol, timeframe, self.datasource, Lookback.ONE_MONTH, None
-                    )
-                )
-
-                feed_actor.stop()
+                await self._prefetch(symbol, timeframe)
 
                 await self.wait()
 
@@ -150,10 +164,27 @@ class TradingSystem(AbstractSystem):
                 )
             )
 
+            risk_actor = self.risk_factory.create_actor(symbol, timeframe)
+            position_actor = self.position_factory.create_actor(symbol, timeframe)
+
+            self._checkpoint(symbol, timeframe, risk_actor, position_actor)
+
+            if not await self._resume(symbol, timeframe):
+                logger.error(f"Refuse to resume {symbol}_{timeframe}")
+
+                for actor in (
+                    *signal_actors[(symbol, timeframe)],
+                    risk_actor,
+                    position_actor,
+                ):
+                    actor.stop()
+
+                continue
+
             actors = (
                 *signal_actors[(symbol, timeframe)],
-                self.risk_factory.create_actor(symbol, timeframe),
-                self.position_factory.create_actor(symbol, timeframe),
+                risk_actor,
+                position_actor,
                 self.executor_factory.create_actor(
                     OrderType.MARKET if self.config["mode"] == 1 else OrderType.PAPER,
                     symbol,
@@ -168,6 +199,150 @@ class TradingSystem(AbstractSystem):
 
         await self.event_queue.put(Event.TRADING)
 
+    def _checkpoint(self, symbol, timeframe, *actors):
+        checkpointer = Checkpointer()
+
+        for actor in actors:
+            for name, state in actor.checkpoint_states.items():
+                checkpointer.register(
+                    f"{name}:{symbol}_{timeframe}_{self.datasource}", state
+                )
+
+    async def _resume(self, symbol, timeframe):
+        checkpointer = Checkpointer()
+
+        if not checkpointer.restored or (symbol, timeframe) in self.resumed:
+            return True
+
+        records = await asyncio.to_thread(
+            lambda: list(
+                self.store.query(
+                    str(EventGroup.position),
+                    TAIL_EVENTS,
+                    [symbol],
+                    start=checkpointer.created_at,
+                )
+            )
+        )
+
+        closing = {event.__name__ for event in CLOSE_EVENTS}
+        latest, closed = {}, set()
+
+        for record in records:
+            position = record["position"]
+
+            if (position.get("signal") or {}).get("timeframe") != str(timeframe):
+                continue
+
+            if record["meta"]["name"] in closing:
+                closed.add(position["id"])
+            else:
+                latest[position["id"]] = position
+
+        strategies = [
+            (orjson.loads(encode(strategy)), strategy)
+            for _, _, strategy in self.next_strategy[(symbol, timeframe)]
+        ]
+        opened = []
+
+        for position_id, data in latest.items():
+            if position_id in closed:
+                continue
+
+            strategy = next(
+                (
+                    deployed
+                    for encoded, deployed in strategies
+                    if encoded == data["signal"]["strategy"]
+                ),
+                None,
+            )
+
+            if strategy is None:
+                logger.error(f"Position {position_id} has no deployed strategy")
+                return False
+
+            position = decode_position(data, symbol, timeframe, strategy)
+
+            if not position.open_orders:
+                position = await self._reconcile(position)
+
+                if position is None:
+                    return False
+
+            if not position.closed:
+                opened.append(position)
+
+        self.resumed.add((symbol, timeframe))
+
+        logger.info(
+            f"Replay {len(records)} position events since checkpoint: {symbol}_{timeframe}"
+        )
+
+        await self.dispatch(
+            TradeResumed(symbol, timeframe, tuple(opened), tuple(closed))
+        )
+        await self.wait()
+
+        return True
+
+    async def _reconcile(self, position):
+        if self.config["mode"] != 1:
+            return position.fill_order(
+                Order(status=OrderStatus.FAILED, type=OrderType.PAPER, price=0, size=0)
+            )
+
+        result = await self.query(GetOpenPosition(position))
+
+        if result.is_err():
+            logger.error(f"Failed to reconcile position {position.id}: {result}")
+            return None
+
+        return position.fill_order(result.unwrap())
+
+    async def _prefetch(self, symbol, timeframe):
+        since = (
+            await self._replay(symbol, timeframe) if Checkpointer().restored else None
+        )
+
+        feed_actor = self.feed_factory.create_actor(
+            FeedType.HISTORICAL, symbol, timeframe, self.datasource
+        )
+
+        await self.run(
+            StartHistoricalFeed(
+                symbol, timeframe, self.datasource, Lookback.ONE_MONTH, None, since
+            )
+        )
+
+        feed_actor.stop()
+
+    async def _replay(self, symbol, timeframe):
+        start = int(time.time() * 1000) - PREFETCH_MS
+        step = timeframe.to_milliseconds()
+
+        bounds = await asyncio.to_thread(
+            bar_bounds, self.store, symbol, timeframe, self.datasource, start
+        )
+
+        if bounds is None or bounds[0] - start > step:
+            logger.info(
+                f"Tape does not cover the prefetch window: {symbol}_{timeframe}"
+            )
+            return None
+
+        feed_actor = self.feed_factory.create_actor(
+            FeedType.REPLAY, symbol, timeframe, self.datasource
+        )
+
+        await self.run(
+            StartReplayFeed(symbol, timeframe, self.datasource, start, bounds[1])
+        )
+
+        feed_actor.stop()
+
+        return bounds[1] + step
+
     async def _run_trading(self):
         logger.info("Start trading")
 
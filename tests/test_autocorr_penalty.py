@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from core.models.entity.portfolio import Performance
+
+TOLERANCE = 1e-9
+CASES = 200
+SEEDS = range(5)
+
+
+def list_formula(coef: float, num: int) -> float:
+    corr = [((num - x) / num) * coef**x for x in range(1, num)]
+
+    return np.sqrt(1 + 2 * np.sum(corr))
+
+
+def random_cases(seed: int, max_trades: int = 5_000) -> tuple:
+    rng = np.random.default_rng(seed)
+    num = np.exp(rng.uniform(np.log(3), np.log(max_trades), CASES)).astype(int)
+    coef = np.where(
+        rng.random(CASES) < 0.5,
+        rng.random(CASES),
+        1.0 - 10.0 ** -rng.uniform(0, 15, CASES),
+    )
+
+    return coef, num
+
+
+def assert_close(actual, expected):
+    actual = np.asarray(actual)
+    expected = np.asarray(expected)
+    error = np.abs(actual - expected) / np.maximum(1.0, np.abs(expected))
+
+    assert np.all(error <= TOLERANCE), float(error.max())
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_closed_form_matches_list_formula(seed):
+    coef, num = random_cases(seed)
+
+    for c, n in zip(coef, num, strict=True):
+        assert_close(Performance._autocorr_penalty(c, n), list_formula(c, n))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_vectorized_matches_scalar(seed):
+    coef, num = random_cases(seed)
+    scalar = [
+        Performance._autocorr_penalty(c, n) for c, n in zip(coef, num, strict=True)
+    ]
+
+    assert_close(Performance._autocorr_penalty(coef, num), scalar)
+
+
+@pytest.mark.parametrize("gap", [0.0, 1e-15, 1e-12, 1e-9, 1e-6, 1e-3, 0.5, 1.0])
+@pytest.mark.parametrize("num", [3, 4, 17, 1_000])
+def test_closed_form_near_unit_coefficient(gap, num):
+    coef = 1.0 - gap
+
+    assert_close(Performance._autocorr_penalty(coef, num), list_formula(coef, num))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_lagged_penalty_with_geometric_lags(seed):
+    coef, num = random_cases(seed, max_trades=500)
+    lags = np.arange(1, int(num.max()), dtype=np.float64)
+    coefs = np.where(lags < num[:, None], coef[:, None] ** lags, 0.0)
+    expected = [list_formula(c, n) for c, n in zip(coef, num, strict=True)]
+
+    assert_close(Performance._lagged_penalty(coefs, num), expected)
+
+
+def test_penalty_is_neutral_below_trade_threshold():
+    assert Performance._autocorr_penalty(0.9, 2) == 1.0
+    assert Performance._lagged_penalty([0.9, 0.8], 2) == 1.0
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from core.models.entity._stats import StreamingStats
+
+SEEDS = range(5)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_sorted_matches_full_sort(seed):
+    rng = np.random.default_rng(seed)
+    stats = StreamingStats(1000.0)
+
+    for value in rng.normal(0.0, 3.0, 300):
+        stats = stats.push(value, 0.0)
+
+        if rng.random() < 0.2:
+            np.testing.assert_array_equal(stats.sorted, np.sort(stats.pnl))
+
+    np.testing.assert_array_equal(stats.sorted, np.sort(stats.pnl))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_sorted_snapshots_share_buffer(seed):
+    rng = np.random.default_rng(seed)
+    snapshots = [StreamingStats(1000.0)]
+
+    for value in rng.normal(0.0, 3.0, 100):
+        snapshots.append(snapshots[-1].push(value, 0.0))
+
+    branch = snapshots[50].push(100.0, 0.0)
+
+    for stats in (*rng.choice(snapshots, 20), snapshots[-1], branch):
+        np.testing.assert_array_equal(stats.sorted, np.sort(stats.pnl))